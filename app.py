@@ -9,6 +9,7 @@ Flask 애플리케이션 메인 파일
 - utils/ : 데이터베이스 및 인프라
 """
 from flask import Flask, send_from_directory, session
+import os
 import logging
 
 from config import config
@@ -17,6 +18,8 @@ from utils.firebase_auth import initialize_firebase
 from utils.user_manager import is_admin
 from utils.db_manager import DatabaseManager
 from utils.vector_db_manager import vdb_manager
+from services.job_service import job_service
+from services.live_service import live_service
 
 # ==================== 로깅 설정 ====================
 logging.basicConfig(
@@ -54,6 +57,13 @@ vdb_manager.db_manager = db
 logger.info("✅ 데이터베이스 매니저 초기화 완료")
 
 
+# ==================== 백그라운드 작업 워커 시작 ====================
+# 디버그 리로더 사용 시 감시용 부모 프로세스에서는 워커를 띄우지 않음 (작업 중복 실행 방지)
+if not config.DEBUG or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+    live_service.sweep_orphaned_sessions()
+    job_service.start()
+
+
 # ==================== Context Processor ====================
 @app.context_processor
 def inject_user_info():
@@ -0,0 +1,145 @@
+"""
+STT 입력 오디오 포맷 벤치마크
+샘플 녹음을 wav(PCM) / flac / opus로 변환하여 전송 바이트 수와 Gemini STT 지연 시간을 비교합니다.
+
+사용법:
+    python benchmark_stt_formats.py 샘플1.mp4 샘플2.m4a            # 변환 크기/시간만 비교
+    python benchmark_stt_formats.py --stt 샘플1.mp4                 # Gemini STT 지연 시간까지 측정
+    python benchmark_stt_formats.py --stt --formats flac,opus 샘플1.mp4
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+from config import config
+from utils.ffmpeg_utils import run_ffmpeg, probe_duration, stt_audio_args, stt_audio_extension, STT_AUDIO_EXTENSIONS
+from utils.stt import STTManager
+from utils.llm_gateway import llm_gateway
+
+
+def convert_sample(source_path: str, audio_format: str, work_dir: str) -> dict:
+    """
+    샘플을 STT 입력 포맷으로 변환
+
+    Args:
+        source_path: 원본 녹음 파일 경로
+        audio_format: wav | flac | opus
+        work_dir: 변환 파일을 저장할 폴더
+
+    Returns:
+        변환 결과 딕셔너리 (success, path, bytes, encode_seconds 또는 error 포함)
+    """
+    base_name = os.path.splitext(os.path.basename(source_path))[0]
+    output_path = os.path.join(work_dir, f"{base_name}_{audio_format}{stt_audio_extension(audio_format)}")
+    command = ['ffmpeg', '-y', '-i', source_path] + stt_audio_args(output_path) + [output_path]
+
+    started_at = time.monotonic()
+    result = run_ffmpeg(command)
+    encode_seconds = time.monotonic() - started_at
+
+    if result.returncode != 0 or not os.path.exists(output_path):
+        return {"success": False, "error": result.stderr[-300:]}
+
+    return {
+        "success": True,
+        "path": output_path,
+        "bytes": os.path.getsize(output_path),
+        "encode_seconds": encode_seconds
+    }
+
+
+def measure_stt(client, audio_path: str) -> dict:
+    """
+    변환된 오디오로 Gemini STT 1회 호출
+
+    Args:
+        client: google.genai.Client
+        audio_path: STT 입력 오디오 경로
+
+    Returns:
+        측정 결과 딕셔너리 (success, stt_seconds, segments 또는 error 포함)
+    """
+    started_at = time.monotonic()
+    try:
+        segments, _ = STTManager()._transcribe_file(client, audio_path)
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+    return {
+        "success": True,
+        "stt_seconds": time.monotonic() - started_at,
+        "segments": len(segments)
+    }
+
+
+def main():
+    """
+    메인 벤치마크 함수
+    """
+    parser = argparse.ArgumentParser(description="STT 입력 오디오 포맷 벤치마크")
+    parser.add_argument("samples", nargs="+", help="샘플 녹음 파일 경로")
+    parser.add_argument("--formats", default=",".join(STT_AUDIO_EXTENSIONS),
+                        help="비교할 포맷 (쉼표 구분, 기본: wav,flac,opus)")
+    parser.add_argument("--stt", action="store_true", help="Gemini STT 지연 시간까지 측정 (API 호출 비용 발생)")
+    args = parser.parse_args()
+
+    formats = [f.strip() for f in args.formats.split(",") if f.strip() in STT_AUDIO_EXTENSIONS]
+    client = llm_gateway.gemini_client() if args.stt else None
+
+    print("=" * 80)
+    print(f"🎧 STT 입력 포맷 벤치마크 (포맷: {', '.join(formats)}, STT 측정: {'예' if args.stt else '아니오'})")
+    print("=" * 80)
+
+    work_dir = tempfile.mkdtemp(prefix="stt_format_bench_")
+    try:
+        for sample_path in args.samples:
+            if not os.path.exists(sample_path):
+                print(f"❌ 파일을 찾을 수 없습니다: {sample_path}")
+                continue
+
+            duration = probe_duration(sample_path)
+            print(f"\n📄 {os.path.basename(sample_path)} (길이 {duration:.0f}초)")
+            print("-" * 80)
+            print(f"{'포맷':<6} {'크기(MB)':>10} {'MB/시간':>10} {'WAV 대비':>9} {'변환(초)':>9} {'STT(초)':>9} {'세그먼트':>8}")
+
+            wav_bytes = None
+            for audio_format in formats:
+                converted = convert_sample(sample_path, audio_format, work_dir)
+                if not converted["success"]:
+                    print(f"{audio_format:<6} ❌ 변환 실패: {converted['error']}")
+                    continue
+
+                if audio_format == "wav":
+                    wav_bytes = converted["bytes"]
+
+                size_mb = converted["bytes"] / 1024 / 1024
+                mb_per_hour = size_mb * 3600 / duration if duration > 0 else 0.0
+                ratio = f"{converted['bytes'] / wav_bytes * 100:.0f}%" if wav_bytes else "-"
+
+                stt_seconds, segment_count = "-", "-"
+                if client:
+                    stt_result = measure_stt(client, converted["path"])
+                    if stt_result["success"]:
+                        stt_seconds = f"{stt_result['stt_seconds']:.1f}"
+                        segment_count = str(stt_result["segments"])
+                    else:
+                        stt_seconds = "실패"
+                        print(f"   ⚠️ {audio_format} STT 실패: {stt_result['error']}")
+
+                print(f"{audio_format:<6} {size_mb:>10.2f} {mb_per_hour:>10.1f} {ratio:>9} "
+                      f"{converted['encode_seconds']:>9.1f} {stt_seconds:>9} {segment_count:>8}")
+
+                os.remove(converted["path"])
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print("\n" + "=" * 80)
+    print(f"✅ 벤치마크 완료 (현재 설정 STT_AUDIO_FORMAT={config.STT_AUDIO_FORMAT})")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
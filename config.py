@@ -49,18 +49,154 @@ class Config:
     ALLOWED_EXTENSIONS: Set[str] = {"wav", "mp3", "m4a", "flac", "mp4", "webm"}
     MAX_FILE_SIZE_MB: int = 500
     UPLOAD_TIMEOUT_SECONDS: int = 1200  # 20분
+    UPLOAD_HASH_CHUNK_BYTES: int = 1024 * 1024  # 업로드 저장 시 해시 계산 단위 (1MB)
+    FFMPEG_MAX_CONCURRENT: int = int(os.getenv('FFMPEG_MAX_CONCURRENT', '2'))  # 동시 실행 ffmpeg 프로세스 수 (초과 시 대기열)
+
+    # ==================== 백그라운드 작업 설정 ====================
+    JOB_WORKER_COUNT: int = int(os.getenv('JOB_WORKER_COUNT', '2'))  # 동시 처리 업로드 작업 수
+    JOB_MAX_ATTEMPTS: int = 2  # 서버 재시작 시 재시도 포함 최대 시도 횟수
+    JOB_STREAM_POLL_SECONDS: float = 1.0  # SSE 구독 시 이벤트 확인 주기
+    JOB_STREAM_KEEPALIVE_SECONDS: int = 15  # 프록시 타임아웃 방지용 keep-alive 주기
+    POST_STT_MAX_WORKERS: int = 4  # STT 후처리(임베딩/요약/마인드맵) 동시 실행 수
+    AGENT_JOB_WORKER_COUNT: int = int(os.getenv('AGENT_JOB_WORKER_COUNT', '1'))  # Action Item 추출 동시 실행 수 (낮은 우선순위)
+    AGENT_JOB_RETRIES: int = 2  # Action Item 추출 실패 시 재시도 횟수
+    AGENT_JOB_RETRY_DELAY_SECONDS: float = 30.0  # 재시도 대기 시간 (시도마다 배수로 증가)
 
     # ==================== STT 설정 ====================
     DEFAULT_TIME_INCREMENT_SECONDS: float = 5.0
+    STT_MODEL: str = "gemini-2.5-pro"  # 긴 녹음용 STT 모델 (MODEL_ROUTES 기본값)
+    STT_AUDIO_FORMAT: str = os.getenv('STT_AUDIO_FORMAT', 'flac').lower()  # STT 입력 오디오 포맷: flac(무손실) | opus | wav
+    STT_OPUS_BITRATE: str = '32k'  # opus 사용 시 비트레이트 (16kHz 모노 음성 기준)
+    STT_INLINE_MAX_BYTES: int = 15 * 1024 * 1024  # 이 크기 이하만 인라인 전송 (요청 한도 20MB, base64 오버헤드 고려), 초과 시 Files API 업로드
+    STT_FILE_ACTIVE_TIMEOUT_SECONDS: int = 300  # Files API 업로드 후 처리 완료 대기 한도
+    STT_FILE_POLL_SECONDS: float = 2.0  # 처리 상태 확인 주기
+    STT_STREAMING_ENABLED: bool = os.getenv('STT_STREAMING_ENABLED', 'True').lower() == 'true'  # 스트리밍 응답으로 세그먼트를 도착 즉시 저장/전송
+    STT_AUDIO_TOKENS_PER_SECOND: int = 32  # Gemini 오디오 입력 토큰 수 (초당), 게이트웨이 tpm 예약량 추정용
+
+    # 긴 녹음 구간 분할(windowed) 병렬 STT
+    STT_WINDOW_ENABLED: bool = os.getenv('STT_WINDOW_ENABLED', 'True').lower() == 'true'
+    STT_WINDOW_THRESHOLD_SECONDS: int = 1200  # 이 길이(20분) 초과 시 구간 분할
+    STT_WINDOW_SECONDS: int = 600  # 구간 길이 (10분)
+    STT_WINDOW_OVERLAP_SECONDS: int = 20  # 인접 구간 중복 길이 (경계 발화 보존 + 화자 매칭용)
+    STT_WINDOW_CONCURRENCY: int = int(os.getenv('STT_WINDOW_CONCURRENCY', '4'))  # 동시 STT 요청 수
+
+    # 잘리거나 깨진 STT 응답 복구
+    STT_SALVAGE_MAX_RETRIES: int = 2  # 살린 세그먼트 뒤 누락 구간 재인식 최대 횟수
+    STT_SALVAGE_MIN_TAIL_SECONDS: float = 3.0  # 누락 구간이 이보다 짧으면 재인식하지 않음
+
+    # 신뢰도 낮은 구간 재인식 (노트 생성 후 백그라운드 작업)
+    STT_REFINE_ENABLED: bool = os.getenv('STT_REFINE_ENABLED', 'True').lower() == 'true'
+    STT_REFINE_CONFIDENCE_THRESHOLD: float = 0.7  # 이 값 미만인 세그먼트를 재인식 대상으로 선정
+    STT_REFINE_MODEL: str = "gemini-2.5-pro"  # 재인식 모델 (짧은 녹음 기본 모델보다 상위 등급, 이 모델로 인식한 녹음은 재인식하지 않음)
+    STT_REFINE_PADDING_SECONDS: float = 3.0  # 재인식 구간 앞뒤로 함께 들려줄 문맥 길이
+    STT_REFINE_MERGE_GAP_SECONDS: float = 10.0  # 이 간격 이내의 약한 세그먼트는 한 구간으로 묶음
+    STT_REFINE_MAX_SPAN_SECONDS: float = 120.0  # 재인식 구간 최대 길이
+    STT_REFINE_MAX_SPANS: int = 10  # 회의당 최대 재인식 구간 수 (신뢰도가 낮은 순)
+    STT_REFINE_CONCURRENCY: int = int(os.getenv('STT_REFINE_CONCURRENCY', '4'))  # 동시 재인식 요청 수
+    STT_REFINE_JOB_WORKER_COUNT: int = 1  # 재인식 작업 동시 실행 수 (낮은 우선순위)
+
+    # 느린 STT 요청 헤징 (과거 응답 시간 백분위를 넘도록 응답이 없으면 대체 모델로 한 번 더 요청, 먼저 끝난 쪽 사용)
+    STT_HEDGE_ENABLED: bool = os.getenv('STT_HEDGE_ENABLED', 'False').lower() == 'true'
+    STT_HEDGE_PERCENTILE: float = float(os.getenv('STT_HEDGE_PERCENTILE', '0.95'))  # 오디오 1초당 응답 시간의 이 백분위를 넘기면 헤징
+    STT_HEDGE_MIN_SAMPLES: int = 20  # 기록이 이보다 적으면 헤징하지 않음 (기본 요청 실패 시 대체 요청은 적용)
+    STT_HEDGE_MIN_DELAY_SECONDS: float = 10.0  # 대체 요청 전 최소 대기 시간 (짧은 조각의 불필요한 중복 요청 방지)
+    STT_HEDGE_HISTORY_SIZE: int = 200  # 모델별로 보관할 최근 응답 시간 수
+    # 기본 모델 → 대체 모델 (목록에 없으면 헤징하지 않음)
+    # flash는 헤징하지 않음: 대체할 pro가 더 느리고 비싸며, 진 쪽 요청도 끝까지 실행되어 비용이 그대로 청구됨
+    STT_HEDGE_ALTERNATE_MODELS: dict = {
+        "gemini-2.5-pro": "gemini-2.5-flash",
+    }
+    STT_HEDGE_MAX_WORKERS: int = 32  # 헤징 요청 실행 스레드 수 (동시 STT 요청 수 x 2 이상)
+
+    # ==================== 실시간 녹음 설정 ====================
+    LIVE_SLICE_SECONDS: int = 30  # 녹음 중 브라우저가 조각(timeslice)을 보내는 주기 = 구간 인식 주기
+    LIVE_OVERLAP_SECONDS: int = 10  # 이전 구간과 겹쳐서 다시 인식하는 길이 (경계 발화 보존 + 화자 매칭용)
+    LIVE_MAX_CHUNK_MB: int = 50  # 조각 하나의 최대 크기
+    LIVE_INGEST_WORKERS: int = int(os.getenv('LIVE_INGEST_WORKERS', '2'))  # 녹음 중 구간 인식 동시 실행 수
+    LIVE_SESSION_IDLE_TIMEOUT_SECONDS: int = 3600  # 이 시간 동안 조각이 오지 않은 세션은 정리
+
+    # ==================== 무음 구간 제거(VAD) 설정 ====================
+    VAD_ENABLED: bool = os.getenv('VAD_ENABLED', 'False').lower() == 'true'  # STT 전 긴 무음 제거
+    VAD_FRAME_MS: int = 30  # 에너지 계산 프레임 길이
+    VAD_MIN_SILENCE_SECONDS: float = 2.0  # 이 길이 이상 이어지는 무음만 제거
+    VAD_PADDING_SECONDS: float = 0.3  # 제거 구간 앞뒤로 남겨두는 여유 (발화 끝/시작 보존)
+    VAD_THRESHOLD_MARGIN_DB: float = 10.0  # 잡음 바닥 대비 음성 판정 여유값
+    VAD_SILENCE_FLOOR_DB: float = -50.0  # 이 값(dBFS) 미만은 항상 무음으로 판정
+    VAD_MIN_SAVED_RATIO: float = 0.05  # 제거량이 이 비율 미만이면 원본 그대로 사용
+
+    # ==================== LLM 게이트웨이 설정 ====================
+    OPENAI_EMBEDDING_MODEL: str = "text-embedding-ada-002"  # 기존 벡터 DB와 호환되도록 유지
+    OPENAI_CHAT_MODEL: str = "gpt-3.5-turbo"  # SelfQueryRetriever 질의 해석용
+    # 모델별 동시 실행 수 / 분당 요청 수(rpm) / 분당 토큰 수(tpm) - 사용 중인 API 등급에 맞게 조정
+    LLM_MODEL_LIMITS: dict = {
+        "gemini-2.5-pro": {"concurrency": 4, "rpm": 150, "tpm": 2_000_000},
+        "gemini-2.5-flash": {"concurrency": 8, "rpm": 1000, "tpm": 1_000_000},
+        "text-embedding-ada-002": {"concurrency": 8, "rpm": 3000, "tpm": 1_000_000},
+        "gpt-3.5-turbo": {"concurrency": 4, "rpm": 3500, "tpm": 200_000},
+    }
+    LLM_DEFAULT_LIMITS: dict = {"concurrency": 4, "rpm": 60, "tpm": 200_000}  # 목록에 없는 모델
+    LLM_MAX_RETRIES: int = int(os.getenv('LLM_MAX_RETRIES', '4'))  # 429/5xx/타임아웃 재시도 횟수
+    LLM_RETRY_BASE_SECONDS: float = 1.0  # 재시도 대기 시작값 (시도마다 2배, 지터 적용)
+    LLM_RETRY_MAX_SECONDS: float = 30.0  # 재시도 대기 상한
+    LLM_CACHE_ENABLED: bool = os.getenv('LLM_CACHE_ENABLED', 'True').lower() == 'true'  # 요약/회의록/마인드맵 응답 캐시
+    LLM_CACHE_MAX_BYTES: int = 200 * 1024 * 1024  # 응답 캐시 전체 크기 한도 (초과 시 오래 사용하지 않은 항목부터 삭제)
+
+    # ==================== 임베딩 설정 ====================
+    EMBEDDING_CACHE_ENABLED: bool = os.getenv('EMBEDDING_CACHE_ENABLED', 'True').lower() == 'true'  # (모델, 텍스트 해시)별 벡터 재사용
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 50_000  # 캐시 항목 수 한도 (ada-002 기준 항목당 약 6KB, 초과 시 오래 사용하지 않은 항목부터 삭제)
+    EMBEDDING_BATCH_SIZE: int = 128  # 임베딩 요청 1건당 최대 텍스트 수
+    EMBEDDING_BATCH_MAX_TOKENS: int = 60_000  # 임베딩 요청 1건당 최대 추정 토큰 수
+    EMBEDDING_CONCURRENCY: int = int(os.getenv('EMBEDDING_CONCURRENCY', '4'))  # 동시 임베딩 요청 수
+
+    # ==================== 모델 라우팅 설정 ====================
+    # 작업별 규칙을 위에서부터 검사하여 처음 맞는 모델 사용
+    # max_tokens: 추정 입력 토큰 상한, max_audio_seconds: 오디오 길이 상한 (값을 모르면 해당 규칙은 건너뜀)
+    MODEL_ROUTES: dict = {
+        "stt": [
+            {"max_audio_seconds": 600, "model": "gemini-2.5-flash"},  # 10분 이하 짧은 회의
+            {"model": STT_MODEL},
+        ],
+        "summary": [
+            {"max_tokens": 4000, "model": "gemini-2.5-flash"},
+            {"model": "gemini-2.5-pro"},
+        ],
+        "minutes": [
+            {"max_tokens": 4000, "model": "gemini-2.5-flash"},
+            {"model": "gemini-2.5-pro"},
+        ],
+        "mindmap": [{"model": "gemini-2.5-flash"}],  # 이미 만든 요약에서 키워드만 추출
+        "chat": [{"model": "gemini-2.5-flash"}],
+        "agent": [{"model": "gemini-2.5-flash"}],
+    }
+    MODEL_DEFAULT: str = "gemini-2.5-pro"  # 규칙이 없는 작업
+    # 모델별 가격 (USD / 100만 토큰) - 경로별 비용 집계용
+    # audio_input: 오디오 입력 가격 (stt 작업의 입력에 적용, 없으면 input 사용)
+    MODEL_PRICING: dict = {
+        "gemini-2.5-pro": {"input": 1.25, "audio_input": 1.25, "output": 10.0},
+        "gemini-2.5-flash": {"input": 0.30, "audio_input": 1.00, "output": 2.50},
+    }
 
     # ==================== 청킹(Chunking) 설정 ====================
     CHUNK_SIZE: int = 1000  # 텍스트 청크 최대 크기
     CHUNK_OVERLAP: int = 200  # 청크 중복 크기
     TIME_GAP_THRESHOLD_SECONDS: int = 60  # 화자 변경 인식 기준 (초)
 
+    # ==================== 요약 설정 ====================
+    SUMMARY_MAP_REDUCE_THRESHOLD_TOKENS: int = 16000  # 스크립트(추정 토큰)가 이보다 길면 구간별 병렬 요약 후 병합
+    SUMMARY_WINDOW_TOKENS: int = 6000  # 구간 요약 1회 입력 크기 (추정 토큰)
+    SUMMARY_MAP_CONCURRENCY: int = 4  # 구간 요약 동시 요청 수
+
     # ==================== 검색 설정 ====================
     SEARCH_RESULTS_PER_COLLECTION: int = 3  # 컬렉션당 검색 결과 수
-    SEARCH_MULTIPLIER: int = 10  # 검색 결과 배수
+    CHROMA_IN_FILTER_MAX_IDS: int = 1000  # 접근 가능한 회의 ID를 Chroma $in 필터 하나에 담는 최대 개수 (넘으면 나누어 검색)
+    CHAT_RETRIEVER_TYPE: str = os.getenv('CHAT_RETRIEVER_TYPE', 'similarity')  # 챗봇 검색 방식: similarity | mmr | self_query | hybrid
+    # 하이브리드 검색 (retriever_type="hybrid": 벡터 + 키워드 BM25, Reciprocal Rank Fusion)
+    HYBRID_FETCH_MULTIPLIER: int = 4  # 방식별 후보 수 = k x 이 값
+    HYBRID_MIN_FETCH_K: int = 20  # 방식별 최소 후보 수
+    HYBRID_RRF_K: int = 60  # RRF 순위 보정 상수
+    HYBRID_BM25_K1: float = 1.5  # BM25 빈도 포화 계수
+    HYBRID_BM25_B: float = 0.75  # BM25 문서 길이 정규화 계수
+    HYBRID_MAX_DF_RATIO: float = 0.5  # 이 비율보다 많은 문서에 나오는 키워드는 검색에서 제외 (어미/조사 n-gram)
 
     # ==================== 관리자 설정 ====================
     ADMIN_EMAILS: list = os.getenv('ADMIN_EMAILS', '').split(',') if os.getenv('ADMIN_EMAILS') else []
@@ -15,6 +15,7 @@ from .summary import summary_bp
 from .admin import admin_bp
 from .live_record import live_bp
 from .google_auth import google_auth_bp
+from .jobs import jobs_bp
 
 
 def register_blueprints(app):
@@ -31,4 +32,5 @@ def register_blueprints(app):
     app.register_blueprint(admin_bp)
     app.register_blueprint(live_bp)
     app.register_blueprint(google_auth_bp)
+    app.register_blueprint(jobs_bp)
 
@@ -11,6 +11,10 @@ from utils.db_manager import DatabaseManager
 from utils.vector_db_manager import vdb_manager
 from utils.stt import STTManager
 from utils.decorators import login_required, admin_required
+from utils.ffmpeg_utils import ffmpeg_slots
+from utils.llm_gateway import llm_gateway
+from utils.model_router import model_router
+from utils.hedging import stt_hedger
 
 # Blueprint 생성
 admin_bp = Blueprint('admin', __name__)
@@ -43,7 +47,8 @@ def search():
     Request JSON:
         {
             "query": "검색어",
-            "retriever_type": "similarity|mmr|self_query|contextual_compression"
+            "db_type": "chunks|subtopic",
+            "retriever_type": "similarity|mmr|self_query|hybrid"
         }
 
     Returns:
@@ -53,6 +58,7 @@ def search():
         data = request.get_json()
         query = data.get('query')
         retriever_type = data.get('retriever_type', 'similarity')
+        db_type = data.get('db_type', 'chunks')
 
         if not query:
             return jsonify({
@@ -62,13 +68,14 @@ def search():
 
         # Vector DB 검색
         results = vdb_manager.search(
+            db_type=db_type,
             query=query,
             retriever_type=retriever_type
         )
 
         return jsonify({
             "success": True,
-            "results": results,
+            "results": [{"page_content": doc.page_content, "metadata": doc.metadata} for doc in results],
             "retriever_type": retriever_type
         })
 
@@ -316,7 +323,7 @@ def test_stt_api():
         file.save(temp_path)
 
         # STT 처리
-        segments = stt_manager.transcribe_audio(temp_path)
+        segments, _ = stt_manager.transcribe_audio(temp_path)
 
         # 임시 파일 삭제
         if os.path.exists(temp_path):
@@ -413,3 +420,18 @@ def delete_vector_db_entry():
         import traceback
         traceback.print_exc()
         return jsonify({"success": False, "error": f"벡터 DB 삭제 중 오류 발생: {str(e)}"}), 500
+
+
+@admin_bp.route("/api/metrics")
+@login_required
+@admin_required
+def metrics_api():
+    """처리 파이프라인 지표 조회 (관리자 전용)"""
+    return jsonify({
+        "success": True,
+        "ffmpeg": ffmpeg_slots.get_metrics(),
+        "llm": llm_gateway.get_metrics(),
+        "routes": model_router.get_metrics(),
+        "hedging": stt_hedger.get_metrics(),
+        "embeddings": vdb_manager.embedding_function.get_metrics()
+    })
@@ -9,7 +9,7 @@ from config import config
 from utils.vector_db_manager import vdb_manager
 from utils.chat_manager import ChatManager
 from utils.decorators import login_required
-from utils.user_manager import can_access_meeting, get_user_accessible_meeting_ids
+from utils.user_manager import can_access_meeting, get_user_accessible_meeting_ids, is_admin
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +17,7 @@ logger = logging.getLogger(__name__)
 chat_bp = Blueprint('chat', __name__)
 
 # ChatManager 초기화 (similarity retriever 사용)
-chat_manager = ChatManager(vdb_manager, retriever_type="similarity")
+chat_manager = ChatManager(vdb_manager, retriever_type=config.CHAT_RETRIEVER_TYPE)
 
 
 @chat_bp.route("/api/chat", methods=["POST"])
@@ -59,6 +59,9 @@ def chat():
 
             # 해당 회의에 대해서만 검색
             accessible_meeting_ids = [meeting_id]
+        elif is_admin(user_id):
+            # Admin: 모든 노트에서 검색 (필터 없음)
+            accessible_meeting_ids = None
         else:
             # 전체 노트에서 검색 (사용자가 접근 가능한 노트만)
             accessible_meeting_ids = get_user_accessible_meeting_ids(user_id)
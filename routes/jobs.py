@@ -0,0 +1,121 @@
+"""
+백그라운드 작업 관련 라우트
+작업 상태 조회, 진행 상황 SSE 구독
+"""
+from flask import Blueprint, request, jsonify, session, Response, stream_with_context
+import json
+import logging
+
+from utils.decorators import login_required
+from utils.user_manager import is_admin
+from services.job_service import job_service
+
+logger = logging.getLogger(__name__)
+
+# Blueprint 생성
+jobs_bp = Blueprint('jobs', __name__)
+
+
+def _can_access_job(user_id, job):
+    """작업 요청자 본인 또는 admin만 조회 가능"""
+    return job['owner_id'] == user_id or is_admin(user_id)
+
+
+def job_event_stream(job_id: str, after_event_id: int = 0) -> Response:
+    """
+    작업 진행 이벤트를 SSE로 전달하는 Response 생성
+    작업 실행과 무관하게 구독만 하므로, 연결이 끊겨도 작업은 계속됩니다.
+
+    Args:
+        job_id: 작업 ID
+        after_event_id: 이 ID 이후의 이벤트부터 전달 (재연결 시 Last-Event-ID)
+
+    Returns:
+        Response: text/event-stream 응답
+    """
+    def generate():
+        for item in job_service.iter_events(job_id, after_event_id):
+            if item is None:
+                # 프록시 타임아웃 방지용 주석 라인 (클라이언트는 무시)
+                yield ": keep-alive\n\n"
+                continue
+
+            event_id, data = item
+            yield f"id: {event_id}\ndata: {json.dumps(data)}\n\n"
+
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@jobs_bp.route("/api/jobs/<string:job_id>")
+@login_required
+def get_job_status(job_id):
+    """
+    작업 상태 조회
+
+    Args:
+        job_id: 작업 ID
+
+    Returns:
+        JSON: 작업 상태 및 단계별 기록
+    """
+    user_id = session['user_id']
+
+    status = job_service.get_status(job_id)
+    if not status:
+        return jsonify({
+            "success": False,
+            "error": "작업을 찾을 수 없습니다."
+        }), 404
+
+    if not _can_access_job(user_id, status):
+        return jsonify({
+            "success": False,
+            "error": "접근 권한이 없습니다."
+        }), 403
+
+    return jsonify({
+        "success": True,
+        "job": status
+    })
+
+
+@jobs_bp.route("/api/jobs/<string:job_id>/stream")
+@login_required
+def stream_job(job_id):
+    """
+    작업 진행 상황 SSE 구독 (재연결 지원)
+
+    Args:
+        job_id: 작업 ID
+
+    Query/Header:
+        Last-Event-ID 또는 ?after=<event_id>: 이 이벤트 이후부터 수신
+
+    Returns:
+        SSE Stream: 진행 상황
+    """
+    user_id = session['user_id']
+
+    job = job_service.db.get_job(job_id)
+    if not job:
+        return jsonify({
+            "success": False,
+            "error": "작업을 찾을 수 없습니다."
+        }), 404
+
+    if not _can_access_job(user_id, job):
+        return jsonify({
+            "success": False,
+            "error": "접근 권한이 없습니다."
+        }), 403
+
+    after_event_id = request.headers.get('Last-Event-ID') or request.args.get('after', '0')
+    try:
+        after_event_id = int(after_event_id)
+    except ValueError:
+        after_event_id = 0
+
+    return job_event_stream(job_id, after_event_id)
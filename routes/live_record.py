@@ -1,5 +1,17 @@
-from flask import Blueprint, render_template
+"""
+실시간 녹음 라우트
+녹음 페이지, 녹음 중 조각(timeslice) 업로드, 녹음 종료/취소
+"""
+from flask import Blueprint, render_template, request, jsonify, session
+import logging
+
+from config import config
 from utils.decorators import login_required
+from utils.validation import validate_title
+from services.live_service import live_service
+from routes.jobs import job_event_stream
+
+logger = logging.getLogger(__name__)
 
 # Blueprint 생성
 live_bp = Blueprint('live', __name__)
@@ -11,3 +23,149 @@ def recorder():
     실시간 녹음 페이지 (마이크 & 시스템 오디오)
     """
     return render_template('live/recorder.html')
+
+
+def _get_owned_session(session_id):
+    """
+    녹음 세션 조회 및 소유자 확인
+
+    Returns:
+        (live_session, error_response): 실패 시 live_session은 None
+    """
+    live_session = live_service.get_session(session_id)
+    if not live_session:
+        return None, (jsonify({
+            "success": False,
+            "error": "녹음 세션을 찾을 수 없습니다."
+        }), 404)
+
+    if live_session['owner_id'] != session['user_id']:
+        return None, (jsonify({
+            "success": False,
+            "error": "접근 권한이 없습니다."
+        }), 403)
+
+    return live_session, None
+
+
+@live_bp.route('/api/live/start', methods=['POST'])
+@login_required
+def start_live_session():
+    """
+    실시간 녹음 세션 시작
+
+    Request Body:
+        mode: 'mic' (마이크 녹음) | 'sys' (화면/시스템 오디오 녹화)
+
+    Returns:
+        JSON: {success, session_id, slice_ms}
+    """
+    data = request.get_json(silent=True) or {}
+    result = live_service.start_session(session['user_id'], is_video=data.get('mode') == 'sys')
+    return jsonify({"success": True, **result})
+
+
+@live_bp.route('/api/live/<string:session_id>/chunk', methods=['POST'])
+@login_required
+def upload_live_chunk(session_id):
+    """
+    녹음 조각 업로드 (MediaRecorder timeslice, 순서대로 전송)
+
+    Form Data:
+        seq: 조각 번호 (0부터)
+        chunk: 조각 데이터
+
+    Returns:
+        JSON: {success, segment_count} (segment_count: 지금까지 확정된 세그먼트 수)
+    """
+    live_session, error_response = _get_owned_session(session_id)
+    if error_response:
+        return error_response
+
+    chunk = request.files.get('chunk')
+    try:
+        seq = int(request.form.get('seq', ''))
+    except ValueError:
+        seq = None
+    if chunk is None or seq is None:
+        return jsonify({
+            "success": False,
+            "error": "조각 번호와 데이터가 필요합니다."
+        }), 400
+
+    data = chunk.read(config.LIVE_MAX_CHUNK_MB * 1024 * 1024 + 1)
+    if len(data) > config.LIVE_MAX_CHUNK_MB * 1024 * 1024:
+        return jsonify({
+            "success": False,
+            "error": f"조각 크기가 {config.LIVE_MAX_CHUNK_MB}MB를 초과합니다."
+        }), 413
+
+    success, error_message = live_service.append_chunk(live_session, seq, data)
+    if not success:
+        return jsonify({
+            "success": False,
+            "error": error_message
+        }), 409
+
+    return jsonify({
+        "success": True,
+        "segment_count": live_session['segment_count']
+    })
+
+
+@live_bp.route('/api/live/<string:session_id>/finish', methods=['POST'])
+@login_required
+def finish_live_session(session_id):
+    """
+    녹음 종료 및 노트 생성 작업 등록 (SSE 스트리밍, /upload와 같은 이벤트 형식)
+
+    Form Data:
+        title: 회의 제목
+        chunk_count: 전송한 조각 수
+
+    Returns:
+        SSE Stream: 실시간 진행 상황
+    """
+    live_session, error_response = _get_owned_session(session_id)
+    if error_response:
+        return error_response
+
+    title = request.form.get('title', '').strip()
+    is_valid, error_message = validate_title(title)
+    if not is_valid:
+        return jsonify({
+            "success": False,
+            "error": error_message
+        }), 400
+
+    try:
+        chunk_count = int(request.form.get('chunk_count', '0'))
+    except ValueError:
+        chunk_count = 0
+
+    success, job_id, error_message = live_service.finish_session(live_session, title, chunk_count)
+    if not success:
+        return jsonify({
+            "success": False,
+            "error": error_message
+        }), 409
+
+    logger.info(f"📥 실시간 녹음 종료 작업 등록: job_id={job_id}")
+    return job_event_stream(job_id)
+
+
+@live_bp.route('/api/live/<string:session_id>', methods=['DELETE'])
+@login_required
+def cancel_live_session(session_id):
+    """
+    녹음 취소 (녹음 중 저장된 세그먼트와 녹음 파일 삭제)
+
+    Returns:
+        JSON: {success}
+    """
+    live_session, error_response = _get_owned_session(session_id)
+    if error_response:
+        return error_response
+
+    live_service.cancel_session(live_session)
+    return jsonify({"success": True})
@@ -29,6 +29,8 @@ from utils.user_manager import (
 from utils.analysis import calculate_speaker_share
 from utils.validation import validate_title, parse_meeting_date
 from services.upload_service import upload_service
+from services.job_service import job_service
+from routes.jobs import job_event_stream
 
 # Blueprint 생성
 meetings_bp = Blueprint('meetings', __name__)
@@ -433,7 +435,9 @@ def unshare_meeting_route(meeting_id, target_user_id):
 @login_required
 def upload_and_process():
     """
-    파일 업로드 및 STT 처리 (SSE 스트리밍)
+    파일 업로드 및 STT 처리 작업 등록 (SSE 스트리밍)
+    처리는 백그라운드 작업으로 실행되며, 이 응답은 작업 진행 상황을 구독합니다.
+    (연결이 끊기면 /api/jobs/<job_id>/stream 으로 재구독)
     
     Form Data:
         title: 회의 제목
@@ -459,112 +463,28 @@ def upload_and_process():
     if not is_valid:
         return render_template("index.html", error=error_message)
     
-    # 파일 저장 (generator 시작 전에 완료)
-    meeting_id = uuid.uuid4().hex
-    file_path, original_filename, is_video = upload_service.save_uploaded_file(file, meeting_id)
+    # 파일 저장 (작업 등록 전에 완료)
+    file_path, original_filename, is_video, content_hash = upload_service.save_uploaded_file(file, uuid.uuid4().hex)
     meeting_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    # SSE Generator 함수
-    def generate():
-        nonlocal file_path, is_video # 바깥 범위 변수 수정 허용
-        temp_audio_path = None
-        
-        try:
-            logger.info("🚀 SSE 생성 시작")
-            # Step 1: 파일 업로드 완료
-            yield f"data: {json.dumps({'step': 'upload', 'message': '파일 업로드가 완료되었습니다...', 'icon': '📤'})}\n\n"
-            
-            # [추가] WebM -> 호환 포맷 자동 변환 (MP4/M4A)
-            if file_path.lower().endswith('.webm'):
-                logger.info("🔄 WebM 파일 감지 -> 호환 포맷 변환 시작")
-                yield f"data: {json.dumps({'step': 'convert', 'message': '호환성을 위해 파일 형식을 변환 중...', 'icon': '🔄'})}\n\n"
-                
-                success, new_path, error_msg = upload_service.convert_webm_to_compatible_format(file_path)
-                if not success:
-                    logger.error(f"❌ 포맷 변환 실패: {error_msg}")
-                    yield f"data: {json.dumps({'step': 'error', 'message': f'파일 형식 변환 실패: {error_msg}'})}\n\n"
-                    return
-                
-                # 경로 업데이트
-                file_path = new_path
-                # MP4인 경우에만 비디오로 취급
-                is_video = file_path.lower().endswith('.mp4')
-                logger.info(f"✅ 변환 완료: {file_path} (is_video={is_video})")
-
-            # Step 2: 비디오 변환 (MP4에서 오디오 추출)
-            audio_path_for_stt = file_path
-            if is_video:
-                logger.info("🎬 비디오 오디오 추출 단계 진입")
-                yield f"data: {json.dumps({'step': 'convert', 'message': '비디오를 오디오로 변환 중...', 'icon': '🎬'})}\n\n"
-                
-                success, temp_audio_path, error_msg = upload_service.convert_video_to_audio(file_path)
-                if not success:
-                    logger.error(f"❌ 비디오 오디오 추출 실패: {error_msg}")
-                    yield f"data: {json.dumps({'step': 'error', 'message': f'오디오 추출 실패: {error_msg}'})}\n\n"
-                    return
-                
-                audio_path_for_stt = temp_audio_path
-                logger.info(f"✅ 오디오 추출 완료: {temp_audio_path}")
-            
-            # Step 3: STT 처리
-            logger.info(f"🎤 STT 처리 단계 진입: {audio_path_for_stt}")
-            yield f"data: {json.dumps({'step': 'stt', 'message': '회의 음성을 텍스트로 변환하고 있습니다...', 'icon': '🎤'})}\n\n"
-            
-            # [수정] DB에는 최종 변환된 파일명(file_path)을 저장해야 함
-            # STT 분석은 오디오 추출된 파일(audio_path_for_stt)로 수행
-            result = upload_service.process_audio_file(
-                audio_path=audio_path_for_stt,
-                meeting_id=meeting_id,
-                title=title,
-                meeting_date=meeting_date,
-                owner_id=owner_id,
-                original_filename=os.path.basename(file_path)
-            )
-            logger.info(f"✅ STT 처리 결과: {result}")
-
-            if not result['success']:
-                yield f"data: {json.dumps({'step': 'error', 'message': 'STT 처리 실패'})}\n\n"
-                return
-
-            # 실제로 저장된 meeting_id 가져오기 (중요!)
-            actual_meeting_id = result['meeting_id']
-
-            # 임시 WAV 파일 삭제
-            if temp_audio_path:
-                upload_service.cleanup_temp_files(temp_audio_path)
-
-            # Step 4: 문단 요약 생성
-            yield f"data: {json.dumps({'step': 'summary', 'message': '회의 내용을 분석하고 요약하고 있습니다...', 'icon': '📝'})}\n\n"
-
-            try:
-                result = upload_service.generate_summary(actual_meeting_id)
-                logger.info(f"✅ 문단 요약 생성 완료 (meeting_id: {actual_meeting_id})")
-
-                # Step 5: 마인드맵 생성 (요약 성공 시에만)
-                if result.get('success'):
-                    yield f"data: {json.dumps({'step': 'mindmap', 'message': '마인드맵을 생성하고 있습니다...', 'icon': '🗺️'})}\n\n"
-                    logger.info(f"✅ 마인드맵도 자동 생성되었습니다 (meeting_id: {actual_meeting_id})")
-
-            except Exception as e:
-                logger.warning(f"⚠️  문단 요약 생성 실패: {e}", exc_info=True)
-                # 요약 실패해도 계속 진행
-
-            # Step 6: 완료
-            redirect_url = f"/view/{actual_meeting_id}"
-            yield f"data: {json.dumps({'step': 'complete', 'message': '노트 생성이 완료되었습니다!', 'redirect': redirect_url, 'icon': '✅'})}\n\n"
-        
-        except Exception as e:
-            error_msg = f"처리 중 오류가 발생했습니다: {str(e)}"
-            logger.error(f"❌ 업로드 처리 실패: {e}", exc_info=True)
-            yield f"data: {json.dumps({'step': 'error', 'message': error_msg})}\n\n"
-
-            # 임시 파일 정리
-            if temp_audio_path:
-                upload_service.cleanup_temp_files(temp_audio_path)
-            
-            yield f"data: {json.dumps({'step': 'error', 'message': f'서버 처리 중 오류가 발생했습니다: {str(e)}'})}\n\n"
-    
-    return Response(stream_with_context(generate()), mimetype='text/event-stream')
+
+    # 백그라운드 작업 등록 (변환/STT/요약은 작업 워커에서 실행)
+    job_id = job_service.submit(
+        'upload',
+        {
+            'file_path': file_path,
+            'original_filename': original_filename,
+            'is_video': is_video,
+            'content_hash': content_hash,
+            'title': title,
+            'meeting_date': meeting_date,
+            'owner_id': owner_id
+        },
+        owner_id=owner_id
+    )
+    logger.info(f"📥 업로드 작업 등록: job_id={job_id}")
+
+    # 요청 스레드는 진행 상황 구독만 수행 (연결이 끊겨도 작업은 계속됨)
+    return job_event_stream(job_id)
 
 
 # ==================== 노트 목록 JSON ====================
@@ -632,3 +552,51 @@ def get_mindmap(meeting_id):
             "success": False,
             "error": f"마인드맵 조회 중 오류 발생: {str(e)}"
         }), 500
+
+
+# ==================== Action Item ====================
+
+@meetings_bp.route("/api/action_items/<string:meeting_id>", methods=["GET"])
+@login_required
+def get_action_items(meeting_id):
+    """
+    Action Item 추출 결과 조회 (업로드 완료 후 백그라운드에서 생성)
+
+    Args:
+        meeting_id: 회의 ID
+
+    Returns:
+        JSON: Action Item 목록
+    """
+    user_id = session['user_id']
+
+    # 권한 체크
+    if not can_access_meeting(user_id, meeting_id):
+        return jsonify({
+            "success": False,
+            "error": "접근 권한이 없습니다."
+        }), 403
+
+    try:
+        result = db.get_action_items(meeting_id)
+
+        if result:
+            return jsonify({
+                "success": True,
+                "has_action_items": True,
+                "action_items": json.loads(result['items']),
+                "created_at": result['created_at']
+            })
+        else:
+            return jsonify({
+                "success": True,
+                "has_action_items": False,
+                "message": "Action Item이 아직 추출되지 않았습니다."
+            })
+
+    except Exception as e:
+        logger.error(f"❌ Action Item 조회 실패: {e}", exc_info=True)
+        return jsonify({
+            "success": False,
+            "error": f"Action Item 조회 중 오류 발생: {str(e)}"
+        }), 500
@@ -27,6 +27,7 @@ stt_manager = STTManager()
 def summarize(meeting_id):
     """
     문단 요약 생성
+    같은 내용으로 이미 생성한 요약은 LLM 응답 캐시에서 반환합니다. (?refresh=true면 새로 생성)
 
     Args:
         meeting_id: 회의 ID
@@ -35,6 +36,7 @@ def summarize(meeting_id):
         JSON: 요약 내용
     """
     user_id = session['user_id']
+    refresh = request.args.get('refresh', 'false').lower() == 'true'
 
     # 권한 체크
     if not can_access_meeting(user_id, meeting_id):
@@ -52,14 +54,13 @@ def summarize(meeting_id):
                 "error": "해당 회의를 찾을 수 없습니다."
             }), 404
 
-        # 2. title, transcript_text, meeting_date, audio_file 추출
+        # 2. title, meeting_date, audio_file 추출
         title = rows[0]['title']
         meeting_date = rows[0]['meeting_date']
         audio_file = rows[0]['audio_file']
-        transcript_text = " ".join([row['segment'] for row in rows])
 
-        # 3. stt_manager의 subtopic_generate를 이용해 요약 생성
-        summary_content = stt_manager.subtopic_generate(title, transcript_text)
+        # 3. stt_manager로 요약 생성 (긴 회의는 구간별 병렬 요약 후 병합)
+        summary_content = stt_manager.summarize_meeting(title, rows, use_cache=not refresh)
 
         if not summary_content:
             return jsonify({
@@ -141,6 +142,7 @@ def check_summary(meeting_id):
 def generate_minutes(meeting_id):
     """
     회의록 생성 (RAG 기반)
+    같은 내용으로 이미 생성한 회의록은 LLM 응답 캐시에서 반환합니다. (?refresh=true면 새로 생성)
 
     Args:
         meeting_id: 회의 ID
@@ -149,6 +151,7 @@ def generate_minutes(meeting_id):
         JSON: 회의록 내용
     """
     user_id = session['user_id']
+    refresh = request.args.get('refresh', 'false').lower() == 'true'
 
     # 권한 체크
     if not can_access_meeting(user_id, meeting_id):
@@ -185,7 +188,8 @@ def generate_minutes(meeting_id):
             title,
             transcript_text,
             chunks_content,
-            meeting_date
+            meeting_date,
+            use_cache=not refresh
         )
 
         if not minutes_content:
@@ -1,5 +1,6 @@
 import os
 import sys
+import uuid
 import datetime
 from typing import List, TypedDict, Annotated, Dict
 
@@ -10,11 +11,12 @@ from dotenv import load_dotenv
 
 from langchain_core.messages import BaseMessage, HumanMessage
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
 
 from tools.google_calendar_tool import add_calendar_event, CalendarEvent
+from utils.llm_gateway import llm_gateway, estimate_tokens
+from utils.model_router import model_router
 
 # --- 1. 상태 정의 (State Definition) ---
 class AgentState(TypedDict):
@@ -43,10 +45,9 @@ class AgentService:
         if not os.getenv("GOOGLE_API_KEY"):
             raise ValueError("GOOGLE_API_KEY가 설정되지 않았습니다.")
         
-        # LLM과 Tool 정의
-        self.llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash", temperature=0)
+        # Tool 정의 (LLM은 호출 시 입력 길이로 모델을 골라 도구를 바인딩, MODEL_ROUTES['agent'])
         self.tools = [add_calendar_event]
-        self.llm_with_tools = self.llm.bind_tools(self.tools, tool_choice="any")
+        self._llms_with_tools = {}
         
         # 그래프 생성 및 컴파일
         self.graph = self.build_graph()
@@ -73,6 +74,13 @@ class AgentService:
 
         return graph
 
+    def _llm_with_tools(self, model_name: str):
+        """모델별로 도구를 바인딩한 LLM (모델당 한 번만 생성)"""
+        if model_name not in self._llms_with_tools:
+            llm = llm_gateway.google_chat(model_name)
+            self._llms_with_tools[model_name] = llm.bind_tools(self.tools, tool_choice="any")
+        return self._llms_with_tools[model_name]
+
     def extract_and_schedule_node(self, state: AgentState):
         """
         회의록을 분석하여 Action Item을 추출하고, 관련 도구를 호출하여 처리하는 메인 노드
@@ -80,7 +88,12 @@ class AgentService:
         messages = state['messages']
         
         # LLM을 호출하여 Action Item을 분석하고 도구 사용 결정
-        ai_message = self.llm_with_tools.invoke(messages)
+        input_tokens = estimate_tokens(messages)
+        model_name = model_router.route("agent", input_tokens=input_tokens)
+        ai_message = llm_gateway.call(
+            model_name, self._llm_with_tools(model_name).invoke, messages,
+            estimated_tokens=input_tokens, task="agent"
+        )
         
         # LLM의 응답을 대화 기록에 추가
         new_messages = messages + [ai_message]
@@ -119,9 +132,10 @@ class AgentService:
         # 도구를 사용하지 않은 경우, 단순 메시지만 업데이트
         return {"messages": new_messages}
 
-    def process(self, meeting_text: str, user_id: int):
+    def process(self, meeting_text: str, user_id: int, thread_id: str = None):
         """
         주어진 회의록 텍스트에 대해 Action Item 추출 및 처리를 시작합니다.
+        thread_id는 실행 상태(체크포인트) 구분용이며, 회의마다 달라야 이전 회의의 대화 기록이 섞이지 않습니다.
         """
         current_date = datetime.datetime.now().strftime("%Y년 %m월 %d일")
         
@@ -149,7 +163,7 @@ class AgentService:
         
         # 그래프 실행
         # config는 실행을 고유하게 식별하는 ID. 동일 ID로 재실행 시 이전 상태에서 이어감.
-        config = {"configurable": {"thread_id": "meeting-123"}}
+        config = {"configurable": {"thread_id": thread_id or f"meeting-{uuid.uuid4().hex}"}}
         final_state = self.app.invoke(initial_state, config=config)
         
         return final_state
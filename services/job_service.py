@@ -0,0 +1,296 @@
+"""
+백그라운드 작업 서비스
+업로드 파이프라인 등 오래 걸리는 작업을 요청 스레드와 분리하여 실행합니다.
+
+- 작업과 단계별 진행 이벤트는 SQLite(processing_jobs, processing_job_events)에 영속화
+- 작업 종류마다 별도 큐와 제한된 개수의 워커 스레드를 두어, 낮은 우선순위 작업(Action Item 추출 등)이
+  업로드 처리 워커를 점유하지 않음
+- 작업 종류별로 실패 시 재시도 횟수/대기 시간 설정 가능
+- SSE 라우트는 이벤트를 구독만 하므로 브라우저 연결이 끊겨도 작업은 계속 진행됨
+"""
+import json
+import queue
+import threading
+import traceback
+import uuid
+
+from config import config
+from utils.db_manager import DatabaseManager
+
+TERMINAL_STEPS = ('complete', 'error')
+TERMINAL_STATUSES = ('completed', 'failed')
+
+
+class JobService:
+    """SQLite 기반 영속 작업 큐 + 제한된 워커 풀"""
+
+    def __init__(self, worker_count: int = None):
+        self.db = DatabaseManager(str(config.DATABASE_PATH))
+        self.worker_count = worker_count or config.JOB_WORKER_COUNT  # 작업 종류별 기본 워커 수
+
+        self._handlers = {}
+        self._pools = {}  # job_type -> {'queue', 'workers', 'worker_count', 'retries', 'retry_delay'}
+        self._started = False
+        self._start_lock = threading.Lock()
+
+        # 새 이벤트 발생 시 구독자(SSE 스트림)를 깨우기 위한 조건 변수
+        self._event_condition = threading.Condition()
+
+    def register_handler(self, job_type: str, handler, worker_count: int = None,
+                         retries: int = 0, retry_delay_seconds: float = 0.0):
+        """
+        작업 종류별 실행 함수 등록 (작업 종류마다 별도 큐/워커 풀 생성)
+
+        Args:
+            job_type: 작업 종류 (예: 'upload')
+            handler: handler(job_id, payload, emit) -> dict 형태의 함수
+                     emit(step, message, **extra)로 진행 상황을 기록
+            worker_count: 이 작업 종류의 동시 실행 수 (None이면 JOB_WORKER_COUNT)
+            retries: 실패 시 재시도 횟수 (0이면 재시도 없이 실패 처리)
+            retry_delay_seconds: 재시도 전 대기 시간 (시도 횟수에 비례해 증가)
+        """
+        self._handlers[job_type] = handler
+        self._pools[job_type] = {
+            'queue': queue.Queue(),
+            'workers': [],
+            'worker_count': worker_count or self.worker_count,
+            'retries': retries,
+            'retry_delay': retry_delay_seconds
+        }
+
+        # 시작 이후에 등록된 작업 종류는 바로 워커 시작
+        if self._started:
+            self._start_pool(job_type)
+
+    def start(self):
+        """
+        워커 스레드 시작 및 미완료 작업 복구 (중복 호출 시 무시)
+        """
+        with self._start_lock:
+            if self._started:
+                return
+            self._started = True
+
+        for job_type in self._pools:
+            self._start_pool(job_type)
+
+        self._recover_unfinished_jobs()
+
+    def _start_pool(self, job_type: str):
+        """작업 종류별 워커 스레드 시작"""
+        pool = self._pools[job_type]
+        for i in range(pool['worker_count']):
+            worker = threading.Thread(target=self._worker_loop, args=(job_type,),
+                                      name=f"job-{job_type}-{i}", daemon=True)
+            worker.start()
+            pool['workers'].append(worker)
+
+        print(f"✅ 백그라운드 작업 워커 시작: {job_type} x {pool['worker_count']}")
+
+    def submit(self, job_type: str, payload: dict, owner_id: int = None) -> str:
+        """
+        작업 등록 및 큐 삽입
+
+        Args:
+            job_type: 작업 종류
+            payload: 작업 입력값 (JSON 직렬화 가능해야 함)
+            owner_id: 작업 요청 사용자 ID
+
+        Returns:
+            str: 생성된 job_id
+        """
+        if job_type not in self._handlers:
+            raise ValueError(f"등록되지 않은 작업 종류입니다: {job_type}")
+
+        job_id = uuid.uuid4().hex
+        self.db.create_job(job_id, job_type, json.dumps(payload, ensure_ascii=False), owner_id)
+        job_queue = self._pools[job_type]['queue']
+        job_queue.put(job_id)
+        print(f"📥 작업 등록: {job_id} (type={job_type}, 대기열={job_queue.qsize()})")
+        return job_id
+
+    def emit(self, job_id: str, step: str, message: str = '', **extra) -> int:
+        """
+        작업 진행 이벤트 기록 및 구독자 알림
+
+        Args:
+            job_id: 작업 ID
+            step: 단계 이름 (SSE 'step' 필드)
+            message: 사용자 표시 메시지
+            **extra: icon, redirect 등 SSE 이벤트에 포함할 추가 필드
+
+        Returns:
+            int: 기록된 event_id
+        """
+        data = {'step': step, 'message': message, 'job_id': job_id}
+        data.update(extra)
+        event_id = self.db.add_job_event(job_id, step, json.dumps(data, ensure_ascii=False))
+
+        with self._event_condition:
+            self._event_condition.notify_all()
+
+        return event_id
+
+    def get_status(self, job_id: str) -> dict:
+        """
+        작업 상태 조회
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            dict or None: 작업 상태 (payload 제외, result는 dict로 변환)
+        """
+        job = self.db.get_job(job_id)
+        if not job:
+            return None
+
+        events = self.db.get_job_events(job_id)
+        return {
+            'job_id': job['job_id'],
+            'job_type': job['job_type'],
+            'owner_id': job['owner_id'],
+            'status': job['status'],
+            'current_step': job['current_step'],
+            'result': json.loads(job['result']) if job['result'] else None,
+            'error': job['error'],
+            'attempts': job['attempts'],
+            'created_at': job['created_at'],
+            'updated_at': job['updated_at'],
+            'stages': [
+                {'step': e['step'], 'created_at': e['created_at'], **json.loads(e['data'])}
+                for e in events
+            ]
+        }
+
+    def iter_events(self, job_id: str, after_event_id: int = 0):
+        """
+        작업 이벤트를 순서대로 반환하는 제너레이터 (SSE 구독용)
+        새 이벤트가 없으면 keep-alive 주기마다 None을 반환합니다.
+        완료/실패 이벤트를 반환하면 종료합니다.
+
+        Args:
+            job_id: 작업 ID
+            after_event_id: 이 ID 이후의 이벤트부터 반환 (재연결 시 사용)
+
+        Yields:
+            (event_id, data) 또는 None (keep-alive)
+        """
+        last_event_id = after_event_id
+        idle_seconds = 0.0
+
+        while True:
+            events = self.db.get_job_events(job_id, last_event_id)
+
+            for event in events:
+                last_event_id = event['event_id']
+                data = json.loads(event['data'])
+                yield last_event_id, data
+                if event['step'] in TERMINAL_STEPS:
+                    return
+
+            if events:
+                idle_seconds = 0.0
+                continue
+
+            # 이벤트 없이 작업이 끝난 경우 (비정상 종료 등)
+            job = self.db.get_job(job_id)
+            if not job or job['status'] in TERMINAL_STATUSES:
+                return
+
+            with self._event_condition:
+                self._event_condition.wait(timeout=config.JOB_STREAM_POLL_SECONDS)
+
+            idle_seconds += config.JOB_STREAM_POLL_SECONDS
+            if idle_seconds >= config.JOB_STREAM_KEEPALIVE_SECONDS:
+                idle_seconds = 0.0
+                yield None
+
+    def _recover_unfinished_jobs(self):
+        """
+        서버 재시작 전에 완료되지 않은 작업을 다시 큐에 넣습니다.
+        최대 시도 횟수를 초과한 작업은 실패 처리합니다.
+        """
+        for job in self.db.get_unfinished_jobs():
+            if job['job_type'] not in self._handlers:
+                continue
+
+            max_attempts = max(config.JOB_MAX_ATTEMPTS, self._pools[job['job_type']]['retries'] + 1)
+            if job['attempts'] >= max_attempts:
+                error_msg = "서버 재시작으로 작업이 중단되었습니다. 다시 업로드해 주세요."
+                self.db.update_job(job['job_id'], status='failed', error=error_msg)
+                self.emit(job['job_id'], 'error', error_msg)
+                continue
+
+            print(f"♻️ 미완료 작업 복구: {job['job_id']} (status={job['status']}, attempts={job['attempts']})")
+            self.db.update_job(job['job_id'], status='queued')
+            self._pools[job['job_type']]['queue'].put(job['job_id'])
+
+    def _worker_loop(self, job_type: str):
+        """워커 스레드: 해당 작업 종류의 큐에서 작업을 꺼내 순차 실행"""
+        job_queue = self._pools[job_type]['queue']
+        while True:
+            job_id = job_queue.get()
+            try:
+                self._run_job(job_id)
+            except Exception as e:
+                print(f"❌ 작업 실행 중 처리되지 않은 오류 (job_id={job_id}): {e}")
+                traceback.print_exc()
+            finally:
+                job_queue.task_done()
+
+    def _schedule_retry(self, job_id: str, job_type: str, attempt: int, error_msg: str):
+        """실패한 작업을 대기 시간 후 다시 큐에 넣습니다."""
+        pool = self._pools[job_type]
+        delay = pool['retry_delay'] * attempt
+        self.db.update_job(job_id, status='queued', error=error_msg)
+        print(f"🔁 작업 재시도 예약: {job_id} ({attempt}/{pool['retries']}회, {delay:.0f}초 후)")
+
+        timer = threading.Timer(delay, pool['queue'].put, args=(job_id,))
+        timer.daemon = True
+        timer.start()
+
+    def _run_job(self, job_id: str):
+        """
+        단일 작업 실행
+
+        Args:
+            job_id: 작업 ID
+        """
+        job = self.db.get_job(job_id)
+        if not job or job['status'] in TERMINAL_STATUSES:
+            return
+
+        handler = self._handlers.get(job['job_type'])
+        if handler is None:
+            self.db.update_job(job_id, status='failed', error=f"등록되지 않은 작업 종류: {job['job_type']}")
+            return
+
+        self.db.update_job(job_id, status='running', increment_attempts=True)
+        payload = json.loads(job['payload']) if job['payload'] else {}
+
+        def emit(step, message='', **extra):
+            return self.emit(job_id, step, message, **extra)
+
+        print(f"🚀 작업 시작: {job_id} (type={job['job_type']})")
+        try:
+            result = handler(job_id, payload, emit) or {}
+            self.db.update_job(job_id, status='completed', result_json=json.dumps(result, ensure_ascii=False))
+            print(f"✅ 작업 완료: {job_id}")
+        except Exception as e:
+            traceback.print_exc()
+            error_msg = f"처리 중 오류가 발생했습니다: {str(e)}"
+
+            # 재시도 횟수가 남아 있으면 다시 대기열로 (attempts는 이번 실행 포함)
+            attempt = job['attempts'] + 1
+            if attempt <= self._pools[job['job_type']]['retries']:
+                self._schedule_retry(job_id, job['job_type'], attempt, error_msg)
+                return
+
+            self.db.update_job(job_id, status='failed', error=error_msg)
+            self.emit(job_id, 'error', error_msg)
+            print(f"❌ 작업 실패: {job_id} - {e}")
+
+
+# 싱글톤 인스턴스
+job_service = JobService()
@@ -0,0 +1,426 @@
+"""
+실시간 녹음 서비스
+녹음 중 브라우저가 보내는 MediaRecorder 조각(timeslice)을 세션 WebM 파일에 이어 붙이고,
+새로 쌓인 구간을 백그라운드에서 인식하여 원본 타임라인 기준 세그먼트로 바로 저장합니다.
+녹음이 끝나면 마지막 구간만 인식하면 되므로 종료 후 몇 초 안에 노트 생성 단계로 넘어갑니다.
+
+- 각 구간은 이전 구간과 LIVE_OVERLAP_SECONDS만큼 겹쳐 인식하고, 구간 분할 STT와 같은 방식
+  (STTManager.stitch_windows)으로 화자 번호를 맞추며 하나의 타임라인으로 합침
+- 다음 구간이 도착해도 바뀌지 않는 범위(확정 구간)의 세그먼트만 DB에 추가
+- 세션 상태는 메모리에 두며, 서버 재시작으로 세션이 사라지면 종료 작업이 녹음 파일 전체를
+  일반 업로드 파이프라인으로 처리
+- 종료 작업이 등록되기 전에 서버가 재시작된 녹음은 서버 시작 시 저장된 세그먼트와 녹음 파일을 정리
+  (live_sessions 테이블, sweep_orphaned_sessions)
+"""
+import os
+import time
+import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from config import config
+from utils.db_manager import DatabaseManager
+from utils.ffmpeg_utils import cut_audio_tail, probe_duration, probe_codecs, stt_audio_extension
+from services.job_service import job_service
+from services.upload_service import upload_service
+
+# 이보다 짧게 새로 쌓인 오디오는 다음 구간에 합쳐서 인식
+MIN_NEW_AUDIO_SECONDS = 1.0
+
+
+class LiveRecordingService:
+    """실시간 녹음 세션 관리 + 구간 단위 점진적 STT"""
+
+    def __init__(self):
+        self.db = DatabaseManager(str(config.DATABASE_PATH))
+        self.stt_manager = upload_service.stt_manager
+        self._sessions = {}
+        self._sessions_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=config.LIVE_INGEST_WORKERS,
+                                            thread_name_prefix="live-stt")
+
+    def start_session(self, owner_id: int, is_video: bool) -> dict:
+        """
+        실시간 녹음 세션 시작
+
+        Args:
+            owner_id: 녹음 사용자 ID
+            is_video: 화면(비디오) 녹화 여부
+
+        Returns:
+            dict: {'session_id', 'slice_ms'} (slice_ms: 브라우저 MediaRecorder timeslice)
+        """
+        self._cleanup_idle_sessions()
+
+        session_id = uuid.uuid4().hex
+        # 녹화 종류는 파일명 접두어로 판단하므로 업로드 녹음과 같은 규칙 사용
+        prefix = 'video' if is_video else 'mic'
+        webm_path = str(config.UPLOAD_FOLDER / f"{prefix}_live_{session_id}.webm")
+        meeting_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        session = {
+            'session_id': session_id,
+            'owner_id': owner_id,
+            'is_video': is_video,
+            'webm_path': webm_path,
+            'meeting_id': str(uuid.uuid4()),
+            'meeting_date': meeting_date,
+            'draft_title': f"실시간 녹음 ({meeting_date[:16]})",  # 제목 입력 전 임시 제목
+            'next_seq': 0,  # 다음에 받을 조각 번호
+            'processed_seq': 0,  # 구간 인식을 시도한 조각 수
+            'windows': [],  # 인식한 구간 [(start, end), ...] (녹음 시작 기준 초)
+            'window_results': [],  # 구간별 인식 결과 (구간 시작 기준 시간)
+            'committed_until': 0.0,  # 이 시간 이전 세그먼트는 DB에 저장됨 (확정)
+            'segment_count': 0,
+            'finishing': False,
+            'file_lock': threading.Lock(),  # 조각 이어 붙이기
+            'process_lock': threading.Lock(),  # 구간 인식 (세션당 한 번에 하나)
+            'last_activity': time.monotonic()
+        }
+        open(webm_path, 'wb').close()
+        self.db.add_live_session(session_id, session['meeting_id'], webm_path, self._slice_path(session), owner_id)
+
+        with self._sessions_lock:
+            self._sessions[session_id] = session
+
+        print(f"🎙️ 실시간 녹음 세션 시작: {session_id} (비디오: {is_video})")
+        return {
+            'session_id': session_id,
+            'slice_ms': config.LIVE_SLICE_SECONDS * 1000
+        }
+
+    def get_session(self, session_id: str):
+        """
+        세션 조회
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            dict or None: 세션 상태, 없으면 None
+        """
+        with self._sessions_lock:
+            return self._sessions.get(session_id)
+
+    def append_chunk(self, session: dict, seq: int, data: bytes) -> tuple[bool, str]:
+        """
+        녹음 조각을 세션 파일에 이어 붙이고 새 구간 인식 예약
+
+        Args:
+            session: 세션 상태
+            seq: 조각 번호 (0부터 순서대로)
+            data: 조각 바이트
+
+        Returns:
+            (success, error_message): 이미 받은 조각의 재전송은 성공으로 처리
+        """
+        if session['finishing']:
+            return False, "이미 종료된 녹음 세션입니다."
+
+        with session['file_lock']:
+            if seq < session['next_seq']:
+                return True, ""
+            if seq > session['next_seq']:
+                return False, f"조각 순서가 맞지 않습니다. (기대: {session['next_seq']}, 수신: {seq})"
+
+            with open(session['webm_path'], 'ab') as f:
+                f.write(data)
+            session['next_seq'] += 1
+            session['last_activity'] = time.monotonic()
+
+        self._executor.submit(self._process_new_audio, session)
+        return True, ""
+
+    def finish_session(self, session: dict, title: str, chunk_count: int) -> tuple[bool, str, str]:
+        """
+        녹음 종료: 더 이상 조각을 받지 않고 종료 작업(마지막 구간 인식 + 노트 생성) 등록
+
+        Args:
+            session: 세션 상태
+            title: 회의 제목
+            chunk_count: 브라우저가 보낸 조각 수 (누락 확인용)
+
+        Returns:
+            (success, job_id, error_message)
+        """
+        with session['file_lock']:
+            if session['finishing']:
+                return False, "", "이미 종료된 녹음 세션입니다."
+            if session['next_seq'] < chunk_count:
+                return False, "", f"아직 도착하지 않은 조각이 있습니다. ({session['next_seq']}/{chunk_count})"
+            session['finishing'] = True
+
+        job_id = job_service.submit(
+            'live_finish',
+            {
+                'session_id': session['session_id'],
+                'meeting_id': session['meeting_id'],
+                # 세션이 사라졌을 때 일반 업로드 작업으로 처리하기 위한 값 (run_upload_job payload)
+                'file_path': session['webm_path'],
+                'original_filename': os.path.basename(session['webm_path']),
+                'is_video': True,
+                'title': title,
+                'meeting_date': session['meeting_date'],
+                'owner_id': session['owner_id']
+            },
+            owner_id=session['owner_id']
+        )
+        # 이후 정리는 종료 작업이 담당 (재시작 후에도 작업 복구로 다시 실행됨)
+        self.db.delete_live_session(session['session_id'])
+        print(f"⏹️ 실시간 녹음 종료: {session['session_id']} (조각 {session['next_seq']}개, "
+              f"확정 세그먼트 {session['segment_count']}개, job_id={job_id})")
+        return True, job_id, ""
+
+    def cancel_session(self, session: dict):
+        """
+        녹음 취소: 저장된 세그먼트와 녹음 파일을 삭제 (진행 중인 구간 인식이 끝난 뒤 백그라운드에서 정리)
+
+        Args:
+            session: 세션 상태
+        """
+        session['finishing'] = True
+        self._drop_session(session['session_id'])
+        self._executor.submit(self._discard_session, session)
+
+    def _process_new_audio(self, session: dict):
+        """
+        마지막 인식 이후 새로 받은 녹음 구간 인식 (세션당 한 번에 하나씩 실행)
+        인식 중에 도착한 조각은 다음 호출에서 한 번에 처리합니다.
+        인식에 실패한 구간은 구간 목록에 넣지 않으므로 다음 구간(또는 종료 시 마지막 구간)에서 다시 인식됩니다.
+        """
+        with session['process_lock']:
+            received_seq = session['next_seq']
+            if session['finishing'] or received_seq <= session['processed_seq']:
+                return
+            session['processed_seq'] = received_seq
+
+            slice_path = self._slice_path(session)
+            try:
+                slice_range = self._cut_new_audio(session, slice_path)
+                if slice_range:
+                    self._transcribe_slice(session, slice_path, *slice_range)
+                    self._commit_segments(session)
+            except Exception as e:
+                print(f"⚠️ 실시간 구간 인식 실패, 다음 구간에서 다시 시도 (session: {session['session_id']}): {e}")
+            finally:
+                upload_service.cleanup_temp_files(slice_path)
+
+    def _slice_path(self, session: dict) -> str:
+        """구간 인식용 임시 오디오 경로"""
+        return str(config.UPLOAD_FOLDER / f"live_{session['session_id']}_slice{stt_audio_extension()}")
+
+    def _cut_new_audio(self, session: dict, output_path: str):
+        """
+        이전 구간 끝에서 LIVE_OVERLAP_SECONDS 앞부터 현재까지 받은 녹음 끝까지 추출
+
+        Returns:
+            tuple or None: (start, end) 녹음 시작 기준 초, 새 오디오가 너무 짧으면 None
+
+        Raises:
+            ValueError: 오디오 추출 실패
+        """
+        windows = session['windows']
+        last_end = windows[-1][1] if windows else 0.0
+        start = max(0.0, last_end - config.LIVE_OVERLAP_SECONDS)
+
+        if not cut_audio_tail(session['webm_path'], output_path, start):
+            raise ValueError(f"녹음 구간 추출 실패 ({start:.1f}s~)")
+
+        end = start + probe_duration(output_path)
+        if end - last_end < MIN_NEW_AUDIO_SECONDS:
+            return None
+        return start, end
+
+    def _transcribe_slice(self, session: dict, slice_path: str, start: float, end: float):
+        """
+        구간 하나를 인식하여 세션의 구간 목록에 추가
+
+        Raises:
+            ValueError: 인식 실패
+        """
+        # 모델은 구간 길이가 아니라 녹음 경과 시간으로 선택 (MODEL_ROUTES['stt'])
+        segments, _ = self.stt_manager.transcribe_audio(slice_path, audio_seconds=end)
+        if segments is None:
+            raise ValueError(f"구간 인식 실패 ({start:.0f}s~{end:.0f}s)")
+
+        session['windows'].append((start, end))
+        session['window_results'].append(segments)
+        print(f"🎧 실시간 구간 인식: {start:.0f}s~{end:.0f}s ({len(segments)}개, session: {session['session_id']})")
+
+    def _commit_segments(self, session: dict):
+        """
+        지금까지의 구간을 하나의 타임라인으로 합치고, 확정된 세그먼트만 DB에 추가
+        다음 구간은 마지막 구간 끝에서 LIVE_OVERLAP_SECONDS 앞부터 시작하므로,
+        두 구간의 경계(겹치는 부분의 중간 지점) 이전 세그먼트는 이후 구간이 와도 바뀌지 않습니다.
+        """
+        last_end = session['windows'][-1][1]
+        stable_until = (max(0.0, last_end - config.LIVE_OVERLAP_SECONDS) + last_end) / 2
+        if stable_until <= session['committed_until']:
+            return
+
+        merged = self.stt_manager.stitch_windows(session['windows'], session['window_results'])
+        audio_filename = self._playback_filename(session['webm_path'], session['is_video'], probe=False)
+
+        for segment in merged:
+            if session['committed_until'] <= segment['start_time'] < stable_until:
+                self.db.append_stt_segment(
+                    session['meeting_id'], segment, audio_filename,
+                    session['draft_title'], session['meeting_date'], session['owner_id']
+                )
+                session['segment_count'] += 1
+        session['committed_until'] = stable_until
+
+    @staticmethod
+    def _playback_filename(webm_path: str, is_video: bool, probe: bool = True) -> str:
+        """
+        변환 후 재생용 파일명 (transcode_webm과 같은 규칙: 비디오 트랙이 있는 화면 녹화 -> MP4, 그 외 -> M4A)
+
+        Args:
+            webm_path: 녹음 WebM 경로
+            is_video: 화면 녹화 여부
+            probe: True면 실제 비디오 트랙 유무까지 확인
+        """
+        has_video = is_video and (not probe or bool(probe_codecs(webm_path)['video']))
+        return os.path.basename(webm_path.rsplit('.', 1)[0] + ('.mp4' if has_video else '.m4a'))
+
+    def run_finish_job(self, job_id: str, payload: dict, emit) -> dict:
+        """
+        녹음 종료 처리 (JobService 워커 스레드에서 호출)
+        마지막 구간 인식 → 전체 타임라인 저장 → (임베딩 / 요약 → 마인드맵) 순서로 처리하며,
+        재생용 파일 변환(MP4/M4A)은 인식/후처리와 동시에 진행합니다.
+
+        Args:
+            job_id: 작업 ID
+            payload: {'session_id', 'meeting_id', 'file_path', 'original_filename', 'is_video',
+                      'title', 'meeting_date', 'owner_id'}
+            emit: emit(step, message, **extra) 진행 상황 기록 함수
+
+        Returns:
+            dict: {'meeting_id', 'redirect'}
+        """
+        session = self.get_session(payload['session_id'])
+        if not session:
+            # 서버 재시작 등으로 세션 상태가 사라짐: 녹음 중 저장한 세그먼트를 지우고 파일 전체를 다시 처리
+            print(f"⚠️ 실시간 녹음 세션 없음, 일반 업로드로 처리: {payload['session_id']}")
+            self.db.delete_stt_segments(payload['meeting_id'])
+            return upload_service.run_upload_job(job_id, payload, emit)
+
+        title = payload['title']
+        owner_id = session['owner_id']
+        webm_path = session['webm_path']
+        slice_path = self._slice_path(session)
+        completed = False
+
+        try:
+            emit('upload', '녹음 업로드가 완료되었습니다...', icon='📤')
+
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="live-transcode") as transcoder:
+                with session['process_lock']:
+                    # 재생용 변환이 원본 WebM을 지우기 전에 마지막 구간 추출
+                    slice_range = self._cut_new_audio(session, slice_path)
+                    audio_filename = self._playback_filename(webm_path, session['is_video'])
+
+                    emit('convert', '호환성을 위해 파일 형식을 변환 중...', icon='🔄')
+                    transcode_future = transcoder.submit(
+                        upload_service.transcode_webm, webm_path, session['is_video'], False
+                    )
+
+                    emit('stt', '마지막 구간을 텍스트로 변환하고 있습니다...', icon='🎤')
+                    if slice_range:
+                        self._transcribe_slice(session, slice_path, *slice_range)
+                    segments = self.stt_manager.stitch_windows(session['windows'], session['window_results'])
+
+                if not segments:
+                    raise ValueError("STT 처리 결과가 없습니다.")
+                print(f"✅ 실시간 녹음 STT 완료: {len(segments)}개 세그먼트 "
+                      f"(녹음 중 확정 {session['segment_count']}개, 구간 {len(session['windows'])}개)")
+
+                # 녹음 중 저장된 세그먼트를 최종 결과로 교체 (한 트랜잭션)
+                meeting_id = self.db.save_stt_to_db(
+                    segments=segments,
+                    audio_filename=audio_filename,
+                    title=title,
+                    meeting_date=session['meeting_date'],
+                    owner_id=owner_id,
+                    meeting_id=session['meeting_id']
+                )
+
+                # 청크 임베딩 / 요약 → 마인드맵 (재생용 변환과 동시에 진행)
+                upload_service.run_post_stt_pipeline(meeting_id, emit)
+
+                success, new_path, _, error_msg, _ = transcode_future.result()
+                if not success:
+                    raise ValueError(f"파일 형식 변환 실패: {error_msg}")
+                if os.path.basename(new_path) != audio_filename:
+                    print(f"⚠️ 예상과 다른 변환 파일명: {new_path} (예상: {audio_filename})")
+
+            # Action Item 추출, 신뢰도 낮은 구간 재인식은 별도 작업으로 등록 (노트는 바로 열람 가능)
+            try:
+                upload_service.schedule_action_items(meeting_id, owner_id)
+            except Exception as e:
+                print(f"⚠️ Action Item 추출 작업 등록 실패: {e}")
+            try:
+                upload_service.schedule_refinement(meeting_id, owner_id)
+            except Exception as e:
+                print(f"⚠️ 재인식 작업 등록 실패: {e}")
+
+            redirect_url = f"/view/{meeting_id}"
+            emit('complete', '노트 생성이 완료되었습니다!', redirect=redirect_url, icon='✅')
+            completed = True
+
+            return {
+                'meeting_id': meeting_id,
+                'redirect': redirect_url
+            }
+
+        finally:
+            upload_service.cleanup_temp_files(slice_path)
+            self._drop_session(session['session_id'])
+            if not completed:
+                # 브라우저가 녹음 전체를 일반 업로드로 다시 보낼 수 있으므로 부분 결과 정리
+                self._discard_session(session)
+
+    def _drop_session(self, session_id: str):
+        """세션 목록에서 제거"""
+        with self._sessions_lock:
+            self._sessions.pop(session_id, None)
+
+    def _discard_session(self, session: dict):
+        """세션의 저장된 세그먼트와 녹음 파일 삭제 (진행 중인 구간 인식이 끝난 뒤 실행)"""
+        with session['process_lock']:
+            deleted = self.db.delete_stt_segments(session['meeting_id'])
+            upload_service.cleanup_temp_files(session['webm_path'])
+            self.db.delete_live_session(session['session_id'])
+            print(f"🗑️ 실시간 녹음 세션 정리: {session['session_id']} (세그먼트 {deleted}개 삭제)")
+
+    def _cleanup_idle_sessions(self):
+        """LIVE_SESSION_IDLE_TIMEOUT_SECONDS 동안 조각이 오지 않은 세션 정리 (창을 닫은 녹음 등)"""
+        deadline = time.monotonic() - config.LIVE_SESSION_IDLE_TIMEOUT_SECONDS
+        with self._sessions_lock:
+            idle = [s for s in self._sessions.values() if not s['finishing'] and s['last_activity'] < deadline]
+
+        for session in idle:
+            self.cancel_session(session)
+
+    def sweep_orphaned_sessions(self):
+        """
+        서버 재시작 전에 종료 작업 없이 끝난 녹음 정리 (서버 시작 시 호출)
+        녹음 중 저장한 세그먼트는 재생 파일이 없는 회의로 목록에 남으므로 삭제하고,
+        녹음 WebM과 구간 인식용 임시 파일도 지웁니다.
+        """
+        with self._sessions_lock:
+            active = set(self._sessions)
+
+        for row in self.db.get_live_sessions():
+            if row['session_id'] in active:
+                continue
+            deleted = self.db.delete_stt_segments(row['meeting_id'])
+            upload_service.cleanup_temp_files(row['webm_path'], row['slice_path'])
+            self.db.delete_live_session(row['session_id'])
+            print(f"🧹 중단된 실시간 녹음 정리: {row['session_id']} (세그먼트 {deleted}개 삭제)")
+
+
+# 싱글톤 인스턴스
+live_service = LiveRecordingService()
+job_service.register_handler('live_finish', live_service.run_finish_job)
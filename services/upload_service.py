@@ -3,18 +3,39 @@
 오디오/비디오 파일 업로드 및 처리 비즈니스 로직
 """
 import os
+import json
 import uuid
+import hashlib
+import time
+import shutil
+import tempfile
 import subprocess
 from pathlib import Path
 from werkzeug.utils import secure_filename
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 from config import config
-from utils.stt import STTManager
+from utils.stt import STTManager, STT_PROMPT_VERSION
 from utils.db_manager import DatabaseManager
+from utils.model_router import model_router
+from utils.silence_trimmer import trim_silence, to_original_time
+from utils.task_graph import TaskGraph
+from utils.ffmpeg_utils import (
+    run_ffmpeg, ffmpeg_slots, probe_codecs, probe_duration, parse_ffmpeg_time, stt_audio_args, stt_audio_extension
+)
 from utils.vector_db_manager import vdb_manager
 from utils.validation import validate_title, parse_meeting_date
 from services.agent_service import AgentService
+from services.job_service import job_service
+
+# STT 후처리 단계 표시 이름 (SSE 'stage' 이벤트 메시지용)
+POST_STT_STAGE_LABELS = {
+    'chunks': '검색용 임베딩',
+    'summary': '문단 요약',
+    'subtopics': '요약 임베딩',
+    'mindmap': '마인드맵 생성',
+}
 
 
 class UploadService:
@@ -48,72 +69,114 @@ class UploadService:
 
         return True, ""
 
-    def save_uploaded_file(self, file, meeting_id: str) -> tuple[str, str, bool]:
+    def save_uploaded_file(self, file, meeting_id: str) -> tuple[str, str, bool, str]:
         """
-        업로드된 파일 저장
+        업로드된 파일 저장 (내용 주소 기반)
+        스트리밍으로 디스크에 쓰면서 SHA-256 해시를 계산하고, 해시를 파일명으로 저장합니다.
+        같은 내용의 파일이 이미 있으면 새로 쓰지 않고 기존 파일을 재사용합니다.
 
         Args:
             file: Werkzeug FileStorage 객체
             meeting_id: 회의 ID
 
         Returns:
-            (file_path, original_filename, is_video): 저장된 파일 경로, 원본 파일명, 비디오 여부
+            (file_path, original_filename, is_video, content_hash): 저장된 파일 경로, 원본 파일명, 비디오 여부, 내용 해시
         """
         # 파일명 보안 처리
         original_filename = secure_filename(file.filename)
+        extension = original_filename.rsplit('.', 1)[1].lower()
 
-        # UUID 추가 (파일명 충돌 방지)
-        unique_id = uuid.uuid4().hex[:8]
-        filename = f"{unique_id}_{original_filename}"
-
-        # 파일 저장
-        file_path = config.UPLOAD_FOLDER / filename
-        file.save(str(file_path))
+        # 임시 파일에 쓰면서 해시 계산 (같은 폴더에 두어 rename이 원자적으로 동작)
+        temp_path = config.UPLOAD_FOLDER / f".upload_{uuid.uuid4().hex}.part"
+        hasher = hashlib.sha256()
+        try:
+            with open(temp_path, 'wb') as f:
+                while True:
+                    chunk = file.stream.read(config.UPLOAD_HASH_CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+                    f.write(chunk)
+
+            content_hash = hasher.hexdigest()
+            file_path = config.UPLOAD_FOLDER / f"{content_hash}.{extension}"
+
+            if file_path.exists():
+                print(f"♻️ 동일한 파일이 이미 저장되어 있음: {file_path.name}")
+            else:
+                os.replace(temp_path, file_path)
+        finally:
+            if temp_path.exists():
+                os.remove(temp_path)
 
         # 비디오 파일 여부 확인
-        extension = original_filename.rsplit('.', 1)[1].lower()
         is_video = (extension in ['mp4', 'webm'])
 
-        print(f"✅ 파일 저장: {file_path} (비디오: {is_video})")
+        print(f"✅ 파일 저장: {file_path} (비디오: {is_video}, sha256: {content_hash[:12]})")
 
-        return str(file_path), original_filename, is_video
+        return str(file_path), original_filename, is_video, content_hash
 
-    def convert_video_to_audio(self, video_path: str) -> tuple[bool, str, str]:
+    def get_cached_segments(self, content_hash: str, model: str):
+        """
+        동일 파일의 이전 STT 결과 조회 (내용 해시 + 프롬프트 버전 + 모델 기준)
+
+        Args:
+            content_hash: 업로드 파일의 SHA-256 해시
+            model: 이번 업로드에 선택된 STT 모델 (녹음 길이로 라우팅한 모델)
+
+        Returns:
+            list or None: 정규화된 세그먼트 리스트, 캐시가 없으면 None
+        """
+        if not content_hash:
+            return None
+
+        cached = self.db.get_stt_cache(content_hash, STT_PROMPT_VERSION, model)
+        if not cached:
+            return None
+
+        try:
+            return json.loads(cached)
+        except json.JSONDecodeError:
+            print(f"⚠️ STT 캐시 파싱 실패, 재처리합니다: {content_hash[:12]}")
+            return None
+
+    def find_converted_file(self, webm_path: str):
+        """
+        같은 WebM에서 이전에 변환된 MP4/M4A 파일 조회
+
+        Args:
+            webm_path: WebM 파일 경로
+
+        Returns:
+            str or None: 변환된 파일 경로, 없으면 None
+        """
+        base_path = webm_path.rsplit('.', 1)[0]
+        for target_ext in ('.mp4', '.m4a'):
+            if os.path.exists(base_path + target_ext):
+                return base_path + target_ext
+        return None
+
+    def convert_video_to_audio(self, video_path: str, on_wait=None) -> tuple[bool, str, str]:
         """
         비디오 파일을 오디오 파일로 변환 (ffmpeg 사용)
 
         Args:
             video_path: 비디오 파일 경로
+            on_wait: on_wait(position, depth) ffmpeg 슬롯 대기 순서 알림 콜백
 
         Returns:
             (success, audio_path, error_message): 변환 결과
         """
         try:
-            # 출력 파일 경로 (같은 위치에 .wav로 저장)
-            audio_path = video_path.rsplit('.', 1)[0] + '_converted.wav'
+            # 출력 파일 경로 (같은 위치에 STT_AUDIO_FORMAT 포맷으로 저장)
+            audio_path = video_path.rsplit('.', 1)[0] + '_converted' + stt_audio_extension()
 
-            # ffmpeg 명령어
-            command = [
-                'ffmpeg',
-                '-y',  # 덮어쓰기
-                '-i', video_path,
-                '-vn',  # 비디오 스트림 제거
-                '-acodec', 'pcm_s16le',  # 16-bit PCM
-                '-ar', '16000',  # 16kHz
-                '-ac', '1',  # 모노 채널
-                audio_path
-            ]
+            # ffmpeg 명령어 (비디오 제거, 16kHz 모노, 포맷별 코덱)
+            command = ['ffmpeg', '-y', '-i', video_path] + stt_audio_args(audio_path) + [audio_path]
 
-            # 실행 (20분 타임아웃)
+            # 실행 (20분 타임아웃, 동시 실행 수 제한)
             print(f"ffmpeg 명령어 실행: {' '.join(command)}")
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='ignore',
-                timeout=config.UPLOAD_TIMEOUT_SECONDS
-            )
+            result = run_ffmpeg(command, on_wait=on_wait)
 
             # 디버깅을 위한 상세 로그
             if result.stdout:
@@ -139,75 +202,116 @@ class UploadService:
             print(f"❌ {error_msg}")
             return False, "", error_msg
 
-    def convert_webm_to_compatible_format(self, webm_path: str) -> tuple[bool, str, str]:
+    def transcode_webm(self, webm_path: str, is_video_record: bool = None,
+                       extract_audio: bool = True, on_wait=None) -> tuple[bool, str, str, str, dict]:
         """
-        WebM 파일을 호환성 높은 포맷으로 변환
-        - 비디오 녹화(video_) -> MP4 (H.264/AAC)
-        - 마이크 녹음(mic_) -> M4A (AAC 오디오 전용)
-        
+        WebM 파일을 한 번의 ffmpeg 실행(단일 디코딩)으로 변환
+        - 재생용 파일: 비디오 녹화 -> MP4 (H.264/AAC), 마이크 녹음 -> M4A (AAC)
+        - STT용 오디오: 16kHz 모노, STT_AUDIO_FORMAT 포맷 (extract_audio=True일 때 같은 디코딩 결과에서 함께 출력)
+        원본 코덱이 이미 H.264/AAC이면 재인코딩 없이 스트림 복사합니다.
+
         Args:
             webm_path: WebM 파일 경로
-            
+            is_video_record: 비디오 녹화 여부 (None이면 파일명의 video_ 접두어로 판단)
+            extract_audio: STT용 오디오도 함께 출력할지 여부
+            on_wait: on_wait(position, depth) ffmpeg 슬롯 대기 순서 알림 콜백
+
         Returns:
-            (success, new_path, error_message): 변환 결과
+            (success, new_path, audio_path, error_message, stats): 변환 결과
+            (audio_path는 미출력 시 "", stats는 처리량 측정값)
         """
         try:
-            filename = os.path.basename(webm_path)
-            is_video_record = 'video_' in filename
-            
-            if is_video_record:
-                # 비디오 녹화 -> MP4 변환
-                target_ext = '.mp4'
-                command = [
-                    'ffmpeg', '-y', '-i', webm_path,
-                    '-c:v', 'libx264', '-preset', 'fast',
-                    '-c:a', 'aac',
-                    # 출력 파일 경로 설정 (아래에서 추가)
-                ]
-                print(f"🔄 WebM(Video) → MP4 변환 시작: {webm_path}")
-            else:
-                # 마이크 녹음 -> M4A (AAC) 변환
-                target_ext = '.m4a'
-                command = [
-                    'ffmpeg', '-y', '-i', webm_path,
-                    '-vn', # 비디오 스트림 제거
-                    '-c:a', 'aac',
-                    # 출력 파일 경로 설정 (아래에서 추가)
-                ]
-                print(f"🔄 WebM(Mic) → M4A 변환 시작: {webm_path}")
-
-            # 출력 파일 경로 생성
-            new_path = webm_path.rsplit('.', 1)[0] + target_ext
-            command.append(new_path)
-            
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='ignore',
-                timeout=config.UPLOAD_TIMEOUT_SECONDS
-            )
-            
-            if result.returncode == 0:
-                print(f"✅ 변환 성공: {new_path}")
-                # 원본 WebM 삭제
-                try:
-                    os.remove(webm_path)
-                    print("🗑️ 원본 WebM 파일 삭제됨")
-                except:
-                    pass
-                    
-                return True, new_path, ""
+            if is_video_record is None:
+                is_video_record = 'video_' in os.path.basename(webm_path)
+
+            codecs = probe_codecs(webm_path)
+            base_path = webm_path.rsplit('.', 1)[0]
+            audio_codec_args = ['-c:a', 'copy'] if codecs['audio'] == 'aac' else ['-c:a', 'aac']
+
+            command = ['ffmpeg', '-y', '-i', webm_path]
+
+            if is_video_record and codecs['video']:
+                # 비디오 녹화 -> MP4
+                new_path = base_path + '.mp4'
+                if codecs['video'] == 'h264':
+                    video_codec_args = ['-c:v', 'copy']
+                else:
+                    video_codec_args = ['-c:v', 'libx264', '-preset', 'fast']
+                command += ['-map', '0:v:0', '-map', '0:a:0?'] + video_codec_args + audio_codec_args
+                command += ['-movflags', '+faststart', new_path]
             else:
+                # 마이크 녹음 -> M4A
+                new_path = base_path + '.m4a'
+                command += ['-map', '0:a:0', '-vn'] + audio_codec_args + [new_path]
+
+            audio_path = ""
+            if extract_audio and codecs['audio']:
+                # 같은 입력에서 STT용 오디오를 두 번째 출력으로 생성
+                audio_path = base_path + '_converted' + stt_audio_extension()
+                command += ['-map', '0:a:0'] + stt_audio_args(audio_path) + [audio_path]
+
+            print(f"🔄 WebM 단일 패스 변환 시작: {webm_path} (코덱: {codecs})")
+
+            # 처리량은 슬롯 대기 시간을 제외한 실제 변환 시간으로 측정
+            with ffmpeg_slots.slot(on_wait):
+                started_at = time.monotonic()
+                result = run_ffmpeg(command, use_slot=False)
+                elapsed = time.monotonic() - started_at
+
+            if result.returncode != 0:
                 error_msg = f"ffmpeg 변환 실패: {result.stderr}"
                 print(f"❌ {error_msg}")
-                return False, "", error_msg
-                
+                self.cleanup_temp_files(audio_path)
+                return False, "", "", error_msg, {}
+
+            # 변환 처리량 측정 (실시간 대비 배속, 입력 MB/s)
+            media_seconds = parse_ffmpeg_time(result.stderr)
+            input_mb = os.path.getsize(webm_path) / 1024 / 1024
+            speed = media_seconds / elapsed if elapsed > 0 else 0.0
+            print(f"✅ 변환 성공: {new_path}" + (f" + {audio_path}" if audio_path else ""))
+            print(f"⏱️ 변환 처리량: {media_seconds:.1f}초 분량 / {elapsed:.1f}초 소요 "
+                  f"({speed:.1f}x 실시간, {input_mb / elapsed if elapsed > 0 else 0:.1f}MB/s)")
+
+            # 원본 WebM 삭제
+            try:
+                os.remove(webm_path)
+                print("🗑️ 원본 WebM 파일 삭제됨")
+            except:
+                pass
+
+            stats = {
+                'media_seconds': media_seconds,
+                'elapsed_seconds': elapsed,
+                'speed': speed,
+                'input_mb': input_mb
+            }
+            return True, new_path, audio_path, "", stats
+
+        except subprocess.TimeoutExpired:
+            error_msg = "변환 타임아웃 (20분 초과)"
+            print(f"❌ {error_msg}")
+            return False, "", "", error_msg, {}
+
         except Exception as e:
             error_msg = f"변환 중 오류: {str(e)}"
             print(f"❌ {error_msg}")
-            return False, "", error_msg
+            return False, "", "", error_msg, {}
+
+    def convert_webm_to_compatible_format(self, webm_path: str, is_video_record: bool = None) -> tuple[bool, str, str]:
+        """
+        WebM 파일을 호환성 높은 포맷으로 변환 (재생용 파일만 생성)
+        - 비디오 녹화(video_) -> MP4 (H.264/AAC)
+        - 마이크 녹음(mic_) -> M4A (AAC 오디오 전용)
+        
+        Args:
+            webm_path: WebM 파일 경로
+            is_video_record: 비디오 녹화 여부 (None이면 파일명의 video_ 접두어로 판단)
+            
+        Returns:
+            (success, new_path, error_message): 변환 결과
+        """
+        success, new_path, _, error_msg, _ = self.transcode_webm(webm_path, is_video_record, extract_audio=False)
+        return success, new_path, error_msg
 
     def convert_webm_to_mp4(self, webm_path: str) -> tuple[bool, str, str]:
         """
@@ -239,14 +343,7 @@ class UploadService:
             
             print(f"🔄 WebM → MP4 변환 시작: {webm_path}")
             
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='ignore',
-                timeout=config.UPLOAD_TIMEOUT_SECONDS
-            )
+            result = run_ffmpeg(command)
             
             if result.returncode == 0:
                 print(f"✅ WebM → MP4 변환 성공: {mp4_path}")
@@ -268,6 +365,28 @@ class UploadService:
             print(f"❌ {error_msg}")
             return False, "", error_msg
 
+    def trim_silence_for_stt(self, audio_path: str, on_wait=None) -> tuple[str, list]:
+        """
+        STT 전 긴 무음 구간 제거 (VAD_ENABLED일 때 사용)
+
+        Args:
+            audio_path: STT 대상 오디오 경로
+            on_wait: on_wait(position, depth) ffmpeg 슬롯 대기 순서 알림 콜백
+
+        Returns:
+            (trimmed_path, offset_map): 무음 제거 오디오 경로와 원본 시간 복원용 오프셋 맵
+                                        제거하지 않은 경우 ("", None)
+        """
+        trimmed_path = audio_path.rsplit('.', 1)[0] + '_trimmed' + stt_audio_extension()
+        print(f"✂️ 무음 구간 제거 시작: {audio_path}")
+
+        offset_map = trim_silence(audio_path, trimmed_path, on_wait)
+        if not offset_map:
+            self.cleanup_temp_files(trimmed_path)
+            return "", None
+
+        return trimmed_path, offset_map
+
     def process_audio_file(
         self,
         audio_path: str,
@@ -275,108 +394,323 @@ class UploadService:
         title: str,
         meeting_date: str,
         owner_id: int,
-        original_filename: str = None  # [추가] 원본 파일명 (임시 파일명 대신 저장용)
+        original_filename: str = None,  # [추가] 원본 파일명 (임시 파일명 대신 저장용)
+        content_hash: str = None,
+        segments: list = None,
+        offset_map: list = None,
+        audio_seconds: float = None,
+        emit=None
     ) -> dict:
         """
-        오디오 파일 STT 처리 및 DB 저장
+        오디오 파일 STT 처리 및 SQLite DB 저장
 
         Args:
-            audio_path: STT 분석할 오디오 파일 경로 (임시 wav일 수 있음)
-            meeting_id: 회의 ID
+            audio_path: STT 분석할 오디오 파일 경로 (비디오에서 추출한 임시 오디오일 수 있음)
+            meeting_id: 회의 ID (작업이 재시도되어도 같은 회의에 저장되도록 호출하는 쪽에서 고정)
             title: 회의 제목
             meeting_date: 회의 날짜
             owner_id: 소유자 ID
             original_filename: DB에 저장할 실제 원본 파일명 (MP4/M4A 등)
+            content_hash: 업로드 파일의 SHA-256 해시 (STT 결과 캐시 키)
+            segments: 이미 인식된 세그먼트 (STT 캐시 적중 시 STT를 건너뜀)
+            offset_map: 무음 제거 오디오로 인식한 경우 원본 시간 복원용 오프셋 맵
+            audio_seconds: STT 모델 선택 기준 길이 (원본 미디어 길이, 캐시 조회 때와 같은 모델을 쓰도록 전달)
+            emit: emit(step, message, **extra) 진행 상황 기록 함수
+                  주어지면 스트리밍 STT로 세그먼트가 완성될 때마다 DB에 저장하고 'segment' 이벤트 전송
 
         Returns:
-            dict: 처리 결과 (segments, meeting_id 등)
+            dict: 처리 결과 (segments, meeting_id, stt_model 등 - 캐시 적중 시 stt_model은 None)
         """
-        # STT 처리
-        print(f"🎤 STT 처리 시작: {audio_path}")
-        segments = self.stt_manager.transcribe_audio(audio_path)
-
-        if not segments:
-            raise ValueError("STT 처리 결과가 없습니다.")
-
-        print(f"✅ STT 완료: {len(segments)}개 세그먼트")
-
         # SQLite DB 저장
         # original_filename이 있으면 그것을 사용, 없으면 audio_path에서 추출
         if original_filename:
             audio_filename = original_filename
         else:
             audio_filename = os.path.basename(audio_path)
-            
+
+        stt_model = None
+
+        if segments:
+            print(f"♻️ 캐시된 STT 결과 사용: {len(segments)}개 세그먼트")
+        else:
+            on_segment = None
+            # 이전 시도(서버 재시작 전)에서 스트리밍으로 저장된 세그먼트 정리
+            self.db.delete_stt_segments(meeting_id)
+
+            if emit and config.STT_STREAMING_ENABLED:
+                # 스트리밍 중 저장되는 세그먼트와 최종 저장이 같은 회의 일시를 사용하도록 미리 결정
+                if meeting_date is None:
+                    meeting_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                streamed_count = 0
+
+                def on_segment(segment):
+                    nonlocal streamed_count
+                    # 원본 세그먼트는 아래에서 한 번에 시간 보정하므로 복사본만 보정
+                    segment = dict(segment, start_time=to_original_time(offset_map, segment['start_time']))
+                    self.db.append_stt_segment(
+                        meeting_id, segment, audio_filename, title, meeting_date, owner_id
+                    )
+                    streamed_count += 1
+                    minutes, seconds = divmod(int(segment['start_time']), 60)
+                    emit('segment', f"[{minutes:02d}:{seconds:02d}] 화자 {segment['speaker']}: {segment['text'][:40]}",
+                         icon='🎤', meeting_id=meeting_id, segment_count=streamed_count,
+                         segment={key: segment[key] for key in ('speaker', 'start_time', 'text')})
+
+            # STT 처리
+            print(f"🎤 STT 처리 시작: {audio_path}")
+            segments, stt_model = self.stt_manager.transcribe_audio(
+                audio_path, on_segment=on_segment, audio_seconds=audio_seconds
+            )
+
+            if not segments:
+                # 실패 전에 저장된 부분 세그먼트 정리
+                self.db.delete_stt_segments(meeting_id)
+                raise ValueError("STT 처리 결과가 없습니다.")
+
+            print(f"✅ STT 완료: {len(segments)}개 세그먼트")
+
+            # 무음 제거 오디오 기준 시간을 원본 미디어 시간으로 복원
+            if offset_map:
+                for segment in segments:
+                    segment['start_time'] = to_original_time(offset_map, segment['start_time'])
+
+            # 동일 파일 재업로드 시 재사용할 수 있도록 정규화된 결과 저장 (실제로 인식한 모델 기준)
+            if content_hash:
+                self.db.save_stt_cache(
+                    content_hash, STT_PROMPT_VERSION, stt_model,
+                    json.dumps(segments, ensure_ascii=False)
+                )
+
+        # 스트리밍으로 저장된 세그먼트는 최종 결과로 교체 (한 트랜잭션)
         saved_meeting_id = self.db.save_stt_to_db(
             segments=segments,
             audio_filename=audio_filename,
             title=title,
             meeting_date=meeting_date,
-            owner_id=owner_id
+            owner_id=owner_id,
+            meeting_id=meeting_id
         )
 
-        # Vector DB 저장 (청킹 + 임베딩)
-        # DB에서 저장된 세그먼트 다시 조회
-        all_segments = self.db.get_segments_by_meeting_id(saved_meeting_id)
-
-        if all_segments:
-            first_segment = all_segments[0]
-            self.vdb_manager.add_meeting_as_chunk(
-                meeting_id=saved_meeting_id,
-                title=first_segment['title'],
-                meeting_date=first_segment['meeting_date'],
-                audio_file=first_segment['audio_file'],
-                segments=all_segments
-            )
-            print(f"✅ meeting_chunks에 저장 완료 (meeting_id: {saved_meeting_id})")
-
-        # [통합] Action Item 추출을 위해 AgentService 호출
-        try:
-            print(f"🤖 Action Item 추출 에이전트 호출 시작 (meeting_id: {saved_meeting_id})")
-            full_transcript = " ".join([s['text'] for s in segments])
-            # process 메서드에 user_id 전달
-            self.agent_service.process(full_transcript, owner_id)
-            print(f"✅ Action Item 추출 에이전트 호출 완료 (meeting_id: {saved_meeting_id})")
-        except Exception as e:
-            print(f"⚠️ Action Item 추출 에이전트 호출 중 오류 발생: {e}")
-            # 에이전트 호출이 실패해도 전체 프로세스는 중단되지 않음
-
+        # 청크 임베딩, Action Item 추출, 요약은 run_post_stt_pipeline에서 병렬 처리
         return {
             'success': True,
             'meeting_id': saved_meeting_id,
-            'segments': segments
+            'segments': segments,
+            'stt_model': stt_model
         }
 
-    def generate_summary(self, meeting_id: str) -> dict:
+    def embed_chunks(self, meeting_id: str, all_segments: list):
         """
-        문단 요약 생성
+        회의 세그먼트를 청킹하여 meeting_chunks에 임베딩 저장
 
         Args:
             meeting_id: 회의 ID
+            all_segments: DB에서 조회한 세그먼트 목록
+        """
+        first_segment = all_segments[0]
+        self.vdb_manager.add_meeting_as_chunk(
+            meeting_id=meeting_id,
+            title=first_segment['title'],
+            meeting_date=first_segment['meeting_date'],
+            audio_file=first_segment['audio_file'],
+            segments=all_segments
+        )
+        print(f"✅ meeting_chunks에 저장 완료 (meeting_id: {meeting_id})")
+
+    def run_action_item_job(self, job_id: str, payload: dict, emit) -> dict:
+        """
+        Action Item 추출 작업 (JobService 'action_items' 워커에서 실행)
+        업로드 처리와 별도의 낮은 우선순위 작업으로, 노트 생성 완료를 지연시키지 않습니다.
+
+        Args:
+            job_id: 작업 ID
+            payload: {'meeting_id', 'owner_id'}
+            emit: emit(step, message, **extra) 진행 상황 기록 함수
 
         Returns:
-            dict: 요약 결과
+            dict: {'meeting_id', 'item_count'}
         """
-        print(f"🤖 문단 요약 자동 생성 시작 (meeting_id: {meeting_id})")
+        meeting_id = payload['meeting_id']
+        owner_id = payload['owner_id']
 
-        # DB에서 모든 세그먼트 조회
         all_segments = self.db.get_segments_by_meeting_id(meeting_id)
-
         if not all_segments:
-            raise ValueError("세그먼트를 찾을 수 없습니다.")
+            # 처리 전에 회의가 삭제된 경우
+            print(f"ℹ️ 회의가 없어 Action Item 추출을 건너뜁니다 (meeting_id: {meeting_id})")
+            emit('complete', '회의가 삭제되어 건너뜁니다.')
+            return {'meeting_id': meeting_id, 'item_count': 0}
 
-        first_segment = all_segments[0]
+        emit('agent', 'Action Item을 추출하고 있습니다...', icon='🤖')
+        print(f"🤖 Action Item 추출 에이전트 호출 시작 (meeting_id: {meeting_id})")
+        full_transcript = " ".join([row['segment'] for row in all_segments])
+        # process 메서드에 user_id 전달 (회의별 thread_id로 실행 상태 분리)
+        final_state = self.agent_service.process(full_transcript, owner_id, thread_id=f"meeting-{meeting_id}")
+
+        processed_items = final_state.get('processed_items', [])
+        self.db.save_action_items(meeting_id, owner_id, json.dumps(processed_items, ensure_ascii=False, default=str))
+        print(f"✅ Action Item 추출 에이전트 호출 완료 (meeting_id: {meeting_id}, {len(processed_items)}개)")
+
+        emit('complete', f"Action Item {len(processed_items)}개 처리 완료", icon='✅')
+        return {'meeting_id': meeting_id, 'item_count': len(processed_items)}
+
+    def schedule_action_items(self, meeting_id: str, owner_id: int) -> str:
+        """
+        Action Item 추출 작업 등록 (업로드 완료 후 백그라운드에서 처리)
+
+        Args:
+            meeting_id: 회의 ID
+            owner_id: 소유자 ID
+
+        Returns:
+            str: 등록된 job_id
+        """
+        return job_service.submit('action_items', {'meeting_id': meeting_id, 'owner_id': owner_id}, owner_id=owner_id)
+
+    def run_refine_job(self, job_id: str, payload: dict, emit) -> dict:
+        """
+        신뢰도 낮은 구간 재인식 작업 (JobService 'stt_refine' 워커에서 실행)
+        약한 세그먼트가 모인 시간 범위만 원본 미디어에서 잘라 상위 모델로 동시에 다시 인식하고,
+        개선된 구간의 meeting_dialogues 행과 바뀐 meeting_chunks 청크만 갱신합니다.
+
+        Args:
+            job_id: 작업 ID
+            payload: {'meeting_id', 'owner_id', 'stt_model'}
+            emit: emit(step, message, **extra) 진행 상황 기록 함수
+
+        Returns:
+            dict: {'meeting_id', 'span_count', 'refined_count'}
+        """
+        meeting_id = payload['meeting_id']
+        rows = self.db.get_segments_by_meeting_id(meeting_id)
+        if not rows:
+            print(f"ℹ️ 회의가 없어 재인식을 건너뜁니다 (meeting_id: {meeting_id})")
+            emit('complete', '회의가 삭제되어 건너뜁니다.')
+            return {'meeting_id': meeting_id, 'span_count': 0, 'refined_count': 0}
+
+        audio_path = str(config.UPLOAD_FOLDER / rows[0]['audio_file'])
+        if not os.path.exists(audio_path):
+            print(f"⚠️ 원본 미디어가 없어 재인식을 건너뜁니다: {audio_path}")
+            emit('complete', '원본 미디어가 없어 건너뜁니다.')
+            return {'meeting_id': meeting_id, 'span_count': 0, 'refined_count': 0}
+
+        segments = [
+            {
+                'segment_id': row['segment_id'],
+                'speaker': row['speaker_label'],
+                'start_time': row['start_time'] or 0.0,
+                'confidence': row['confidence'] or 0.0,
+                'text': row['segment'] or ''
+            }
+            for row in rows
+        ]
+        stt_model = payload.get('stt_model')
+        if stt_model == config.STT_REFINE_MODEL:
+            emit('complete', '이미 재인식 모델로 인식한 회의입니다.', icon='✅')
+            return {'meeting_id': meeting_id, 'span_count': 0, 'refined_count': 0}
+
+        eligible = None
+        if stt_model is None:
+            # 실시간 녹음은 구간마다 녹음 경과 시간으로 모델을 골랐으므로, 재인식 모델로 인식된 시간대는 제외
+            def eligible(segment):
+                return model_router.route('stt', audio_seconds=segment['start_time']) != config.STT_REFINE_MODEL
+
+        spans = self.stt_manager.plan_refine_spans(segments, probe_duration(audio_path), eligible=eligible)
+        if not spans:
+            emit('complete', '재인식할 구간이 없습니다.', icon='✅')
+            return {'meeting_id': meeting_id, 'span_count': 0, 'refined_count': 0}
+
+        emit('stt', f"신뢰도가 낮은 {len(spans)}개 구간을 다시 인식하고 있습니다...", icon='🎯')
+        print(f"🎯 신뢰도 낮은 구간 재인식 시작 (meeting_id: {meeting_id}, {len(spans)}개 구간, "
+              f"{sum(span['end'] - span['start'] for span in spans):.0f}초)")
+
+        work_dir = tempfile.mkdtemp(prefix="stt_refine_")
+        try:
+            def refine(span):
+                try:
+                    return self.stt_manager.refine_span(audio_path, span, segments, work_dir)
+                except Exception as e:
+                    print(f"⚠️ 구간 재인식 실패 ({span['start']:.0f}s~{span['end']:.0f}s): {e}")
+                    return None
+
+            with ThreadPoolExecutor(max_workers=config.STT_REFINE_CONCURRENCY) as executor:
+                results = list(executor.map(refine, spans))
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+        replacements = [
+            ([seg['segment_id'] for seg in segments[span['first']:span['last'] + 1]], new_segments)
+            for span, new_segments in zip(spans, results) if new_segments
+        ]
+        refined_count = self.db.replace_stt_segments(meeting_id, replacements) if replacements else 0
+
+        if refined_count:
+            # 바뀐 대화 내용으로 검색 청크 갱신 (바뀐 청크만 다시 임베딩)
+            updated_rows = self.db.get_segments_by_meeting_id(meeting_id)
+            first_row = updated_rows[0]
+            self.vdb_manager.update_meeting_chunks(
+                meeting_id=meeting_id,
+                title=first_row['title'],
+                meeting_date=first_row['meeting_date'],
+                audio_file=first_row['audio_file'],
+                segments=updated_rows
+            )
+
+        print(f"✅ 신뢰도 낮은 구간 재인식 완료 (meeting_id: {meeting_id}, {refined_count}/{len(spans)}개 구간 교체)")
+        emit('complete', f"{refined_count}/{len(spans)}개 구간 재인식 완료", icon='✅')
+        return {'meeting_id': meeting_id, 'span_count': len(spans), 'refined_count': refined_count}
+
+    def schedule_refinement(self, meeting_id: str, owner_id: int, stt_model: str = None):
+        """
+        신뢰도 낮은 구간 재인식 작업 등록 (STT_REFINE_ENABLED일 때만, 노트 생성 완료 후 백그라운드에서 처리)
+        이미 재인식 모델(STT_REFINE_MODEL)로 인식한 회의는 같은 모델/프롬프트로 다시 인식해도 나아지지 않으므로 등록하지 않습니다.
+
+        Args:
+            meeting_id: 회의 ID
+            owner_id: 소유자 ID
+            stt_model: 회의 전체를 인식한 모델 (None이면 실시간 녹음처럼 구간마다 모델이 다른 경우)
+
+        Returns:
+            str or None: 등록된 job_id, 비활성화 또는 재인식이 필요 없으면 None
+        """
+        if not config.STT_REFINE_ENABLED:
+            return None
+        if stt_model == config.STT_REFINE_MODEL:
+            print(f"ℹ️ 이미 {stt_model}로 인식한 회의라 재인식을 건너뜁니다 (meeting_id: {meeting_id})")
+            return None
+        return job_service.submit(
+            'stt_refine', {'meeting_id': meeting_id, 'owner_id': owner_id, 'stt_model': stt_model}, owner_id=owner_id
+        )
 
-        # transcript_text 생성
-        transcript_text = " ".join([row['segment'] for row in all_segments])
+    def create_summary(self, meeting_id: str, all_segments: list) -> str:
+        """
+        문단 요약 생성 (긴 회의는 구간별 병렬 요약 후 병합)
+
+        Args:
+            meeting_id: 회의 ID
+            all_segments: DB에서 조회한 세그먼트 목록
+
+        Returns:
+            str: 요약 내용 (마크다운)
+        """
+        print(f"🤖 문단 요약 자동 생성 시작 (meeting_id: {meeting_id})")
 
-        # subtopic_generate를 이용해 요약 생성
-        summary_content = self.stt_manager.subtopic_generate(first_segment['title'], transcript_text)
+        summary_content = self.stt_manager.summarize_meeting(all_segments[0]['title'], all_segments)
 
         if not summary_content:
             raise ValueError("요약 생성에 실패했습니다.")
 
-        # meeting_subtopic DB에 저장
+        return summary_content
+
+    def embed_subtopics(self, meeting_id: str, all_segments: list, summary_content: str):
+        """
+        문단 요약을 meeting_subtopic에 임베딩 저장
+
+        Args:
+            meeting_id: 회의 ID
+            all_segments: DB에서 조회한 세그먼트 목록
+            summary_content: 요약 내용
+        """
+        first_segment = all_segments[0]
         self.vdb_manager.add_meeting_as_subtopic(
             meeting_id=meeting_id,
             title=first_segment['title'],
@@ -386,35 +720,264 @@ class UploadService:
         )
         print(f"✅ 문단 요약 생성 및 저장 완료 (meeting_id: {meeting_id})")
 
-        # 마인드맵 키워드 자동 생성
-        try:
-            print(f"🗺️ 마인드맵 키워드 자동 생성 시작 (meeting_id: {meeting_id})")
+    def create_mindmap(self, meeting_id: str, all_segments: list, summary_content: str):
+        """
+        요약 기반 마인드맵 키워드 생성 및 저장
 
-            mindmap_content = self.stt_manager.extract_mindmap_keywords(
-                summary_content,
-                first_segment['title']
-            )
+        Args:
+            meeting_id: 회의 ID
+            all_segments: DB에서 조회한 세그먼트 목록
+            summary_content: 요약 내용
+        """
+        print(f"🗺️ 마인드맵 키워드 자동 생성 시작 (meeting_id: {meeting_id})")
 
-            if mindmap_content:
-                self.db.save_mindmap(
-                    meeting_id=meeting_id,
-                    mindmap_content=mindmap_content
-                )
-                print(f"✅ 마인드맵 키워드 생성 및 저장 완료 (meeting_id: {meeting_id})")
-            else:
-                print(f"⚠️ 마인드맵 키워드 생성 실패 (meeting_id: {meeting_id})")
+        mindmap_content = self.stt_manager.extract_mindmap_keywords(
+            summary_content,
+            all_segments[0]['title']
+        )
+
+        if not mindmap_content:
+            raise ValueError("마인드맵 키워드 생성에 실패했습니다.")
+
+        self.db.save_mindmap(
+            meeting_id=meeting_id,
+            mindmap_content=mindmap_content
+        )
+        print(f"✅ 마인드맵 키워드 생성 및 저장 완료 (meeting_id: {meeting_id})")
+
+    def run_post_stt_pipeline(self, meeting_id: str, emit=None) -> dict:
+        """
+        STT 이후 작업을 의존 그래프로 병렬 실행
+        - 동시 실행: 청크 임베딩, 문단 요약
+        - 요약 완료 후: 요약 임베딩, 마인드맵 생성
+        청크 임베딩 실패 시에만 예외가 발생하며, 나머지 작업 실패는 로그로 남기고 계속 진행합니다.
 
+        Args:
+            meeting_id: 회의 ID
+            emit: emit(step, message, **extra) 진행 상황 기록 함수 (없으면 생략)
+
+        Returns:
+            dict: {'success', 'summary', 'errors', 'timings'}
+        """
+        all_segments = self.db.get_segments_by_meeting_id(meeting_id)
+        if not all_segments:
+            raise ValueError("세그먼트를 찾을 수 없습니다.")
+
+        graph = TaskGraph()
+        graph.add('chunks', lambda r: self.embed_chunks(meeting_id, all_segments), required=True)
+        graph.add('summary', lambda r: self.create_summary(meeting_id, all_segments))
+        graph.add('subtopics', lambda r: self.embed_subtopics(meeting_id, all_segments, r['summary']),
+                  depends_on=['summary'])
+        graph.add('mindmap', lambda r: self.create_mindmap(meeting_id, all_segments, r['summary']),
+                  depends_on=['summary'])
+
+        def on_event(name, status, elapsed, error):
+            if status == 'failed':
+                print(f"⚠️ {POST_STT_STAGE_LABELS[name]} 실패 (meeting_id: {meeting_id}): {error}")
+            if not emit:
+                return
+            if name == 'mindmap' and status == 'start':
+                emit('mindmap', '마인드맵을 생성하고 있습니다...', icon='🗺️')
+            elif status in ('done', 'failed', 'skipped'):
+                result_text = {'done': '완료', 'failed': '실패', 'skipped': '건너뜀'}[status]
+                emit('stage', f"{POST_STT_STAGE_LABELS[name]} {result_text}",
+                     stage=name, status=status, elapsed=round(elapsed or 0.0, 2))
+
+        if emit:
+            emit('summary', '회의 내용을 분석하고 요약하고 있습니다...', icon='📝')
+
+        outcome = graph.run(max_workers=config.POST_STT_MAX_WORKERS, on_event=on_event)
+
+        timings_text = ", ".join(f"{name}={seconds:.1f}s" for name, seconds in outcome['timings'].items())
+        print(f"⏱️ STT 후처리 단계별 소요 시간 (meeting_id: {meeting_id}): {timings_text}")
+
+        return {
+            'success': 'summary' in outcome['results'],
+            'summary': outcome['results'].get('summary'),
+            'errors': {name: str(error) for name, error in outcome['errors'].items()},
+            'timings': outcome['timings']
+        }
+
+    def generate_summary(self, meeting_id: str) -> dict:
+        """
+        문단 요약 생성 (요약 → 요약 임베딩 → 마인드맵 순차 실행)
+
+        Args:
+            meeting_id: 회의 ID
+
+        Returns:
+            dict: 요약 결과
+        """
+        # DB에서 모든 세그먼트 조회
+        all_segments = self.db.get_segments_by_meeting_id(meeting_id)
+
+        if not all_segments:
+            raise ValueError("세그먼트를 찾을 수 없습니다.")
+
+        summary_content = self.create_summary(meeting_id, all_segments)
+        self.embed_subtopics(meeting_id, all_segments, summary_content)
+
+        # 마인드맵 생성 실패해도 요약은 성공으로 처리
+        try:
+            self.create_mindmap(meeting_id, all_segments, summary_content)
         except Exception as mindmap_error:
             print(f"⚠️ 마인드맵 키워드 자동 생성 중 오류 발생: {mindmap_error}")
-            import traceback
-            traceback.print_exc()
-            # 마인드맵 생성 실패해도 요약은 성공으로 처리
 
         return {
             'success': True,
             'summary': summary_content
         }
 
+    def run_upload_job(self, job_id: str, payload: dict, emit) -> dict:
+        """
+        업로드 파이프라인 실행 (JobService 워커 스레드에서 호출)
+        변환 → STT → DB 저장 → (임베딩 / 요약 → 마인드맵) 순서로 처리하며
+        각 단계는 emit으로 기록되어 SSE 구독자에게 전달됩니다.
+
+        서버 재시작 후 다시 실행될 수 있으므로, 회의 ID는 작업 ID에서 만들고(재시도해도 같은 회의)
+        이전 시도에서 원본 WebM이 변환 후 삭제되었으면 변환된 파일로 이어서 처리합니다.
+
+        Args:
+            job_id: 작업 ID
+            payload: {'file_path', 'original_filename', 'is_video', 'content_hash', 'title', 'meeting_date', 'owner_id',
+                      'meeting_id'(선택, 실시간 녹음에서 미리 발급한 회의 ID)}
+            emit: emit(step, message, **extra) 진행 상황 기록 함수
+
+        Returns:
+            dict: {'meeting_id', 'redirect'}
+        """
+        file_path = payload['file_path']
+        is_video = payload['is_video']
+        title = payload['title']
+        meeting_date = payload['meeting_date']
+        owner_id = payload['owner_id']
+        content_hash = payload.get('content_hash')
+        meeting_id = payload.get('meeting_id') or str(uuid.UUID(job_id))
+        temp_audio_path = None
+        trimmed_audio_path = None
+
+        # 변환된 파일을 먼저 확인 (이전 시도에서 변환 후 원본 WebM이 삭제되었을 수 있음)
+        converted_path = self.find_converted_file(file_path) if file_path.lower().endswith('.webm') else None
+        if not os.path.exists(converted_path or file_path):
+            raise ValueError("업로드된 파일을 찾을 수 없습니다.")
+
+        # STT 모델은 원본 미디어 길이로 미리 선택 (캐시 조회와 실제 인식에 같은 모델 사용)
+        audio_seconds = probe_duration(converted_path or file_path) or None
+        stt_model = model_router.route('stt', audio_seconds=audio_seconds)
+
+        # 같은 내용의 파일을 같은 모델로 처리한 적이 있으면 STT 결과 재사용
+        cached_segments = self.get_cached_segments(content_hash, stt_model)
+
+        def on_ffmpeg_wait(position, depth):
+            # ffmpeg 슬롯이 모두 사용 중이면 대기 순서를 SSE로 안내
+            emit('queue', f'다른 파일 변환이 끝나기를 기다리는 중... (대기 {position}번째)', icon='⏳',
+                 queue_position=position, queue_depth=depth)
+
+        try:
+            # Step 1: 파일 업로드 완료
+            emit('upload', '파일 업로드가 완료되었습니다...', icon='📤')
+
+            # WebM -> 호환 포맷 자동 변환 (MP4/M4A)
+            if file_path.lower().endswith('.webm'):
+                if converted_path:
+                    # 이전 업로드(또는 중단된 이전 시도)에서 이미 변환된 파일 재사용
+                    print(f"♻️ 기존 변환 파일 재사용: {converted_path}")
+                    self.cleanup_temp_files(file_path)
+                    new_path = converted_path
+                else:
+                    emit('convert', '호환성을 위해 파일 형식을 변환 중...', icon='🔄')
+
+                    # 저장 파일명은 해시이므로 녹화 종류는 원본 파일명으로 판단
+                    # 재생용 파일과 STT용 오디오를 한 번의 디코딩으로 함께 생성
+                    is_video_record = 'video_' in payload.get('original_filename', '')
+                    success, new_path, temp_audio_path, error_msg, stats = self.transcode_webm(
+                        file_path, is_video_record, extract_audio=not cached_segments, on_wait=on_ffmpeg_wait
+                    )
+                    if not success:
+                        raise ValueError(f"파일 형식 변환 실패: {error_msg}")
+
+                    if stats.get('media_seconds'):
+                        emit('convert', f"파일 변환 완료 ({stats['speed']:.1f}배속)", icon='🔄',
+                             transcode_stats=stats)
+
+                # 경로 업데이트 (MP4인 경우에만 비디오로 취급)
+                file_path = new_path
+                is_video = file_path.lower().endswith('.mp4')
+
+            # Step 2: 비디오 변환 (MP4에서 오디오 추출, WebM 단일 패스 변환 또는 STT 캐시 적중 시 생략)
+            audio_path_for_stt = temp_audio_path or file_path
+            if is_video and not cached_segments and not temp_audio_path:
+                emit('convert', '비디오를 오디오로 변환 중...', icon='🎬')
+
+                success, temp_audio_path, error_msg = self.convert_video_to_audio(file_path, on_ffmpeg_wait)
+                if not success:
+                    raise ValueError(f"오디오 추출 실패: {error_msg}")
+
+                audio_path_for_stt = temp_audio_path
+
+            # 긴 무음 구간 제거 (선택)
+            offset_map = None
+            if config.VAD_ENABLED and not cached_segments:
+                emit('convert', '무음 구간을 정리하고 있습니다...', icon='✂️')
+                trimmed_audio_path, offset_map = self.trim_silence_for_stt(audio_path_for_stt, on_ffmpeg_wait)
+                if trimmed_audio_path:
+                    audio_path_for_stt = trimmed_audio_path
+
+            # Step 3: STT 처리
+            emit('stt', '회의 음성을 텍스트로 변환하고 있습니다...', icon='🎤')
+
+            # DB에는 최종 변환된 파일명(file_path)을 저장, STT는 오디오 추출 파일로 수행
+            result = self.process_audio_file(
+                audio_path=audio_path_for_stt,
+                meeting_id=meeting_id,
+                title=title,
+                meeting_date=meeting_date,
+                owner_id=owner_id,
+                original_filename=os.path.basename(file_path),
+                content_hash=content_hash,
+                segments=cached_segments,
+                offset_map=offset_map,
+                audio_seconds=audio_seconds,
+                emit=emit
+            )
+
+            if not result['success']:
+                raise ValueError("STT 처리 실패")
+
+            # 실제로 저장된 meeting_id
+            actual_meeting_id = result['meeting_id']
+
+            # 임시 오디오 파일 삭제
+            self.cleanup_temp_files(temp_audio_path, trimmed_audio_path)
+            temp_audio_path = None
+            trimmed_audio_path = None
+
+            # Step 4~5: 청크 임베딩 / 요약 → 마인드맵 (의존 그래프로 병렬 처리)
+            self.run_post_stt_pipeline(actual_meeting_id, emit)
+
+            # Action Item 추출, 신뢰도 낮은 구간 재인식은 별도 작업으로 등록 (노트는 바로 열람 가능)
+            try:
+                self.schedule_action_items(actual_meeting_id, owner_id)
+            except Exception as e:
+                print(f"⚠️ Action Item 추출 작업 등록 실패: {e}")
+            try:
+                self.schedule_refinement(actual_meeting_id, owner_id, result['stt_model'] or stt_model)
+            except Exception as e:
+                print(f"⚠️ 재인식 작업 등록 실패: {e}")
+
+            # Step 6: 완료
+            redirect_url = f"/view/{actual_meeting_id}"
+            emit('complete', '노트 생성이 완료되었습니다!', redirect=redirect_url, icon='✅')
+
+            return {
+                'meeting_id': actual_meeting_id,
+                'redirect': redirect_url
+            }
+
+        finally:
+            # 임시 파일 정리
+            self.cleanup_temp_files(temp_audio_path, trimmed_audio_path)
+
     def cleanup_temp_files(self, *file_paths):
         """
         임시 파일 삭제
@@ -433,3 +996,16 @@ class UploadService:
 
 # 싱글톤 인스턴스
 upload_service = UploadService()
+job_service.register_handler('upload', upload_service.run_upload_job)
+job_service.register_handler(
+    'action_items',
+    upload_service.run_action_item_job,
+    worker_count=config.AGENT_JOB_WORKER_COUNT,
+    retries=config.AGENT_JOB_RETRIES,
+    retry_delay_seconds=config.AGENT_JOB_RETRY_DELAY_SECONDS
+)
+job_service.register_handler(
+    'stt_refine',
+    upload_service.run_refine_job,
+    worker_count=config.STT_REFINE_JOB_WORKER_COUNT
+)
@@ -29,6 +29,12 @@ document.addEventListener('DOMContentLoaded', () => {
     let timerInterval = null;
     let recordedBlob = null;
 
+    // 실시간 인식 세션 (녹음 중 조각을 서버로 보내 미리 인식)
+    let liveSessionId = null;
+    let liveSeq = 0;
+    let liveFailed = false;
+    let liveUploadChain = Promise.resolve();
+
     // DOM 요소 (마이크)
     const btnStartMic = document.getElementById('btn-start-mic');
     const btnStopMic = document.getElementById('btn-stop-mic');
@@ -74,12 +80,16 @@ document.addEventListener('DOMContentLoaded', () => {
             }
             
             console.log(`녹화 모드: ${type}, MIME: ${mimeType}`);
+
+            // 실시간 인식 세션 시작 (실패하면 녹음 종료 후 전체 파일 업로드로 처리)
+            const timeslice = await startLiveSession(type, mimeType);
             
             mediaRecorder = new MediaRecorder(stream, { mimeType });
 
             mediaRecorder.ondataavailable = (event) => {
                 if (event.data.size > 0) {
                     audioChunks.push(event.data);
+                    queueLiveChunk(event.data, type);
                 }
             };
 
@@ -140,7 +150,7 @@ document.addEventListener('DOMContentLoaded', () => {
             startTimer(type === 'mic' ? micTimer : sysTimer);
 
             // 녹음 시작
-            mediaRecorder.start(1000); // 1초마다 데이터 청크 생성
+            mediaRecorder.start(timeslice); // 실시간 인식 주기마다 데이터 청크 생성
 
             // UI 업데이트
             updateUIState(type, true);
@@ -151,6 +161,69 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
 
+    // === 실시간 인식 (녹음 중 조각 업로드) ===
+    async function startLiveSession(type, mimeType) {
+        liveSessionId = null;
+        liveSeq = 0;
+        liveFailed = false;
+        liveUploadChain = Promise.resolve();
+
+        // WebM만 서버에서 이어 붙여 인식 가능
+        if (!mimeType.includes('webm')) return 1000;
+
+        try {
+            const response = await fetch('/api/live/start', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ mode: type })
+            });
+            const data = await response.json();
+            if (!data.success) throw new Error(data.error);
+            liveSessionId = data.session_id;
+            return data.slice_ms;
+        } catch (err) {
+            console.warn('실시간 인식 세션 시작 실패 (녹음 후 전체 업로드로 처리):', err);
+            return 1000;
+        }
+    }
+
+    function queueLiveChunk(blob, type) {
+        if (!liveSessionId || liveFailed) return;
+
+        const seq = liveSeq++;
+        const statusText = type === 'mic' ? micStatus : sysStatus;
+
+        // 조각은 순서대로 하나씩 전송 (서버는 받은 순서대로 파일에 이어 붙임)
+        liveUploadChain = liveUploadChain.then(async () => {
+            if (liveFailed) return;
+            try {
+                const formData = new FormData();
+                formData.append('seq', seq);
+                formData.append('chunk', blob, `chunk_${seq}.webm`);
+
+                const response = await fetch(`/api/live/${liveSessionId}/chunk`, {
+                    method: 'POST',
+                    body: formData
+                });
+                const data = await response.json();
+                if (!data.success) throw new Error(data.error);
+
+                if (mediaRecorder && mediaRecorder.state === 'recording' && data.segment_count > 0) {
+                    statusText.textContent = `녹음 중... (실시간 인식 ${data.segment_count}문장)`;
+                }
+            } catch (err) {
+                console.warn('녹음 조각 전송 실패 (녹음 후 전체 업로드로 처리):', err);
+                liveFailed = true;
+            }
+        });
+    }
+
+    function discardLiveSession() {
+        if (!liveSessionId) return;
+        fetch(`/api/live/${liveSessionId}`, { method: 'DELETE' }).catch(() => {});
+        liveSessionId = null;
+    }
+
     // === 마이크 녹음 시작 ===
     btnStartMic.addEventListener('click', async () => {
         try {
@@ -345,6 +418,7 @@ document.addEventListener('DOMContentLoaded', () => {
             uploadSection.style.display = 'none';
             audioChunks = [];
             recordedBlob = null;
+            discardLiveSession();
             // 타이머 초기화
             micTimer.textContent = '00:00:00';
             sysTimer.textContent = '00:00:00';
@@ -363,6 +437,35 @@ document.addEventListener('DOMContentLoaded', () => {
             return;
         }
 
+        btnUpload.disabled = true;
+        btnUpload.textContent = '분석 중... (잠시만 기다려주세요)';
+
+        // 녹음 중 조각을 모두 보냈으면 마지막 구간만 인식 (실패 시 전체 파일 업로드)
+        if (liveSessionId) {
+            await liveUploadChain;
+            const sessionId = liveSessionId;
+            liveSessionId = null;
+
+            if (!liveFailed) {
+                const formData = new FormData();
+                formData.append('title', title);
+                formData.append('chunk_count', liveSeq);
+
+                try {
+                    const response = await fetch(`/api/live/${sessionId}/finish`, {
+                        method: 'POST',
+                        body: formData
+                    });
+                    if (response.ok && await readEventStream(response, false)) return;
+                } catch (err) {
+                    console.warn('실시간 인식 노트 생성 실패, 전체 파일로 다시 처리합니다:', err);
+                }
+            } else {
+                fetch(`/api/live/${sessionId}`, { method: 'DELETE' }).catch(() => {});
+            }
+            btnUpload.textContent = '녹음 파일 전체를 다시 분석하는 중...';
+        }
+
         // 현재 활성화된 탭 확인 (파일명 접두어 결정을 위해)
         const activeTab = document.querySelector('.tab-button.active');
         const isSystemRecord = activeTab && activeTab.dataset.tab === 'system-tab';
@@ -392,73 +495,13 @@ document.addEventListener('DOMContentLoaded', () => {
         formData.append('audio_file', recordedBlob, filename);
         formData.append('title', title);
 
-        btnUpload.disabled = true;
-        btnUpload.textContent = '분석 중... (잠시만 기다려주세요)';
-
         try {
             const response = await fetch('/upload', {
                 method: 'POST',
                 body: formData
             });
 
-            const reader = response.body.getReader();
-            const decoder = new TextDecoder();
-            let redirectUrl = null;
-            let isCompleted = false;
-
-            while (true) {
-                const { value, done } = await reader.read();
-                if (done) break;
-                
-                const chunk = decoder.decode(value, { stream: true });
-                // SSE 메시지는 'data: ... \n\n' 형태로 옴. 여러 메시지가 한 번에 올 수도 있음.
-                const lines = chunk.split('\n\n');
-                
-                for (const line of lines) {
-                    const trimmedLine = line.trim();
-                    if (trimmedLine.startsWith('data: ')) {
-                        try {
-                            const jsonStr = trimmedLine.substring(6);
-                            const data = JSON.parse(jsonStr);
-                            console.log('Server Event:', data);
-                            
-                            // 버튼에 진행상황 표시
-                            if (data.message) {
-                                btnUpload.textContent = data.message;
-                            }
-
-                            if (data.step === 'complete' && data.redirect) {
-                                redirectUrl = data.redirect;
-                                isCompleted = true;
-                            }
-                            
-                            if (data.step === 'error') {
-                                alert('서버 오류: ' + data.message);
-                                btnUpload.disabled = false;
-                                btnUpload.textContent = '다시 시도';
-                                return;
-                            }
-
-                        } catch (e) {
-                            console.warn('JSON 파싱 에러:', e, trimmedLine);
-                        }
-                    }
-                }
-            }
-
-            if (isCompleted && redirectUrl) {
-                window.location.href = redirectUrl;
-            } else {
-                // 완료되었으나 URL이 없는 경우 (거의 없겠지만)
-                if (isCompleted) {
-                     alert('완료되었으나 이동할 주소를 찾지 못했습니다. 메인으로 이동합니다.');
-                     window.location.href = '/';
-                } else {
-                     // 스트림이 끊겼거나 알 수 없는 종료
-                     alert('서버 연결이 종료되었습니다.');
-                     btnUpload.disabled = false;
-                }
-            }
+            await readEventStream(response, true);
 
         } catch (err) {
             console.error('업로드 에러:', err);
@@ -467,4 +510,73 @@ document.addEventListener('DOMContentLoaded', () => {
             btnUpload.textContent = '분석 시작하기';
         }
     });
+
+    // === 진행 상황(SSE) 수신 ===
+    // 완료되어 이동하면 true, 오류/연결 종료 시 false (reportErrors가 false면 알림 없이 반환)
+    async function readEventStream(response, reportErrors) {
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let redirectUrl = null;
+        let isCompleted = false;
+
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            
+            const chunk = decoder.decode(value, { stream: true });
+            // SSE 메시지는 'data: ... \n\n' 형태로 옴. 여러 메시지가 한 번에 올 수도 있음.
+            const lines = chunk.split('\n\n');
+            
+            for (const line of lines) {
+                // 작업 이벤트는 'id: N' 줄 다음에 'data: ...' 줄이 옴
+                const dataLine = line.split('\n').find(l => l.trim().startsWith('data: '));
+                const trimmedLine = dataLine ? dataLine.trim() : '';
+                if (trimmedLine.startsWith('data: ')) {
+                    try {
+                        const jsonStr = trimmedLine.substring(6);
+                        const data = JSON.parse(jsonStr);
+                        console.log('Server Event:', data);
+                        
+                        // 버튼에 진행상황 표시
+                        if (data.message) {
+                            btnUpload.textContent = data.message;
+                        }
+
+                        if (data.step === 'complete' && data.redirect) {
+                            redirectUrl = data.redirect;
+                            isCompleted = true;
+                        }
+                        
+                        if (data.step === 'error') {
+                            if (!reportErrors) return false;
+                            alert('서버 오류: ' + data.message);
+                            btnUpload.disabled = false;
+                            btnUpload.textContent = '다시 시도';
+                            return false;
+                        }
+
+                    } catch (e) {
+                        console.warn('JSON 파싱 에러:', e, trimmedLine);
+                    }
+                }
+            }
+        }
+
+        if (isCompleted && redirectUrl) {
+            window.location.href = redirectUrl;
+            return true;
+        } else {
+            // 완료되었으나 URL이 없는 경우 (거의 없겠지만)
+            if (isCompleted) {
+                 alert('완료되었으나 이동할 주소를 찾지 못했습니다. 메인으로 이동합니다.');
+                 window.location.href = '/';
+                 return true;
+            } else if (reportErrors) {
+                 // 스트림이 끊겼거나 알 수 없는 종료
+                 alert('서버 연결이 종료되었습니다.');
+                 btnUpload.disabled = false;
+            }
+            return false;
+        }
+    }
 });
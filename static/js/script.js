@@ -468,6 +468,8 @@ document.addEventListener('DOMContentLoaded', () => {
             // === 중복 방지: 업로드 시작 ===
             sessionStorage.setItem('upload_in_progress', 'true');
             sessionStorage.setItem('upload_start_time', Date.now().toString());
+            sessionStorage.removeItem('upload_job_id');
+            sessionStorage.removeItem('upload_job_event_id');
 
             // 새로고침 경고 설정
             window.addEventListener('beforeunload', beforeUnloadHandler);
@@ -512,20 +514,37 @@ document.addEventListener('DOMContentLoaded', () => {
                     if (done) break;
 
                     buffer += decoder.decode(value, { stream: true });
-                    const lines = buffer.split('\n\n');
-                    buffer = lines.pop() || ''; // 마지막 불완전한 줄은 buffer에 유지
-
-                    for (const line of lines) {
-                        if (line.startsWith('data: ')) {
-                            const data = JSON.parse(line.substring(6));
-                            handleSSEMessage(data);
+                    const events = buffer.split('\n\n');
+                    buffer = events.pop() || ''; // 마지막 불완전한 이벤트는 buffer에 유지
+
+                    for (const event of events) {
+                        // SSE 이벤트는 "id: N" 줄과 "data: {...}" 줄로 구성
+                        for (const line of event.split('\n')) {
+                            if (line.startsWith('id: ')) {
+                                sessionStorage.setItem('upload_job_event_id', line.substring(4));
+                            } else if (line.startsWith('data: ')) {
+                                const data = JSON.parse(line.substring(6));
+                                handleSSEMessage(data);
+                            }
                         }
                     }
                 }
 
+                // 완료/오류 이벤트 없이 연결이 끊긴 경우 작업 스트림 재구독
+                if (sessionStorage.getItem('upload_job_id')) {
+                    resumeJobStream(sessionStorage.getItem('upload_job_id'));
+                }
+
             } catch (error) {
                 console.error('업로드 중 오류:', error);
 
+                // 작업이 이미 등록되었다면 서버에서 계속 처리 중이므로 재구독
+                const jobId = sessionStorage.getItem('upload_job_id');
+                if (jobId) {
+                    resumeJobStream(jobId);
+                    return;
+                }
+
                 // 모달에 오류 표시 (handleSSEMessage의 error 케이스와 동일한 방식)
                 handleSSEMessage({
                     step: 'error',
@@ -534,6 +553,30 @@ document.addEventListener('DOMContentLoaded', () => {
             }
         });
 
+        // 백그라운드 작업 진행 상황 재구독 (연결 끊김 시)
+        function resumeJobStream(jobId) {
+            const lastEventId = sessionStorage.getItem('upload_job_event_id') || '0';
+            const source = new EventSource(`/api/jobs/${jobId}/stream?after=${lastEventId}`);
+
+            source.onmessage = (event) => {
+                if (event.lastEventId) {
+                    sessionStorage.setItem('upload_job_event_id', event.lastEventId);
+                }
+                const data = JSON.parse(event.data);
+                handleSSEMessage(data);
+                if (data.step === 'complete' || data.step === 'error') {
+                    source.close();
+                }
+            };
+
+            source.onerror = () => {
+                // EventSource는 자동 재연결하므로 작업이 끝난 경우에만 종료
+                if (!sessionStorage.getItem('upload_job_id')) {
+                    source.close();
+                }
+            };
+        }
+
         // SSE 메시지 처리 함수
         function handleSSEMessage(data) {
             const progressStatus = document.getElementById('progress-status');
@@ -543,6 +586,27 @@ document.addEventListener('DOMContentLoaded', () => {
             const stepSummary = document.getElementById('step-summary');
             const stepMindmap = document.getElementById('step-mindmap');
 
+            // 작업 ID 저장 (연결이 끊겨도 재구독할 수 있도록)
+            if (data.job_id) {
+                sessionStorage.setItem('upload_job_id', data.job_id);
+            }
+            if (data.step === 'complete' || data.step === 'error') {
+                sessionStorage.removeItem('upload_job_id');
+                sessionStorage.removeItem('upload_job_event_id');
+            }
+
+            // STT 후처리 세부 단계 진행 / ffmpeg 대기 순서 (단계 표시는 유지하고 메시지만 갱신)
+            if (data.step === 'stage' || data.step === 'queue') {
+                if (progressStatus) progressStatus.textContent = data.message;
+                return;
+            }
+
+            // 스트리밍 STT로 인식된 최신 발화와 누적 세그먼트 수 표시
+            if (data.step === 'segment') {
+                if (progressStatus) progressStatus.textContent = `(${data.segment_count}) ${data.message}`;
+                return;
+            }
+
             // 모든 단계의 active만 제거 (completed는 유지!)
             [stepUpload, stepSTT, stepSummary, stepMindmap].forEach(el => {
                 if (el) el.classList.remove('active');
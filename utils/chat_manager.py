@@ -1,9 +1,12 @@
 import os
 import re
+import time
 import logging
-from google import genai
+from concurrent.futures import ThreadPoolExecutor
 
 from config import config
+from utils.llm_gateway import llm_gateway, estimate_tokens
+from utils.model_router import model_router
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +15,7 @@ class ChatManager:
     """
     회의록 기반 챗봇 매니저
     SelfQueryRetriever를 사용하여 관련 문서를 검색하고,
-    Gemini 2.5 Flash로 답변을 생성합니다.
+    Gemini로 답변을 생성합니다. (모델은 MODEL_ROUTES['chat'])
     """
     _instance = None
     _initialized = False
@@ -30,7 +33,7 @@ class ChatManager:
             vector_db_manager (VectorDBManager, optional): 벡터 DB 매니저 인스턴스.
                                                           None이면 자동으로 VectorDBManager() 생성.
             retriever_type (str, optional): 검색 리트리버 타입.
-                                            "similarity", "mmr", "self_query", "similarity_score_threshold" 중 선택.
+                                            "similarity", "mmr", "self_query", "similarity_score_threshold", "hybrid" 중 선택.
                                             Defaults to "similarity".
         """
         # vector_db_manager가 None이면 자동 생성 (Singleton이므로 항상 같은 인스턴스)
@@ -46,8 +49,7 @@ class ChatManager:
         if not api_key:
             raise ValueError("GOOGLE_API_KEY가 .env 파일에 설정되지 않았습니다.")
 
-        self.gemini_client = genai.Client(api_key=api_key)
-        self.model_name = "gemini-2.5-flash"
+        self.gemini_client = llm_gateway.gemini_client()
 
         logger.info(f"✅ ChatManager 초기화 완료: retriever_type='{self.retriever_type}'")
 
@@ -55,162 +57,75 @@ class ChatManager:
 
     def search_documents(self, query: str, meeting_id: str = None, accessible_meeting_ids: list = None) -> dict:
         """
-        meeting_chunks와 meeting_subtopic에서 각각 3개씩 검색
+        meeting_chunks와 meeting_subtopic에서 각각 SEARCH_RESULTS_PER_COLLECTION개씩 검색
+        접근 제한은 Vector DB의 meeting_id 필터로 적용하므로 필요한 개수만 조회합니다.
+        질의는 한 번만 임베딩하고 두 컬렉션을 동시에 검색합니다.
 
         Args:
             query (str): 사용자 질문
             meeting_id (str, optional): 특정 회의로 제한할 경우
             accessible_meeting_ids (list, optional): 사용자가 접근 가능한 meeting_id 목록
+                                                     (None이면 제한 없음 - admin 전체 검색)
 
         Returns:
             dict: {
                 "chunks": [Document, ...],
                 "subtopics": [Document, ...],
-                "total_count": int
+                "total_count": int,
+                "timings": {"embed_seconds", "chunks_seconds", "subtopic_seconds", "search_seconds"} (DEBUG 모드만)
             }
         """
-        # title 키워드 필터링 비활성화
+        # title 키워드 필터링은 사용하지 않음
         # 이유: Similarity search가 이미 의미론적으로 관련된 문서를 찾아주므로,
         #       단순한 키워드 추출로 오히려 좋은 결과를 제거할 수 있음
-        title_keywords = []
-
-        # (참고) 필요시 특정 패턴만 추출하도록 개선 가능:
-        # - 고유명사 (예: "사자회담")
-        # - 따옴표로 묶인 단어
-        # - NLP 기반 주제어 추출
-
-        if meeting_id:
-            # 특정 노트로 제한 (검색 후 필터링)
-            pass  # filter_criteria는 None으로 유지, 검색 후 meeting_id로 필터링
-        elif accessible_meeting_ids:
-            # 접근 가능한 노트들로 제한 (여러 노트에서 검색)
-            # Vector DB가 $in 연산자를 지원하지 않을 수 있으므로, 각 노트별로 검색 후 결합
-            logger.info(f"🔍 {len(accessible_meeting_ids)}개 노트에서 검색 중...")
-            all_chunks = []
-            all_subtopics = []
-
-            # 설정된 retriever_type 사용
-            try:
-                chunk_result = self.vdb_manager.search(
-                    db_type="chunks",
-                    query=query,
-                    k=len(accessible_meeting_ids) * 10,  # 넉넉하게 검색
-                    retriever_type=self.retriever_type,
-                    filter_criteria=None
-                )
-                # 접근 가능한 meeting_id로 필터링
-                all_chunks = [doc for doc in chunk_result
-                             if doc.metadata.get('meeting_id') in accessible_meeting_ids]
-
-                subtopic_result = self.vdb_manager.search(
-                    db_type="subtopic",
-                    query=query,
-                    k=len(accessible_meeting_ids) * 10,  # 넉넉하게 검색
-                    retriever_type=self.retriever_type,
-                    filter_criteria=None
-                )
-                # 접근 가능한 meeting_id로 필터링
-                all_subtopics = [doc for doc in subtopic_result
-                                if doc.metadata.get('meeting_id') in accessible_meeting_ids]
-
-                # title 키워드로 부분 일치 필터링
-                if title_keywords:
-                    logger.info(f"📌 title 필터링 적용: {title_keywords}")
-                    filtered_chunks = []
-                    for doc in all_chunks:
-                        doc_title = doc.metadata.get('title', '').lower()
-                        if any(keyword.lower() in doc_title for keyword in title_keywords):
-                            filtered_chunks.append(doc)
-
-                    filtered_subtopics = []
-                    for doc in all_subtopics:
-                        doc_title = doc.metadata.get('meeting_title', '').lower()
-                        if any(keyword.lower() in doc_title for keyword in title_keywords):
-                            filtered_subtopics.append(doc)
-
-                    logger.debug(f"   필터링 전: chunks={len(all_chunks)}, subtopic={len(all_subtopics)}")
-                    logger.debug(f"   필터링 후: chunks={len(filtered_chunks)}, subtopic={len(filtered_subtopics)}")
-
-                    all_chunks = filtered_chunks
-                    all_subtopics = filtered_subtopics
-
-            except Exception as e:
-                # 검색 실패 시 빈 결과 반환
-                logger.warning(f"⚠️ 검색 실패: {e}")
-                all_chunks = []
-                all_subtopics = []
-
-            # 상위 3개씩만 선택
-            chunks_results = all_chunks[:3]
-            subtopic_results = all_subtopics[:3]
-
-            logger.info(f"✅ 검색 완료: chunks={len(chunks_results)}개, subtopic={len(subtopic_results)}개")
+        # (참고) 필요시 고유명사, 따옴표로 묶인 단어 등만 추출하여 필터로 추가 가능
 
-            return {
-                "chunks": chunks_results,
-                "subtopics": subtopic_results,
-                "total_count": len(chunks_results) + len(subtopic_results)
-            }
+        meeting_ids = [meeting_id] if meeting_id else accessible_meeting_ids
+        if meeting_ids is not None:
+            logger.info(f"🔍 {len(meeting_ids)}개 노트에서 검색 중...")
 
-        try:
-            # 단일 노트 검색 또는 전체 검색
-            # 설정된 retriever_type 사용
-            chunks_results = self.vdb_manager.search(
-                db_type="chunks",
-                query=query,
-                k=20 if meeting_id else 10,  # 넉넉하게 검색 후 필터링
-                retriever_type=self.retriever_type,
-                filter_criteria=None
-            )
+        started_at = time.monotonic()
+        timings = {}
 
-            subtopic_results = self.vdb_manager.search(
-                db_type="subtopic",
+        def timed_search(db_type, embedding):
+            begin = time.monotonic()
+            results = self.vdb_manager.search_meetings(
+                db_type=db_type,
                 query=query,
-                k=20 if meeting_id else 10,  # 넉넉하게 검색 후 필터링
+                k=config.SEARCH_RESULTS_PER_COLLECTION,
+                meeting_ids=meeting_ids,
                 retriever_type=self.retriever_type,
-                filter_criteria=None
+                embedding=embedding
             )
+            timings[f"{db_type}_seconds"] = round(time.monotonic() - begin, 3)
+            return results
 
-            # meeting_id가 지정된 경우, 해당 노트로 필터링
-            if meeting_id:
-                chunks_results = [doc for doc in chunks_results
-                                 if doc.metadata.get('meeting_id') == meeting_id]
-                subtopic_results = [doc for doc in subtopic_results
-                                   if doc.metadata.get('meeting_id') == meeting_id]
-
-            # title 키워드로 부분 일치 필터링
-            if title_keywords:
-                logger.info(f"📌 title 필터링 적용: {title_keywords}")
-                filtered_chunks = []
-                for doc in chunks_results:
-                    doc_title = doc.metadata.get('title', '').lower()
-                    # 키워드 중 하나라도 title에 포함되면 선택
-                    if any(keyword.lower() in doc_title for keyword in title_keywords):
-                        filtered_chunks.append(doc)
-
-                filtered_subtopics = []
-                for doc in subtopic_results:
-                    doc_title = doc.metadata.get('meeting_title', '').lower()
-                    if any(keyword.lower() in doc_title for keyword in title_keywords):
-                        filtered_subtopics.append(doc)
-
-                logger.debug(f"   필터링 전: chunks={len(chunks_results)}, subtopic={len(subtopic_results)}")
-                logger.debug(f"   필터링 후: chunks={len(filtered_chunks)}, subtopic={len(filtered_subtopics)}")
-
-                chunks_results = filtered_chunks
-                subtopic_results = filtered_subtopics
-
-            # 상위 3개만 선택
-            chunks_results = chunks_results[:3]
-            subtopic_results = subtopic_results[:3]
-
-            logger.info(f"✅ 검색 완료: chunks={len(chunks_results)}개, subtopic={len(subtopic_results)}개")
-
-            return {
+        try:
+            # 질의 임베딩 1회 (두 컬렉션이 같은 벡터로 검색)
+            embedding = None
+            if meeting_ids != [] and self.retriever_type in self.vdb_manager.EMBEDDING_RETRIEVER_TYPES:
+                embedding = self.vdb_manager.embed_query(query)
+            timings["embed_seconds"] = round(time.monotonic() - started_at, 3)
+
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                chunks_future = executor.submit(timed_search, "chunks", embedding)
+                subtopic_future = executor.submit(timed_search, "subtopic", embedding)
+                chunks_results = chunks_future.result()
+                subtopic_results = subtopic_future.result()
+            timings["search_seconds"] = round(time.monotonic() - started_at, 3)
+
+            logger.info(f"✅ 검색 완료: chunks={len(chunks_results)}개, subtopic={len(subtopic_results)}개 "
+                        f"({timings['search_seconds']}초)")
+            logger.debug(f"   검색 단계별 시간: {timings}")
+
+            search_results = {
                 "chunks": chunks_results,
                 "subtopics": subtopic_results,
                 "total_count": len(chunks_results) + len(subtopic_results)
             }
+            if config.DEBUG:
+                search_results["timings"] = timings
+            return search_results
 
         except Exception as e:
             logger.error(f"❌ 문서 검색 중 오류: {e}")
@@ -270,7 +185,7 @@ class ChatManager:
 
     def generate_answer(self, query: str, context: str) -> dict:
         """
-        Gemini 2.5 Flash를 사용하여 답변 생성
+        Gemini를 사용하여 답변 생성
 
         Args:
             query (str): 사용자 질문
@@ -310,10 +225,13 @@ class ChatManager:
 """
 
         try:
-            # Gemini 2.5 Flash로 답변 생성
-            response = self.gemini_client.models.generate_content(
-                model=self.model_name,
-                contents=prompt
+            # Gemini로 답변 생성 (입력 길이에 따라 모델 선택)
+            input_tokens = estimate_tokens(prompt)
+            response = llm_gateway.generate_content(
+                model=model_router.route("chat", input_tokens=input_tokens),
+                contents=prompt,
+                estimated_tokens=input_tokens,
+                task="chat"
             )
 
             answer = response.text.strip()
@@ -347,7 +265,8 @@ class ChatManager:
                 "success": bool,
                 "answer": str,
                 "sources": list,
-                "error": str (optional)
+                "error": str (optional),
+                "timings": dict (DEBUG 모드만 - 검색 단계별 시간 + answer_seconds)
             }
         """
         logger.info(f"🤖 챗봇 질의 처리 시작: '{query}'")
@@ -355,18 +274,26 @@ class ChatManager:
         # 1. 관련 문서 검색
         search_results = self.search_documents(query, meeting_id, accessible_meeting_ids)
 
+        timings = search_results.get("timings")
+
         if search_results["total_count"] == 0:
-            return {
+            response = {
                 "success": True,
                 "answer": "죄송합니다. 해당 질문과 관련된 회의록 내용을 찾을 수 없습니다.",
                 "sources": []
             }
+            if timings is not None:
+                response["timings"] = timings
+            return response
 
         # 2. 컨텍스트 포맷팅
         context = self.format_context(search_results)
 
         # 3. 답변 생성
+        answer_started_at = time.monotonic()
         result = self.generate_answer(query, context)
+        if timings is not None:
+            timings["answer_seconds"] = round(time.monotonic() - answer_started_at, 3)
 
         if not result["success"]:
             return result
@@ -397,8 +324,11 @@ class ChatManager:
                 "main_topic": meta.get("main_topic")
             })
 
-        return {
+        response = {
             "success": True,
             "answer": result["answer"],
             "sources": sources
         }
+        if timings is not None:
+            response["timings"] = timings
+        return response
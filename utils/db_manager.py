@@ -121,12 +121,128 @@ class DatabaseManager:
                 )
             """)
 
-            # 6. 인덱스 생성 (성능 최적화)
+            # 6. processing_jobs 테이블 (백그라운드 작업 큐)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS processing_jobs (
+                    job_id TEXT PRIMARY KEY,
+                    job_type TEXT NOT NULL,
+                    owner_id INTEGER,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    current_step TEXT,
+                    payload TEXT,
+                    result TEXT,
+                    error TEXT,
+                    attempts INTEGER DEFAULT 0,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            # 7. processing_job_events 테이블 (작업 단계별 진행 기록)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS processing_job_events (
+                    event_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id TEXT NOT NULL,
+                    step TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            # 8. stt_cache 테이블 (동일 파일 재업로드 시 STT 결과 재사용)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS stt_cache (
+                    content_hash TEXT NOT NULL,
+                    prompt_version TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    segments TEXT NOT NULL,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (content_hash, prompt_version, model)
+                )
+            """)
+
+            # 9. meeting_action_items 테이블 (Action Item 추출 결과)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS meeting_action_items (
+                    meeting_id TEXT PRIMARY KEY,
+                    owner_id INTEGER,
+                    items TEXT NOT NULL,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            # 10. llm_cache 테이블 (요약/회의록/마인드맵 LLM 응답 재사용)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    model TEXT NOT NULL,
+                    prompt_name TEXT NOT NULL,
+                    prompt_version TEXT NOT NULL,
+                    input_hash TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    last_used_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (model, prompt_name, prompt_version, input_hash)
+                )
+            """)
+
+            # 11. embedding_cache 테이블 (같은 텍스트의 임베딩 벡터 재사용)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                    model TEXT NOT NULL,
+                    text_hash TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    last_used_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (model, text_hash)
+                )
+            """)
+
+            # 12. keyword_docs / keyword_postings 테이블 (하이브리드 검색용 키워드 역색인)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS keyword_docs (
+                    collection TEXT NOT NULL,
+                    doc_id TEXT NOT NULL,
+                    meeting_id TEXT,
+                    length INTEGER NOT NULL,
+                    PRIMARY KEY (collection, doc_id)
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS keyword_postings (
+                    collection TEXT NOT NULL,
+                    term TEXT NOT NULL,
+                    doc_id TEXT NOT NULL,
+                    tf INTEGER NOT NULL,
+                    PRIMARY KEY (collection, term, doc_id)
+                )
+            """)
+
+            # 13. live_sessions 테이블 (진행 중인 실시간 녹음, 서버 재시작 후 남은 녹음 정리용)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS live_sessions (
+                    session_id TEXT PRIMARY KEY,
+                    meeting_id TEXT NOT NULL,
+                    webm_path TEXT NOT NULL,
+                    slice_path TEXT NOT NULL,
+                    owner_id INTEGER,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            # 14. 인덱스 생성 (성능 최적화)
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_meeting_id ON meeting_dialogues(meeting_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_owner_id ON meeting_dialogues(owner_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_audio_file ON meeting_dialogues(audio_file)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_shares_meeting ON meeting_shares(meeting_id)")
-
-            # 7. Admin 사용자 자동 생성
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON processing_jobs(status)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_job_events_job ON processing_job_events(job_id, event_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_used ON llm_cache(last_used_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_embedding_cache_used ON embedding_cache(last_used_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_keyword_docs_meeting ON keyword_docs(collection, meeting_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_keyword_postings_doc ON keyword_postings(collection, doc_id)")
+
+            # 15. Admin 사용자 자동 생성
             from config import config
             admin_emails = config.ADMIN_EMAILS
 
@@ -154,7 +270,7 @@ class DatabaseManager:
         finally:
             conn.close()
 
-    def save_stt_to_db(self, segments, audio_filename, title, meeting_date=None, owner_id=None):
+    def save_stt_to_db(self, segments, audio_filename, title, meeting_date=None, owner_id=None, meeting_id=None):
         """
         음성 인식 결과를 데이터베이스에 저장합니다.
 
@@ -165,11 +281,14 @@ class DatabaseManager:
             meeting_date (str, optional): 회의 일시 (형식: "YYYY-MM-DD HH:MM:SS")
                                           제공되지 않으면 현재 시간 사용
             owner_id (int, optional): 회의 소유자 ID
+            meeting_id (str, optional): 스트리밍 중 append_stt_segment로 먼저 저장한 회의 ID
+                                        주어지면 기존 세그먼트를 최종 결과로 한 트랜잭션에서 교체
 
         Returns:
             str: 생성된 meeting_id
         """
-        meeting_id = str(uuid.uuid4())
+        if meeting_id is None:
+            meeting_id = str(uuid.uuid4())
 
         # meeting_date가 제공되지 않으면 현재 시간 사용
         if meeting_date is None:
@@ -177,6 +296,7 @@ class DatabaseManager:
 
         conn = self._get_connection()
         cursor = conn.cursor()
+        cursor.execute("DELETE FROM meeting_dialogues WHERE meeting_id = ?", (meeting_id,))
         for segment in segments:
             cursor.execute("""
                 INSERT INTO meeting_dialogues
@@ -191,6 +311,112 @@ class DatabaseManager:
         logger.info(f"✅ DB 저장 완료: meeting_id={meeting_id}, owner_id={owner_id}, meeting_date={meeting_date}")
         return meeting_id
 
+    def append_stt_segment(self, meeting_id, segment, audio_filename, title, meeting_date, owner_id=None):
+        """
+        스트리밍 STT 중 완성된 세그먼트 하나를 즉시 저장합니다.
+        인식이 끝나면 save_stt_to_db(meeting_id=...)가 최종 결과로 교체합니다.
+
+        Args:
+            meeting_id (str): 미리 발급한 회의 ID
+            segment (dict): 정규화된 세그먼트 (speaker, start_time, text, confidence)
+            audio_filename (str): 오디오 파일명
+            title (str): 회의 제목
+            meeting_date (str): 회의 일시 (형식: "YYYY-MM-DD HH:MM:SS")
+            owner_id (int, optional): 회의 소유자 ID
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO meeting_dialogues
+            (meeting_id, meeting_date, speaker_label, start_time, segment, confidence, audio_file, title, owner_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            meeting_id, meeting_date, str(segment['speaker']), segment['start_time'],
+            segment['text'], segment['confidence'], audio_filename, title, owner_id
+        ))
+        conn.commit()
+        conn.close()
+
+    def delete_stt_segments(self, meeting_id):
+        """
+        회의의 STT 세그먼트만 삭제합니다. (스트리밍 STT 실패 시 부분 저장분 정리용)
+
+        Args:
+            meeting_id (str): 회의 ID
+
+        Returns:
+            int: 삭제된 세그먼트 수
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM meeting_dialogues WHERE meeting_id = ?", (meeting_id,))
+        deleted = cursor.rowcount
+        conn.commit()
+        conn.close()
+        return deleted
+
+    def replace_stt_segments(self, meeting_id, replacements):
+        """
+        회의의 일부 세그먼트를 새 인식 결과로 교체합니다. (재인식 구간, 한 트랜잭션)
+        기존 행을 순서대로 UPDATE하고, 새 세그먼트가 더 많으면 INSERT, 더 적으면 남는 행을 DELETE 합니다.
+
+        Args:
+            meeting_id (str): 회의 ID
+            replacements (list): [(기존 segment_id 목록, 새 세그먼트 목록), ...]
+                                 새 세그먼트는 정규화된 형식 (speaker, start_time, text, confidence)
+
+        Returns:
+            int: 교체된 구간 수
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        replaced = 0
+        try:
+            for segment_ids, new_segments in replacements:
+                if not segment_ids:
+                    continue
+                cursor.execute(
+                    "SELECT meeting_date, audio_file, title, owner_id FROM meeting_dialogues "
+                    "WHERE meeting_id = ? AND segment_id = ?",
+                    (meeting_id, segment_ids[0])
+                )
+                row = cursor.fetchone()
+                if row is None:
+                    # 재인식 중 회의가 삭제/재처리된 경우
+                    continue
+
+                for segment_id, segment in zip(segment_ids, new_segments):
+                    cursor.execute("""
+                        UPDATE meeting_dialogues
+                        SET speaker_label = ?, start_time = ?, segment = ?, confidence = ?
+                        WHERE meeting_id = ? AND segment_id = ?
+                    """, (
+                        str(segment['speaker']), segment['start_time'], segment['text'],
+                        segment['confidence'], meeting_id, segment_id
+                    ))
+                for segment in new_segments[len(segment_ids):]:
+                    cursor.execute("""
+                        INSERT INTO meeting_dialogues
+                        (meeting_id, meeting_date, speaker_label, start_time, segment, confidence, audio_file, title, owner_id)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (
+                        meeting_id, row['meeting_date'], str(segment['speaker']), segment['start_time'],
+                        segment['text'], segment['confidence'], row['audio_file'], row['title'], row['owner_id']
+                    ))
+                for segment_id in segment_ids[len(new_segments):]:
+                    cursor.execute(
+                        "DELETE FROM meeting_dialogues WHERE meeting_id = ? AND segment_id = ?",
+                        (meeting_id, segment_id)
+                    )
+                replaced += 1
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        return replaced
+
     def get_meeting_by_id(self, meeting_id):
         conn = self._get_connection()
         cursor = conn.cursor()
@@ -425,12 +651,17 @@ class DatabaseManager:
             cursor.execute("DELETE FROM meeting_mindmap WHERE meeting_id = ?", (meeting_id,))
             deleted_mindmap = cursor.rowcount
 
+        # 8. meeting_action_items에서 삭제 수행
+        cursor.execute("DELETE FROM meeting_action_items WHERE meeting_id = ?", (meeting_id,))
+        deleted_action_items = cursor.rowcount
+
         conn.commit()
 
         logger.info(f"[삭제 수행] meeting_dialogues: {deleted_dialogues}개 삭제")
         logger.info(f"[삭제 수행] meeting_minutes: {deleted_minutes}개 삭제")
         logger.info(f"[삭제 수행] meeting_shares: {deleted_shares}개 삭제")
         logger.info(f"[삭제 수행] meeting_mindmap: {deleted_mindmap}개 삭제")
+        logger.info(f"[삭제 수행] meeting_action_items: {deleted_action_items}개 삭제")
 
         logger.info("-" * 70)
 
@@ -475,6 +706,7 @@ class DatabaseManager:
             "minutes": deleted_minutes,
             "shares": deleted_shares,
             "mindmap": deleted_mindmap,
+            "action_items": deleted_action_items,
             "before": {"dialogues": before_dialogues, "minutes": before_minutes, "shares": before_shares, "mindmap": before_mindmap},
             "after": {"dialogues": after_dialogues, "minutes": after_minutes, "shares": after_shares, "mindmap": after_mindmap}
         }
@@ -499,6 +731,24 @@ class DatabaseManager:
             return row['audio_file']
         return None
 
+    def count_meetings_by_audio_file(self, audio_file):
+        """
+        해당 미디어 파일을 참조하는 회의 수를 조회합니다.
+        (동일 내용의 파일은 하나로 저장되므로, 삭제 전 다른 회의의 참조 여부 확인용)
+
+        Args:
+            audio_file (str): 미디어 파일명
+
+        Returns:
+            int: 참조 중인 회의 수
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(DISTINCT meeting_id) as count FROM meeting_dialogues WHERE audio_file = ?", (audio_file,))
+        count = cursor.fetchone()['count']
+        conn.close()
+        return count
+
     def update_meeting_title(self, meeting_id, new_title):
         """
         회의 제목을 업데이트합니다.
@@ -820,3 +1070,575 @@ class DatabaseManager:
             return None
         finally:
             conn.close()
+
+    # ==================== 백그라운드 작업 (processing_jobs) ====================
+
+    def create_job(self, job_id, job_type, payload_json, owner_id=None):
+        """
+        새 백그라운드 작업을 'queued' 상태로 등록합니다.
+
+        Args:
+            job_id (str): 작업 ID
+            job_type (str): 작업 종류 (예: 'upload')
+            payload_json (str): 작업 입력값 (JSON 문자열)
+            owner_id (int, optional): 작업 요청 사용자 ID
+        """
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO processing_jobs (job_id, job_type, owner_id, status, payload, created_at, updated_at)
+            VALUES (?, ?, ?, 'queued', ?, ?, ?)
+        """, (job_id, job_type, owner_id, payload_json, now, now))
+        conn.commit()
+        conn.close()
+
+    def update_job(self, job_id, status=None, current_step=None, result_json=None, error=None, increment_attempts=False):
+        """
+        작업 상태를 갱신합니다. None으로 전달된 항목은 변경하지 않습니다.
+
+        Args:
+            job_id (str): 작업 ID
+            status (str, optional): 'queued' | 'running' | 'completed' | 'failed'
+            current_step (str, optional): 현재 진행 단계
+            result_json (str, optional): 작업 결과 (JSON 문자열)
+            error (str, optional): 오류 메시지
+            increment_attempts (bool): 시도 횟수 1 증가 여부
+        """
+        assignments = ["updated_at = ?"]
+        params = [datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")]
+
+        if status is not None:
+            assignments.append("status = ?")
+            params.append(status)
+        if current_step is not None:
+            assignments.append("current_step = ?")
+            params.append(current_step)
+        if result_json is not None:
+            assignments.append("result = ?")
+            params.append(result_json)
+        if error is not None:
+            assignments.append("error = ?")
+            params.append(error)
+        if increment_attempts:
+            assignments.append("attempts = attempts + 1")
+
+        params.append(job_id)
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(f"UPDATE processing_jobs SET {', '.join(assignments)} WHERE job_id = ?", tuple(params))
+        conn.commit()
+        conn.close()
+
+    def add_job_event(self, job_id, step, data_json):
+        """
+        작업 진행 이벤트를 기록하고 current_step을 함께 갱신합니다.
+
+        Args:
+            job_id (str): 작업 ID
+            step (str): 단계 이름 (예: 'stt', 'summary')
+            data_json (str): SSE로 전달할 이벤트 본문 (JSON 문자열)
+
+        Returns:
+            int: 생성된 event_id
+        """
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO processing_job_events (job_id, step, data, created_at)
+            VALUES (?, ?, ?, ?)
+        """, (job_id, step, data_json, now))
+        event_id = cursor.lastrowid
+        cursor.execute("""
+            UPDATE processing_jobs SET current_step = ?, updated_at = ? WHERE job_id = ?
+        """, (step, now, job_id))
+        conn.commit()
+        conn.close()
+        return event_id
+
+    def get_job(self, job_id):
+        """
+        작업 정보를 조회합니다.
+
+        Args:
+            job_id (str): 작업 ID
+
+        Returns:
+            dict or None: 작업 정보, 없으면 None
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT * FROM processing_jobs WHERE job_id = ?", (job_id,))
+        row = cursor.fetchone()
+        conn.close()
+        return dict(row) if row else None
+
+    def get_job_events(self, job_id, after_event_id=0):
+        """
+        작업 진행 이벤트를 event_id 순서대로 조회합니다.
+
+        Args:
+            job_id (str): 작업 ID
+            after_event_id (int): 이 ID 이후의 이벤트만 조회
+
+        Returns:
+            list: [{'event_id', 'step', 'data', 'created_at'}, ...]
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT event_id, step, data, created_at FROM processing_job_events
+            WHERE job_id = ? AND event_id > ?
+            ORDER BY event_id ASC
+        """, (job_id, after_event_id))
+        rows = cursor.fetchall()
+        conn.close()
+        return [dict(row) for row in rows]
+
+    def get_unfinished_jobs(self):
+        """
+        완료되지 않은('queued' 또는 'running') 작업 목록을 생성 순서대로 조회합니다.
+        서버 재시작 시 작업 큐 복구에 사용됩니다.
+
+        Returns:
+            list: 작업 정보 리스트
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT * FROM processing_jobs
+            WHERE status IN ('queued', 'running')
+            ORDER BY created_at ASC
+        """)
+        rows = cursor.fetchall()
+        conn.close()
+        return [dict(row) for row in rows]
+
+    # ==================== 실시간 녹음 세션 (live_sessions) ====================
+
+    def add_live_session(self, session_id, meeting_id, webm_path, slice_path, owner_id=None):
+        """
+        진행 중인 실시간 녹음 세션을 기록합니다.
+        종료 작업이 등록되거나 세션이 정리되면 delete_live_session으로 지웁니다.
+
+        Args:
+            session_id (str): 세션 ID
+            meeting_id (str): 녹음 중 세그먼트를 저장하는 회의 ID
+            webm_path (str): 녹음 WebM 경로
+            slice_path (str): 구간 인식용 임시 오디오 경로
+            owner_id (int, optional): 녹음 사용자 ID
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT OR REPLACE INTO live_sessions (session_id, meeting_id, webm_path, slice_path, owner_id)
+            VALUES (?, ?, ?, ?, ?)
+        """, (session_id, meeting_id, webm_path, slice_path, owner_id))
+        conn.commit()
+        conn.close()
+
+    def delete_live_session(self, session_id):
+        """
+        실시간 녹음 세션 기록을 삭제합니다.
+
+        Args:
+            session_id (str): 세션 ID
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM live_sessions WHERE session_id = ?", (session_id,))
+        conn.commit()
+        conn.close()
+
+    def get_live_sessions(self):
+        """
+        기록된 실시간 녹음 세션 목록을 조회합니다.
+        서버 시작 시 재시작 전에 끝나지 않은 녹음을 정리하는 데 사용됩니다.
+
+        Returns:
+            list: 세션 정보 리스트
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT * FROM live_sessions ORDER BY created_at ASC")
+        rows = cursor.fetchall()
+        conn.close()
+        return [dict(row) for row in rows]
+
+    # ==================== Action Item (meeting_action_items) ====================
+
+    def save_action_items(self, meeting_id, owner_id, items_json):
+        """
+        Action Item 추출 결과를 저장합니다. (이미 있으면 덮어씀)
+
+        Args:
+            meeting_id (str): 회의 ID
+            owner_id (int): 회의 소유자 ID
+            items_json (str): 처리된 Action Item 리스트 (JSON 문자열)
+        """
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT OR REPLACE INTO meeting_action_items (meeting_id, owner_id, items, created_at)
+            VALUES (?, ?, ?, ?)
+        """, (meeting_id, owner_id, items_json, now))
+        conn.commit()
+        conn.close()
+
+    def get_action_items(self, meeting_id):
+        """
+        회의의 Action Item 추출 결과를 조회합니다.
+
+        Args:
+            meeting_id (str): 회의 ID
+
+        Returns:
+            dict or None: {'items': JSON 문자열, 'created_at'}, 없으면 None
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT items, created_at FROM meeting_action_items WHERE meeting_id = ?", (meeting_id,))
+        row = cursor.fetchone()
+        conn.close()
+        return dict(row) if row else None
+
+    # ==================== STT 결과 캐시 (stt_cache) ====================
+
+    def get_stt_cache(self, content_hash, prompt_version, model):
+        """
+        파일 내용 해시 기준으로 저장된 STT 결과를 조회합니다.
+
+        Args:
+            content_hash (str): 업로드 파일의 SHA-256 해시
+            prompt_version (str): STT 프롬프트 버전
+            model (str): STT 모델명
+
+        Returns:
+            str or None: 정규화된 세그먼트 리스트 (JSON 문자열), 없으면 None
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT segments FROM stt_cache
+            WHERE content_hash = ? AND prompt_version = ? AND model = ?
+        """, (content_hash, prompt_version, model))
+        row = cursor.fetchone()
+        conn.close()
+        return row['segments'] if row else None
+
+    def save_stt_cache(self, content_hash, prompt_version, model, segments_json):
+        """
+        STT 결과를 파일 내용 해시 기준으로 저장합니다. (이미 있으면 덮어씀)
+
+        Args:
+            content_hash (str): 업로드 파일의 SHA-256 해시
+            prompt_version (str): STT 프롬프트 버전
+            model (str): STT 모델명
+            segments_json (str): 정규화된 세그먼트 리스트 (JSON 문자열)
+        """
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT OR REPLACE INTO stt_cache (content_hash, prompt_version, model, segments, created_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, (content_hash, prompt_version, model, segments_json, now))
+        conn.commit()
+        conn.close()
+
+    # ==================== LLM 응답 캐시 (llm_cache) ====================
+
+    def get_llm_cache(self, model, prompt_name, prompt_version, input_hash):
+        """
+        저장된 LLM 응답을 조회하고 마지막 사용 시각을 갱신합니다.
+
+        Args:
+            model (str): LLM 모델명
+            prompt_name (str): 프롬프트 종류 (summary, minutes, mindmap 등)
+            prompt_version (str): 프롬프트 템플릿 버전
+            input_hash (str): 완성된 프롬프트의 SHA-256 해시
+
+        Returns:
+            str or None: 캐시된 응답, 없으면 None
+        """
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        key = (model, prompt_name, prompt_version, input_hash)
+        cursor.execute("""
+            SELECT response FROM llm_cache
+            WHERE model = ? AND prompt_name = ? AND prompt_version = ? AND input_hash = ?
+        """, key)
+        row = cursor.fetchone()
+        if row:
+            cursor.execute("""
+                UPDATE llm_cache SET last_used_at = ?
+                WHERE model = ? AND prompt_name = ? AND prompt_version = ? AND input_hash = ?
+            """, (now,) + key)
+            conn.commit()
+        conn.close()
+        return row['response'] if row else None
+
+    def save_llm_cache(self, model, prompt_name, prompt_version, input_hash, response, max_total_bytes):
+        """
+        LLM 응답을 저장하고, 전체 크기가 한도를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다.
+
+        Args:
+            model (str): LLM 모델명
+            prompt_name (str): 프롬프트 종류 (summary, minutes, mindmap 등)
+            prompt_version (str): 프롬프트 템플릿 버전
+            input_hash (str): 완성된 프롬프트의 SHA-256 해시
+            response (str): LLM 응답
+            max_total_bytes (int): 캐시 전체 크기 한도 (바이트)
+
+        Returns:
+            int: 한도 초과로 삭제된 항목 수
+        """
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        size_bytes = len(response.encode('utf-8'))
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT OR REPLACE INTO llm_cache
+            (model, prompt_name, prompt_version, input_hash, response, size_bytes, created_at, last_used_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, (model, prompt_name, prompt_version, input_hash, response, size_bytes, now, now))
+
+        # 크기 기반 제거 (LRU)
+        cursor.execute("SELECT COALESCE(SUM(size_bytes), 0) AS total FROM llm_cache")
+        excess = cursor.fetchone()['total'] - max_total_bytes
+        evicted = 0
+        if excess > 0:
+            # 방금 저장한 항목은 제외
+            cursor.execute("""
+                SELECT rowid, size_bytes FROM llm_cache
+                WHERE NOT (model = ? AND prompt_name = ? AND prompt_version = ? AND input_hash = ?)
+                ORDER BY last_used_at ASC, created_at ASC
+            """, (model, prompt_name, prompt_version, input_hash))
+            victims = []
+            for row in cursor.fetchall():
+                if excess <= 0:
+                    break
+                victims.append((row['rowid'],))
+                excess -= row['size_bytes']
+            cursor.executemany("DELETE FROM llm_cache WHERE rowid = ?", victims)
+            evicted = len(victims)
+
+        conn.commit()
+        conn.close()
+        if evicted:
+            logger.info(f"🧹 LLM 응답 캐시 한도 초과로 {evicted}개 항목 삭제")
+        return evicted
+
+    # ==================== 임베딩 캐시 (embedding_cache) ====================
+
+    def get_embedding_cache(self, model, text_hashes):
+        """
+        저장된 임베딩 벡터를 한 번에 조회하고 마지막 사용 시각을 갱신합니다.
+
+        Args:
+            model (str): 임베딩 모델명
+            text_hashes (list): 텍스트 SHA-256 해시 목록
+
+        Returns:
+            dict: {text_hash: 벡터 바이트(float32)}, 없는 해시는 포함하지 않음
+        """
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        found = {}
+        # SQLite 바인딩 변수 수 제한을 넘지 않도록 나누어 조회
+        for start in range(0, len(text_hashes), 500):
+            batch = text_hashes[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(f"""
+                SELECT text_hash, vector FROM embedding_cache
+                WHERE model = ? AND text_hash IN ({placeholders})
+            """, [model] + batch)
+            for row in cursor.fetchall():
+                found[row['text_hash']] = row['vector']
+        if found:
+            cursor.executemany(
+                "UPDATE embedding_cache SET last_used_at = ? WHERE model = ? AND text_hash = ?",
+                [(now, model, text_hash) for text_hash in found]
+            )
+            conn.commit()
+        conn.close()
+        return found
+
+    def save_embedding_cache(self, model, vectors, max_entries):
+        """
+        임베딩 벡터를 저장하고, 항목 수가 한도를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다.
+
+        Args:
+            model (str): 임베딩 모델명
+            vectors (dict): {text_hash: 벡터 바이트(float32)}
+            max_entries (int): 캐시 전체 항목 수 한도
+
+        Returns:
+            int: 한도 초과로 삭제된 항목 수
+        """
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.executemany("""
+            INSERT OR REPLACE INTO embedding_cache (model, text_hash, vector, created_at, last_used_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, [(model, text_hash, vector, now, now) for text_hash, vector in vectors.items()])
+
+        # 항목 수 기반 제거 (LRU)
+        cursor.execute("SELECT COUNT(*) AS total FROM embedding_cache")
+        excess = cursor.fetchone()['total'] - max_entries
+        evicted = 0
+        if excess > 0:
+            cursor.execute("""
+                DELETE FROM embedding_cache WHERE rowid IN (
+                    SELECT rowid FROM embedding_cache ORDER BY last_used_at ASC, created_at ASC LIMIT ?
+                )
+            """, (excess,))
+            evicted = cursor.rowcount
+
+        conn.commit()
+        conn.close()
+        if evicted:
+            logger.info(f"🧹 임베딩 캐시 한도 초과로 {evicted}개 항목 삭제")
+        return evicted
+
+    # ==================== 키워드 역색인 (keyword_docs, keyword_postings) ====================
+
+    def replace_keyword_docs(self, collection, docs):
+        """
+        문서들의 키워드 색인을 교체합니다. (기존 색인 삭제 후 저장, 하나의 트랜잭션)
+
+        Args:
+            collection (str): 벡터 DB 컬렉션 이름
+            docs (list): [(doc_id, meeting_id, 문서 길이(토큰 수), {term: 빈도}), ...]
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            doc_ids = [(collection, doc[0]) for doc in docs]
+            cursor.executemany("DELETE FROM keyword_postings WHERE collection = ? AND doc_id = ?", doc_ids)
+            cursor.executemany("""
+                INSERT OR REPLACE INTO keyword_docs (collection, doc_id, meeting_id, length)
+                VALUES (?, ?, ?, ?)
+            """, [(collection, doc_id, meeting_id, length) for doc_id, meeting_id, length, _ in docs])
+            cursor.executemany("""
+                INSERT INTO keyword_postings (collection, term, doc_id, tf)
+                VALUES (?, ?, ?, ?)
+            """, [
+                (collection, term, doc_id, tf)
+                for doc_id, _, _, term_counts in docs
+                for term, tf in term_counts.items()
+            ])
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def delete_keyword_docs(self, collection, doc_ids=None, meeting_id=None):
+        """
+        키워드 색인에서 문서를 삭제합니다. doc_ids와 meeting_id가 모두 없으면 컬렉션 전체를 삭제합니다.
+
+        Args:
+            collection (str): 벡터 DB 컬렉션 이름
+            doc_ids (list, optional): 삭제할 문서 ID 목록
+            meeting_id (str, optional): 이 회의의 문서 전체 삭제
+
+        Returns:
+            int: 삭제된 문서 수
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            if doc_ids is None and meeting_id is not None:
+                cursor.execute("SELECT doc_id FROM keyword_docs WHERE collection = ? AND meeting_id = ?",
+                               (collection, meeting_id))
+                doc_ids = [row['doc_id'] for row in cursor.fetchall()]
+
+            if doc_ids is None:
+                cursor.execute("DELETE FROM keyword_postings WHERE collection = ?", (collection,))
+                cursor.execute("DELETE FROM keyword_docs WHERE collection = ?", (collection,))
+                deleted = cursor.rowcount
+            else:
+                pairs = [(collection, doc_id) for doc_id in doc_ids]
+                cursor.executemany("DELETE FROM keyword_postings WHERE collection = ? AND doc_id = ?", pairs)
+                cursor.executemany("DELETE FROM keyword_docs WHERE collection = ? AND doc_id = ?", pairs)
+                deleted = len(doc_ids)
+            conn.commit()
+            return deleted
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def get_keyword_stats(self, collection, terms):
+        """
+        BM25 계산용 컬렉션 통계를 조회합니다.
+
+        Args:
+            collection (str): 벡터 DB 컬렉션 이름
+            terms (list): 질의 키워드 목록
+
+        Returns:
+            tuple: (문서 수, 평균 문서 길이, {term: 문서 빈도})
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT COUNT(*) AS doc_count, COALESCE(AVG(length), 0) AS avg_length
+            FROM keyword_docs WHERE collection = ?
+        """, (collection,))
+        row = cursor.fetchone()
+        doc_freqs = {}
+        if terms:
+            placeholders = ",".join("?" * len(terms))
+            cursor.execute(f"""
+                SELECT term, COUNT(*) AS df FROM keyword_postings
+                WHERE collection = ? AND term IN ({placeholders})
+                GROUP BY term
+            """, [collection] + list(terms))
+            doc_freqs = {r['term']: r['df'] for r in cursor.fetchall()}
+        conn.close()
+        return row['doc_count'], row['avg_length'], doc_freqs
+
+    def get_keyword_postings(self, collection, terms, meeting_ids=None):
+        """
+        질의 키워드가 들어있는 문서의 빈도와 길이를 조회합니다.
+
+        Args:
+            collection (str): 벡터 DB 컬렉션 이름
+            terms (list): 질의 키워드 목록
+            meeting_ids (list, optional): 이 회의들의 문서로 제한
+
+        Returns:
+            list: [{term, doc_id, tf, length, meeting_id}, ...]
+        """
+        if not terms:
+            return []
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        sql = f"""
+            SELECT p.term, p.doc_id, p.tf, d.length, d.meeting_id FROM keyword_postings p
+            JOIN keyword_docs d ON d.collection = p.collection AND d.doc_id = p.doc_id
+            WHERE p.collection = ? AND p.term IN ({",".join("?" * len(terms))})
+        """
+        params = [collection] + list(terms)
+        # 회의 수가 많으면 SQLite 바인딩 변수 수 제한을 넘지 않도록 조회 후 걸러냄
+        filter_in_sql = meeting_ids is not None and len(meeting_ids) <= 500
+        if filter_in_sql:
+            sql += f" AND d.meeting_id IN ({','.join('?' * len(meeting_ids))})"
+            params += list(meeting_ids)
+        cursor.execute(sql, params)
+        rows = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        if meeting_ids is not None and not filter_in_sql:
+            allowed = set(meeting_ids)
+            rows = [row for row in rows if row['meeting_id'] in allowed]
+        return rows
@@ -0,0 +1,198 @@
+"""
+임베딩 캐시
+(모델, 텍스트 해시)별로 임베딩 벡터를 SQLite(embedding_cache)에 저장해 두고,
+같은 텍스트(바뀌지 않은 청크/소주제, 반복 질문)는 다시 임베딩하지 않습니다.
+캐시 미스만 EMBEDDING_BATCH_SIZE / EMBEDDING_BATCH_MAX_TOKENS 단위로 묶어
+EMBEDDING_CONCURRENCY개까지 동시에 요청합니다.
+
+사용 예:
+    embeddings = CachedEmbeddings(llm_gateway.openai_embeddings(), config.OPENAI_EMBEDDING_MODEL)
+    Chroma(client=client, collection_name=name, embedding_function=embeddings)
+"""
+import time
+import hashlib
+import logging
+import threading
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from langchain_core.embeddings import Embeddings
+
+from config import config
+from utils.db_manager import DatabaseManager
+from utils.llm_gateway import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+
+def _encode_vector(vector) -> bytes:
+    """벡터를 float32 바이트로 변환 (Chroma도 float32로 저장하므로 정밀도 손실 없음)"""
+    return array('f', vector).tobytes()
+
+
+def _decode_vector(data: bytes) -> list:
+    """float32 바이트를 벡터로 변환"""
+    vector = array('f')
+    vector.frombytes(data)
+    return vector.tolist()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    langchain Embeddings 인터페이스를 유지하면서 영구 캐시와 배치 병렬 임베딩을 적용하는 래퍼
+    (Chroma 등 embedding_function을 받는 곳에 그대로 전달 가능)
+    """
+
+    def __init__(self, embeddings: Embeddings, model_name: str, db: DatabaseManager = None):
+        """
+        Args:
+            embeddings: 실제 임베딩 (GatewayEmbeddings - 게이트웨이 제한/재시도 적용)
+            model_name: 임베딩 모델 이름 (캐시 키)
+            db: 캐시 저장용 DatabaseManager (None이면 처음 사용할 때 생성)
+        """
+        self.embeddings = embeddings
+        self.model_name = model_name
+        self._db = db
+        self._lock = threading.Lock()
+        self._stats = {
+            'requests': 0, 'texts': 0, 'hits': 0, 'misses': 0, 'batches': 0, 'cache_errors': 0,
+            'request_seconds': 0.0, 'batch_seconds': 0.0,
+            'recent_batch_latencies': deque(maxlen=200)
+        }
+
+    @property
+    def db(self) -> DatabaseManager:
+        if self._db is None:
+            self._db = DatabaseManager(str(config.DATABASE_PATH))
+        return self._db
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def embed_documents(self, texts: list) -> list:
+        return self._embed(list(texts))
+
+    def embed_query(self, text: str) -> list:
+        return self._embed([text], query=True)[0]
+
+    def _embed(self, texts: list, query: bool = False) -> list:
+        """
+        캐시에 있는 벡터는 그대로 쓰고, 없는 텍스트만 (중복 제거 후) 임베딩하여 캐시에 저장
+
+        Args:
+            texts: 임베딩할 텍스트 목록
+            query: 검색 질의 임베딩 여부 (embed_query 사용)
+
+        Returns:
+            list: texts와 같은 순서의 벡터 목록
+        """
+        started_at = time.monotonic()
+        hashes = [self.text_hash(text) for text in texts]
+        vectors = {}
+
+        cache_enabled = config.EMBEDDING_CACHE_ENABLED
+        if cache_enabled:
+            try:
+                cached = self.db.get_embedding_cache(self.model_name, list(set(hashes)))
+                vectors = {text_hash: _decode_vector(data) for text_hash, data in cached.items()}
+            except Exception as e:
+                logger.warning(f"⚠️ 임베딩 캐시 조회 실패: {e}")
+                self._count('cache_errors')
+
+        missing = {}
+        for text_hash, text in zip(hashes, texts):
+            if text_hash not in vectors:
+                missing.setdefault(text_hash, text)
+
+        if missing:
+            if query:
+                embedded = [self._timed_batch(self.embeddings.embed_query, list(missing.values())[0])]
+            else:
+                embedded = self._embed_missing(list(missing.values()))
+            new_vectors = dict(zip(missing.keys(), embedded))
+            vectors.update(new_vectors)
+
+            if cache_enabled:
+                try:
+                    self.db.save_embedding_cache(
+                        self.model_name,
+                        {text_hash: _encode_vector(vector) for text_hash, vector in new_vectors.items()},
+                        config.EMBEDDING_CACHE_MAX_ENTRIES
+                    )
+                except Exception as e:
+                    logger.warning(f"⚠️ 임베딩 캐시 저장 실패: {e}")
+                    self._count('cache_errors')
+
+        hits = sum(1 for text_hash in hashes if text_hash not in missing)
+        with self._lock:
+            self._stats['requests'] += 1
+            self._stats['texts'] += len(texts)
+            self._stats['hits'] += hits
+            self._stats['misses'] += len(texts) - hits
+            self._stats['request_seconds'] += time.monotonic() - started_at
+        if not query and texts:
+            logger.info(f"🧮 임베딩 {len(texts)}개 (캐시 {hits}개, 새로 임베딩 {len(missing)}개)")
+        return [vectors[text_hash] for text_hash in hashes]
+
+    def _embed_missing(self, texts: list) -> list:
+        """캐시 미스 텍스트를 배치로 나누어 병렬 임베딩 (입력 순서 유지)"""
+        batches = []
+        batch, batch_tokens = [], 0
+        for text in texts:
+            tokens = estimate_tokens(text)
+            if batch and (len(batch) >= config.EMBEDDING_BATCH_SIZE
+                          or batch_tokens + tokens > config.EMBEDDING_BATCH_MAX_TOKENS):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+        batches.append(batch)
+
+        if len(batches) == 1:
+            return self._timed_batch(self.embeddings.embed_documents, batches[0])
+
+        with ThreadPoolExecutor(max_workers=min(config.EMBEDDING_CONCURRENCY, len(batches))) as executor:
+            results = list(executor.map(lambda b: self._timed_batch(self.embeddings.embed_documents, b), batches))
+        return [vector for result in results for vector in result]
+
+    def _timed_batch(self, fn, value):
+        """임베딩 요청 1건 실행 + 지연 시간 기록"""
+        started_at = time.monotonic()
+        result = fn(value)
+        elapsed = time.monotonic() - started_at
+        with self._lock:
+            self._stats['batches'] += 1
+            self._stats['batch_seconds'] += elapsed
+            self._stats['recent_batch_latencies'].append(elapsed)
+        return result
+
+    def _count(self, key: str):
+        with self._lock:
+            self._stats[key] += 1
+
+    def get_metrics(self) -> dict:
+        """
+        임베딩 지표
+
+        Returns:
+            dict: {model, requests, texts, hits, misses, hit_rate, batches, cache_errors,
+                   avg/p95 배치 지연 시간(초), avg 요청 지연 시간(초, 캐시 조회 포함)}
+        """
+        with self._lock:
+            stats = self._stats
+            recent = sorted(stats['recent_batch_latencies'])
+            return {
+                'model': self.model_name,
+                'requests': stats['requests'],
+                'texts': stats['texts'],
+                'hits': stats['hits'],
+                'misses': stats['misses'],
+                'hit_rate': round(stats['hits'] / stats['texts'], 4) if stats['texts'] else 0.0,
+                'batches': stats['batches'],
+                'cache_errors': stats['cache_errors'],
+                'avg_batch_latency_seconds': round(stats['batch_seconds'] / stats['batches'], 3) if stats['batches'] else 0.0,
+                'p95_batch_latency_seconds': round(recent[min(len(recent) - 1, int(len(recent) * 0.95))], 3) if recent else 0.0,
+                'avg_request_latency_seconds': round(stats['request_seconds'] / stats['requests'], 3) if stats['requests'] else 0.0
+            }
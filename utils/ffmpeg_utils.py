@@ -0,0 +1,320 @@
+"""
+ffmpeg/ffprobe 공통 유틸리티
+오디오 길이 조회, 구간 잘라내기 등 여러 모듈에서 사용하는 미디어 처리 함수 모음
+인코딩/디코딩 프로세스는 ffmpeg_slots로 호스트 전체 동시 실행 수를 제한합니다.
+"""
+import os
+import re
+import json
+import time
+import logging
+import threading
+import subprocess
+from collections import deque
+from contextlib import contextmanager
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+
+class FFmpegSlotScheduler:
+    """
+    ffmpeg 동시 실행 수 제한 (프로세스 슬롯 스케줄러)
+    슬롯이 모두 사용 중이면 요청 순서(FIFO)대로 대기하며, 대기 순서 변경 시 콜백으로 알려줍니다.
+    """
+
+    def __init__(self, max_slots: int):
+        self.max_slots = max(1, max_slots)
+        self._condition = threading.Condition()
+        self._waiting = deque()
+        self._active = 0
+
+        # 지표
+        self._total_acquired = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._recent_waits = deque(maxlen=200)
+
+    @contextmanager
+    def slot(self, on_wait=None):
+        """
+        슬롯 확보 후 블록 실행, 종료 시 반납
+
+        Args:
+            on_wait: on_wait(position, depth) 대기 순서 알림 콜백 (position은 1부터)
+        """
+        self._acquire(on_wait)
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active -= 1
+                self._condition.notify_all()
+
+    def _acquire(self, on_wait=None):
+        ticket = object()
+        started_at = time.monotonic()
+        last_position = None
+
+        with self._condition:
+            self._waiting.append(ticket)
+            try:
+                while not (self._waiting[0] is ticket and self._active < self.max_slots):
+                    position = self._waiting.index(ticket) + 1
+                    if on_wait and position != last_position:
+                        last_position = position
+                        depth = len(self._waiting)
+                        # 콜백(SSE 기록 등)은 락 밖에서 호출
+                        self._condition.release()
+                        try:
+                            on_wait(position, depth)
+                        except Exception as e:
+                            logger.warning(f"⚠️ ffmpeg 대기 알림 실패: {e}")
+                        finally:
+                            self._condition.acquire()
+                        continue
+                    self._condition.wait(timeout=5)
+            except BaseException:
+                self._waiting.remove(ticket)
+                self._condition.notify_all()
+                raise
+
+            self._waiting.popleft()
+            self._active += 1
+            # 다음 대기자도 빈 슬롯이 있으면 바로 진행할 수 있도록 깨움
+            self._condition.notify_all()
+
+            wait_seconds = time.monotonic() - started_at
+            self._total_acquired += 1
+            self._total_wait_seconds += wait_seconds
+            self._max_wait_seconds = max(self._max_wait_seconds, wait_seconds)
+            self._recent_waits.append(wait_seconds)
+
+        if wait_seconds >= 1.0:
+            logger.info(f"⏳ ffmpeg 슬롯 대기 {wait_seconds:.1f}초")
+
+    def get_metrics(self) -> dict:
+        """
+        대기열 깊이 및 대기 시간 지표
+
+        Returns:
+            dict: max_slots, active, queue_depth, total_acquired, avg/p95/max 대기 시간(초)
+        """
+        with self._condition:
+            recent = sorted(self._recent_waits)
+            return {
+                'max_slots': self.max_slots,
+                'active': self._active,
+                'queue_depth': len(self._waiting),
+                'total_acquired': self._total_acquired,
+                'avg_wait_seconds': round(self._total_wait_seconds / self._total_acquired, 3) if self._total_acquired else 0.0,
+                'p95_wait_seconds': round(recent[min(len(recent) - 1, int(len(recent) * 0.95))], 3) if recent else 0.0,
+                'max_wait_seconds': round(self._max_wait_seconds, 3)
+            }
+
+
+# 호스트(프로세스) 전체에서 공유하는 ffmpeg 슬롯
+ffmpeg_slots = FFmpegSlotScheduler(config.FFMPEG_MAX_CONCURRENT)
+
+
+def run_ffmpeg(command: list, timeout: int = None, use_slot: bool = True, on_wait=None) -> subprocess.CompletedProcess:
+    """
+    ffmpeg/ffprobe 명령 실행 (인코딩/디코딩 작업은 슬롯 확보 후 실행)
+
+    Args:
+        command: 실행할 명령어 리스트 (예: ['ffmpeg', '-y', ...])
+        timeout: 타임아웃 (초), None이면 UPLOAD_TIMEOUT_SECONDS
+        use_slot: 동시 실행 제한 적용 여부 (가벼운 ffprobe 조회는 False)
+        on_wait: on_wait(position, depth) 슬롯 대기 순서 알림 콜백
+
+    Returns:
+        subprocess.CompletedProcess: 실행 결과
+    """
+    def execute():
+        return subprocess.run(
+            command,
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            errors='ignore',
+            timeout=timeout or config.UPLOAD_TIMEOUT_SECONDS
+        )
+
+    if not use_slot:
+        return execute()
+
+    with ffmpeg_slots.slot(on_wait):
+        return execute()
+
+
+def probe_duration(media_path: str) -> float:
+    """
+    ffprobe로 미디어 길이(초) 조회
+
+    Args:
+        media_path: 미디어 파일 경로
+
+    Returns:
+        float: 길이 (초), 조회 실패 시 0.0
+    """
+    command = [
+        'ffprobe', '-v', 'error',
+        '-show_entries', 'format=duration',
+        '-of', 'default=noprint_wrappers=1:nokey=1',
+        media_path
+    ]
+    try:
+        result = run_ffmpeg(command, timeout=60, use_slot=False)
+        if result.returncode != 0:
+            logger.warning(f"⚠️ ffprobe 실패: {result.stderr[:300]}")
+            return 0.0
+        return float(result.stdout.strip())
+    except Exception as e:
+        logger.warning(f"⚠️ 미디어 길이 조회 실패: {media_path} - {e}")
+        return 0.0
+
+
+def probe_codecs(media_path: str) -> dict:
+    """
+    ffprobe로 첫 번째 비디오/오디오 스트림의 코덱 조회
+
+    Args:
+        media_path: 미디어 파일 경로
+
+    Returns:
+        dict: {'video': 'h264' 등 또는 None, 'audio': 'opus' 등 또는 None}
+    """
+    codecs = {'video': None, 'audio': None}
+    command = [
+        'ffprobe', '-v', 'error',
+        '-show_entries', 'stream=codec_type,codec_name',
+        '-of', 'json',
+        media_path
+    ]
+    try:
+        result = run_ffmpeg(command, timeout=60, use_slot=False)
+        if result.returncode != 0:
+            logger.warning(f"⚠️ ffprobe 실패: {result.stderr[:300]}")
+            return codecs
+        for stream in json.loads(result.stdout).get('streams', []):
+            codec_type = stream.get('codec_type')
+            if codec_type in codecs and codecs[codec_type] is None:
+                codecs[codec_type] = stream.get('codec_name')
+    except Exception as e:
+        logger.warning(f"⚠️ 코덱 조회 실패: {media_path} - {e}")
+    return codecs
+
+
+def parse_ffmpeg_time(stderr: str) -> float:
+    """
+    ffmpeg 진행 로그(stderr)의 마지막 time= 값을 초 단위로 변환
+    (MediaRecorder로 만든 WebM은 컨테이너에 길이 정보가 없는 경우가 많아 처리된 길이를 여기서 얻음)
+
+    Args:
+        stderr: ffmpeg stderr 출력
+
+    Returns:
+        float: 처리된 미디어 길이 (초), 찾지 못하면 0.0
+    """
+    matches = re.findall(r'time=(\d+):(\d+):(\d+(?:\.\d+)?)', stderr or '')
+    if not matches:
+        return 0.0
+    hours, minutes, seconds = matches[-1]
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+# STT 입력 오디오 포맷별 확장자 (opus는 Ogg 컨테이너)
+STT_AUDIO_EXTENSIONS = {'wav': '.wav', 'flac': '.flac', 'opus': '.ogg'}
+
+
+def stt_audio_extension(audio_format: str = None) -> str:
+    """
+    STT 입력 오디오 파일 확장자 조회
+
+    Args:
+        audio_format: wav | flac | opus, None이면 STT_AUDIO_FORMAT
+
+    Returns:
+        str: 확장자 (예: '.flac'), 알 수 없는 포맷이면 '.wav'
+    """
+    return STT_AUDIO_EXTENSIONS.get(audio_format or config.STT_AUDIO_FORMAT, '.wav')
+
+
+def stt_audio_args(output_path: str) -> list:
+    """
+    STT 입력용 오디오 출력 옵션 (16kHz 모노, 확장자별 코덱)
+
+    Args:
+        output_path: 출력 파일 경로 (.wav: PCM, .flac: FLAC, .ogg/.opus: Opus)
+
+    Returns:
+        list: ffmpeg 출력 옵션
+    """
+    args = ['-vn', '-ar', '16000', '-ac', '1']
+    extension = os.path.splitext(output_path)[1].lower()
+    if extension == '.wav':
+        args += ['-acodec', 'pcm_s16le']
+    elif extension == '.flac':
+        args += ['-acodec', 'flac', '-compression_level', '5']
+    elif extension in ('.ogg', '.opus'):
+        args += ['-acodec', 'libopus', '-b:a', config.STT_OPUS_BITRATE, '-application', 'voip']
+    return args
+
+
+def cut_audio_segment(source_path: str, output_path: str, start: float, duration: float) -> bool:
+    """
+    오디오의 특정 구간을 잘라 16kHz 모노 파일로 저장
+
+    Args:
+        source_path: 원본 오디오 경로
+        output_path: 출력 파일 경로 (확장자로 포맷 결정)
+        start: 시작 시간 (초)
+        duration: 길이 (초)
+
+    Returns:
+        bool: 성공 여부
+    """
+    command = [
+        'ffmpeg', '-y',
+        '-ss', f"{start:.3f}",  # 입력 앞에 두어 빠른 탐색
+        '-t', f"{duration:.3f}",
+        '-i', source_path,
+    ]
+    command += stt_audio_args(output_path)
+    command.append(output_path)
+
+    result = run_ffmpeg(command)
+    if result.returncode != 0 or not os.path.exists(output_path):
+        logger.error(f"❌ 오디오 구간 추출 실패 ({start:.1f}s~{start + duration:.1f}s): {result.stderr[:300]}")
+        return False
+    return True
+
+
+def cut_audio_tail(source_path: str, output_path: str, start: float) -> bool:
+    """
+    오디오의 start 이후 끝까지를 잘라 16kHz 모노 파일로 저장
+    녹음 중 계속 이어 붙여지는 WebM처럼 탐색 색인(Cues)이 없는 파일도 정확히 자르도록
+    입력 뒤에 -ss를 두어 처음부터 디코딩하며 탐색합니다. (비디오 스트림은 디코딩하지 않음)
+
+    Args:
+        source_path: 원본 미디어 경로
+        output_path: 출력 파일 경로 (확장자로 포맷 결정)
+        start: 시작 시간 (초)
+
+    Returns:
+        bool: 성공 여부
+    """
+    command = [
+        'ffmpeg', '-y',
+        '-i', source_path,
+        '-ss', f"{start:.3f}",
+    ]
+    command += stt_audio_args(output_path)
+    command.append(output_path)
+
+    result = run_ffmpeg(command)
+    if result.returncode != 0 or not os.path.exists(output_path):
+        logger.error(f"❌ 오디오 뒷부분 추출 실패 ({start:.1f}s~): {result.stderr[:300]}")
+        return False
+    return True
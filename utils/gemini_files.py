@@ -0,0 +1,141 @@
+"""
+STT 오디오 파일 업로드 저장소
+큰 오디오를 요청 본문에 인라인으로 싣지 않고, 한 번 업로드한 뒤 URI로 참조하기 위한 인터페이스
+- GeminiFileStore: Gemini Files API 사용 (운영)
+- LocalFileStore: 로컬 임시 폴더 사용 (테스트/오프라인 개발용 가짜 구현)
+"""
+import os
+import time
+import uuid
+import shutil
+import logging
+import tempfile
+from pathlib import Path
+from abc import ABC, abstractmethod
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+
+class UploadedAudio:
+    """업로드된 오디오 파일 참조 (URI + MIME 타입)"""
+
+    def __init__(self, name: str, uri: str, mime_type: str, size_bytes: int = 0):
+        self.name = name
+        self.uri = uri
+        self.mime_type = mime_type
+        self.size_bytes = size_bytes
+
+    def __repr__(self):
+        return f"UploadedAudio(name={self.name!r}, uri={self.uri!r}, mime_type={self.mime_type!r})"
+
+
+class AudioFileStore(ABC):
+    """
+    오디오 파일 업로드 저장소 인터페이스
+    upload()는 파일을 디스크에서 스트리밍으로 올리고, delete()는 사용 후 정리합니다.
+    """
+
+    @abstractmethod
+    def upload(self, file_path: str, mime_type: str) -> UploadedAudio:
+        """
+        오디오 파일 업로드
+
+        Args:
+            file_path: 업로드할 로컬 파일 경로
+            mime_type: MIME 타입 (예: audio/wav)
+
+        Returns:
+            UploadedAudio: 업로드된 파일 참조
+        """
+
+    @abstractmethod
+    def delete(self, uploaded: UploadedAudio):
+        """
+        업로드된 파일 삭제
+
+        Args:
+            uploaded: upload()가 반환한 파일 참조
+        """
+
+
+class GeminiFileStore(AudioFileStore):
+    """Gemini Files API 기반 저장소"""
+
+    def __init__(self, client):
+        """
+        Args:
+            client: google.genai.Client 인스턴스
+        """
+        self.client = client
+
+    def upload(self, file_path: str, mime_type: str) -> UploadedAudio:
+        size_bytes = os.path.getsize(file_path)
+        logger.info(f"☁️ Gemini Files API 업로드 중: {os.path.basename(file_path)} ({size_bytes / 1024 / 1024:.1f}MB)")
+
+        # SDK가 파일 경로에서 청크 단위로 읽어 업로드 (전체를 메모리에 올리지 않음)
+        uploaded = self.client.files.upload(file=file_path, config={'mime_type': mime_type})
+
+        # 서버 측 처리(PROCESSING)가 끝나야 요청에서 참조 가능
+        deadline = time.monotonic() + config.STT_FILE_ACTIVE_TIMEOUT_SECONDS
+        while self._state_name(uploaded) == 'PROCESSING':
+            if time.monotonic() > deadline:
+                self._delete_by_name(uploaded.name)
+                raise TimeoutError(f"Gemini 파일 처리 대기 시간 초과: {uploaded.name}")
+            time.sleep(config.STT_FILE_POLL_SECONDS)
+            uploaded = self.client.files.get(name=uploaded.name)
+
+        if self._state_name(uploaded) == 'FAILED':
+            self._delete_by_name(uploaded.name)
+            raise ValueError(f"Gemini 파일 처리 실패: {uploaded.name}")
+
+        logger.info(f"✅ Gemini 파일 업로드 완료: {uploaded.name}")
+        return UploadedAudio(
+            name=uploaded.name,
+            uri=uploaded.uri,
+            mime_type=uploaded.mime_type or mime_type,
+            size_bytes=size_bytes
+        )
+
+    def delete(self, uploaded: UploadedAudio):
+        self._delete_by_name(uploaded.name)
+
+    def _delete_by_name(self, name: str):
+        try:
+            self.client.files.delete(name=name)
+            logger.info(f"🗑️ Gemini 파일 삭제: {name}")
+        except Exception as e:
+            # 삭제 실패해도 Files API가 48시간 후 자동 만료시킴
+            logger.warning(f"⚠️ Gemini 파일 삭제 실패: {name} - {e}")
+
+    @staticmethod
+    def _state_name(uploaded) -> str:
+        state = getattr(uploaded, 'state', None)
+        return getattr(state, 'name', str(state or ''))
+
+
+class LocalFileStore(AudioFileStore):
+    """
+    로컬 임시 폴더 기반 가짜 저장소 (테스트/오프라인 개발용)
+    file:// URI를 반환하므로 가짜 Gemini 클라이언트와 함께 사용합니다.
+    """
+
+    def __init__(self, root_dir: str = None):
+        self.root_dir = Path(root_dir or tempfile.mkdtemp(prefix="stt_files_"))
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+
+    def upload(self, file_path: str, mime_type: str) -> UploadedAudio:
+        name = f"files/{uuid.uuid4().hex}"
+        target_path = self.root_dir / f"{name.split('/')[1]}{os.path.splitext(file_path)[1]}"
+        shutil.copyfile(file_path, target_path)
+        return UploadedAudio(
+            name=name,
+            uri=target_path.as_uri(),
+            mime_type=mime_type,
+            size_bytes=target_path.stat().st_size
+        )
+
+    def delete(self, uploaded: UploadedAudio):
+        for path in self.root_dir.glob(f"{uploaded.name.split('/')[1]}*"):
+            path.unlink()
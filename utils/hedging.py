@@ -0,0 +1,200 @@
+"""
+요청 헤징(hedging)
+응답이 과거 지연 시간의 백분위(STT_HEDGE_PERCENTILE)를 넘도록 오지 않으면 대체 모델로
+같은 요청을 하나 더 보내고, 먼저 성공한 쪽의 결과를 사용합니다. (기본 요청이 실패해도 대체 요청으로 넘어감)
+STT 응답 시간은 오디오 길이에 비례하므로 "요청 크기(오디오 1초)당 응답 시간"으로 기록하고 대기 한도를 계산합니다.
+
+진 쪽 요청은 취소합니다. 아직 시작하지 못한 요청은 실행하지 않고, 이미 보낸 동기 HTTP 요청은
+중간에 끊을 수 없으므로 끝나는 대로 결과를 버리고 discard 콜백(스트림 닫기 등)으로 정리합니다.
+이때 기본 요청이 늦게 끝난 시점으로 헤징으로 줄어든 지연 시간을 기록합니다.
+
+사용 예:
+    result = stt_hedger.run("stt:gemini-2.5-pro", audio_seconds, call_pro,
+                            "stt:gemini-2.5-flash", call_flash)
+"""
+import time
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+
+def _percentile(values, fraction: float) -> float:
+    """정렬된 값 목록의 백분위 (values는 비어있지 않아야 함)"""
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+class RequestHedger:
+    """지연 시간 백분위 기반 요청 헤징 + 헤징 비율/지연 감소 지표"""
+
+    def __init__(self, max_workers: int):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge")
+        self._lock = threading.Lock()
+        self._history = {}
+        self._stats = {}
+
+    def hedge_delay(self, key: str, scale: float):
+        """
+        대체 요청을 보내기 전 기다릴 시간
+
+        Args:
+            key: 요청 기록 키 (예: "stt:gemini-2.5-pro")
+            scale: 요청 크기 (STT는 오디오 길이, 초)
+
+        Returns:
+            float: 대기 시간 (초), 기록이 STT_HEDGE_MIN_SAMPLES보다 적거나 크기를 모르면 None (헤징하지 않음)
+        """
+        if not scale or scale <= 0:
+            return None
+        with self._lock:
+            history = self._history.get(key)
+            if not history or len(history) < config.STT_HEDGE_MIN_SAMPLES:
+                return None
+            ratio = _percentile(sorted(history), config.STT_HEDGE_PERCENTILE)
+        return max(ratio * scale, config.STT_HEDGE_MIN_DELAY_SECONDS)
+
+    def _record_latency(self, key: str, elapsed: float, scale: float):
+        """성공한 요청의 응답 시간 기록 (진 쪽 요청도 기록해야 백분위가 낮게 치우치지 않음)"""
+        if not scale or scale <= 0:
+            return
+        with self._lock:
+            history = self._history.get(key)
+            if history is None:
+                history = self._history[key] = deque(maxlen=config.STT_HEDGE_HISTORY_SIZE)
+            history.append(elapsed / scale)
+
+    def _stats_for(self, key: str) -> dict:
+        """기본 요청 키별 지표 (self._lock 안에서 호출)"""
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = {
+                'requests': 0, 'hedged': 0, 'failovers': 0, 'hedge_wins': 0, 'failed': 0,
+                'saved_seconds': 0.0, 'saved_count': 0,
+                'latencies': deque(maxlen=config.STT_HEDGE_HISTORY_SIZE),
+                'primary_latencies': deque(maxlen=config.STT_HEDGE_HISTORY_SIZE)
+            }
+        return stats
+
+    def run(self, key: str, scale: float, primary, alternate_key: str, alternate, discard=None):
+        """
+        기본 요청을 보내고, 대기 한도 안에 응답이 없거나 실패하면 대체 요청을 보내 먼저 성공한 결과를 반환합니다.
+
+        Args:
+            key: 기본 요청 기록 키
+            scale: 요청 크기 (STT는 오디오 길이, 초)
+            primary: 기본 요청 함수 (인자 없음)
+            alternate_key: 대체 요청 기록 키
+            alternate: 대체 요청 함수 (인자 없음)
+            discard: 진 쪽 요청이 늦게 성공했을 때 그 결과를 정리하는 함수 (예: 스트림 닫기)
+
+        Returns:
+            먼저 성공한 요청의 결과
+
+        Raises:
+            Exception: 두 요청이 모두 실패하면 기본 요청의 예외
+        """
+        started_at = time.time()
+        race_lock = threading.Lock()
+        race = {'winner': None, 'finished_at': None}
+
+        def attempt(role, request_key, fn):
+            begin = time.time()
+            result = fn()
+            finished_at = time.time()
+            self._record_latency(request_key, finished_at - begin, scale)
+
+            with race_lock:
+                lost = race['winner'] is not None
+                if not lost:
+                    race['winner'] = role
+                    race['finished_at'] = finished_at
+
+            with self._lock:
+                stats = self._stats_for(key)
+                if role == 'primary':
+                    stats['primary_latencies'].append(finished_at - started_at)
+                    if lost:
+                        # 헤징이 없었다면 기본 요청이 끝날 때까지 기다렸어야 함
+                        stats['saved_seconds'] += finished_at - race['finished_at']
+                        stats['saved_count'] += 1
+
+            if lost and discard:
+                try:
+                    discard(result)
+                except Exception as e:
+                    logger.debug(f"진 쪽 요청 정리 실패: {e}")
+            return result
+
+        with self._lock:
+            self._stats_for(key)['requests'] += 1
+
+        futures = {self._executor.submit(attempt, 'primary', key, primary): 'primary'}
+        done, _ = wait(futures, timeout=self.hedge_delay(key, scale))
+
+        primary_future = next(iter(futures))
+        if not done or primary_future.exception() is not None:
+            reason = "지연" if not done else f"실패 ({primary_future.exception()})"
+            logger.warning(f"⏱️ 기본 요청 {reason} - 대체 요청 전송: {key} → {alternate_key}")
+            with self._lock:
+                self._stats_for(key)['hedged' if not done else 'failovers'] += 1
+            futures[self._executor.submit(attempt, 'hedge', alternate_key, alternate)] = 'hedge'
+
+        errors = {}
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    errors[futures[future]] = future.exception()
+                    continue
+
+                for other in pending:
+                    other.cancel()
+                with self._lock:
+                    stats = self._stats_for(key)
+                    stats['latencies'].append(race['finished_at'] - started_at)
+                    if futures[future] == 'hedge':
+                        stats['hedge_wins'] += 1
+                if futures[future] == 'hedge':
+                    logger.info(f"✅ 대체 요청이 먼저 완료: {alternate_key} ({race['finished_at'] - started_at:.1f}초)")
+                return future.result()
+
+        with self._lock:
+            self._stats_for(key)['failed'] += 1
+        raise errors.get('primary') or errors['hedge']
+
+    def get_metrics(self) -> dict:
+        """
+        기본 요청 키별 헤징 지표
+
+        Returns:
+            dict: {"키": {requests, hedged, hedge_rate, failovers, hedge_wins, failed,
+                         saved_seconds(헤징으로 줄어든 누적 지연), avg_saved_seconds,
+                         p95_latency_seconds(실제 응답), p95_primary_latency_seconds(기본 요청만 기다렸을 때)}}
+        """
+        with self._lock:
+            metrics = {}
+            for key, stats in self._stats.items():
+                latencies = sorted(stats['latencies'])
+                primary_latencies = sorted(stats['primary_latencies'])
+                metrics[key] = {
+                    'requests': stats['requests'],
+                    'hedged': stats['hedged'],
+                    'hedge_rate': round(stats['hedged'] / stats['requests'], 4),
+                    'failovers': stats['failovers'],
+                    'hedge_wins': stats['hedge_wins'],
+                    'failed': stats['failed'],
+                    'saved_seconds': round(stats['saved_seconds'], 3),
+                    'avg_saved_seconds': round(stats['saved_seconds'] / stats['saved_count'], 3) if stats['saved_count'] else 0.0,
+                    'p95_latency_seconds': round(_percentile(latencies, 0.95), 3) if latencies else None,
+                    'p95_primary_latency_seconds': round(_percentile(primary_latencies, 0.95), 3) if primary_latencies else None
+                }
+            return metrics
+
+
+# 싱글톤 인스턴스
+stt_hedger = RequestHedger(max_workers=config.STT_HEDGE_MAX_WORKERS)
@@ -0,0 +1,109 @@
+"""
+JSON 배열 스트리밍 파서
+LLM 스트리밍 응답처럼 조각(chunk) 단위로 도착하는 JSON 배열에서
+완성된 객체를 도착 즉시 하나씩 꺼냅니다.
+잘리거나 일부가 깨진 JSON 배열에서 온전한 객체만 살리는 데에도 사용합니다.
+"""
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class JSONArrayStreamParser:
+    """
+    최상위 JSON 배열의 원소 객체({...})를 점진적으로 파싱
+
+    - 배열 시작('[') 전의 텍스트(```json 코드 펜스 등)는 무시
+    - 문자열 내부의 중괄호/따옴표 이스케이프를 고려하여 객체 경계를 판단
+    - 파싱에 실패한 객체는 건너뛰고 skipped_count에 기록
+    """
+
+    def __init__(self):
+        self._in_array = False
+        self._finished = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._buffer = []
+        self.object_count = 0
+        self.skipped_count = 0
+
+    @property
+    def finished(self) -> bool:
+        """배열 닫는 괄호(']')까지 도착했는지 여부"""
+        return self._finished
+
+    def feed(self, text: str) -> list:
+        """
+        새로 도착한 텍스트 조각 입력
+
+        Args:
+            text: 응답 텍스트 조각
+
+        Returns:
+            list: 이번 조각으로 완성된 객체(dict) 목록
+        """
+        objects = []
+
+        for ch in text or '':
+            if self._finished:
+                break
+
+            if not self._in_array:
+                if ch == '[':
+                    self._in_array = True
+                continue
+
+            # 객체 사이 (쉼표, 공백, 배열 끝)
+            if self._depth == 0:
+                if ch == '{':
+                    self._depth = 1
+                    self._buffer = ['{']
+                elif ch == ']':
+                    self._finished = True
+                continue
+
+            self._buffer.append(ch)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                self._in_string = True
+            elif ch == '{':
+                self._depth += 1
+            elif ch == '}':
+                self._depth -= 1
+                if self._depth == 0:
+                    raw = ''.join(self._buffer)
+                    self._buffer = []
+                    try:
+                        objects.append(json.loads(raw))
+                        self.object_count += 1
+                    except json.JSONDecodeError as e:
+                        self.skipped_count += 1
+                        logger.warning(f"⚠️ 스트리밍 JSON 객체 파싱 실패, 건너뜀: {e} - {raw[:100]}")
+
+        return objects
+
+
+def salvage_json_array(text: str) -> tuple:
+    """
+    잘리거나 일부가 깨진 JSON 배열에서 온전한 객체만 추출
+
+    Args:
+        text: JSON 배열 텍스트 (코드 펜스 포함 가능)
+
+    Returns:
+        tuple: (객체 목록, 완전 여부) - 배열이 닫혔고 건너뛴 객체가 없으면 완전
+    """
+    parser = JSONArrayStreamParser()
+    objects = parser.feed(text)
+    return objects, parser.finished and parser.skipped_count == 0
@@ -0,0 +1,132 @@
+"""
+키워드 역색인 (하이브리드 검색의 BM25 쪽)
+meeting_chunks / meeting_subtopic 문서를 글자 n-gram으로 색인하여 SQLite(keyword_docs, keyword_postings)에
+저장합니다. 벡터 DB에 문서를 넣거나 지울 때마다 VectorDBManager가 함께 갱신하며,
+여러 프로세스가 같은 색인을 봅니다.
+
+토큰화:
+    한글은 조사가 붙어도 맞도록 음절 2-gram (한 글자 단어는 그대로),
+    영문/숫자는 단어 단위 (프로젝트 코드, 금액, 날짜 등 정확히 일치해야 하는 값)
+"""
+import re
+import math
+import logging
+import unicodedata
+from collections import Counter
+
+from config import config
+from utils.db_manager import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+# 한글 음절 / 영문·숫자 / 그 밖의 문자(한자 등) 연속 구간
+TOKEN_PATTERN = re.compile(r"[가-힣]+|[0-9a-z]+|[^\W\d_a-z가-힣]+")
+
+
+class KeywordIndex:
+    """글자 n-gram 역색인 + BM25 검색"""
+
+    def __init__(self, db: DatabaseManager = None):
+        """
+        Args:
+            db: 색인 저장용 DatabaseManager (None이면 처음 사용할 때 생성)
+        """
+        self._db = db
+
+    @property
+    def db(self) -> DatabaseManager:
+        if self._db is None:
+            self._db = DatabaseManager(str(config.DATABASE_PATH))
+        return self._db
+
+    @staticmethod
+    def tokenize(text: str) -> list:
+        """
+        텍스트를 색인 키워드 목록으로 변환
+
+        Args:
+            text: 원문
+
+        Returns:
+            list: 키워드 목록 (중복 포함, 빈도 계산용)
+        """
+        terms = []
+        for run in TOKEN_PATTERN.findall(unicodedata.normalize('NFKC', text or "").lower()):
+            if run[0].isascii() or len(run) == 1:
+                terms.append(run)
+            else:
+                terms.extend(run[i:i + 2] for i in range(len(run) - 1))
+        return terms
+
+    def add(self, collection: str, ids: list, texts: list, metadatas: list):
+        """
+        문서 색인 (같은 ID가 있으면 교체)
+
+        Args:
+            collection: 벡터 DB 컬렉션 이름
+            ids: 문서 ID 목록
+            texts: 문서 내용 목록
+            metadatas: 메타데이터 목록 (meeting_id 사용)
+        """
+        docs = []
+        for doc_id, text, metadata in zip(ids, texts, metadatas):
+            terms = self.tokenize(text)
+            docs.append((doc_id, (metadata or {}).get('meeting_id'), len(terms), dict(Counter(terms))))
+        if docs:
+            self.db.replace_keyword_docs(collection, docs)
+
+    def remove(self, collection: str, ids: list = None, meeting_id: str = None) -> int:
+        """
+        문서 색인 삭제 (ids와 meeting_id가 모두 없으면 컬렉션 전체)
+
+        Returns:
+            int: 삭제된 문서 수
+        """
+        return self.db.delete_keyword_docs(collection, doc_ids=ids, meeting_id=meeting_id)
+
+    def is_empty(self, collection: str) -> bool:
+        doc_count, _, _ = self.db.get_keyword_stats(collection, [])
+        return doc_count == 0
+
+    def search(self, collection: str, query: str, k: int, meeting_ids: list = None) -> list:
+        """
+        BM25 검색
+
+        Args:
+            collection: 벡터 DB 컬렉션 이름
+            query: 검색 질의
+            k: 반환할 결과 수
+            meeting_ids: 이 회의들의 문서로 제한 (None이면 전체)
+
+        Returns:
+            list: [(doc_id, score), ...] 점수 내림차순
+        """
+        terms = list(dict.fromkeys(self.tokenize(query)))
+        if not terms or meeting_ids == []:
+            return []
+
+        doc_count, avg_length, doc_freqs = self.db.get_keyword_stats(collection, terms)
+        if not doc_count:
+            return []
+
+        # 거의 모든 문서에 나오는 n-gram(어미 등)은 점수 기여가 거의 없고 조회만 무거우므로 제외
+        max_df = max(1, int(doc_count * config.HYBRID_MAX_DF_RATIO))
+        idf = {
+            term: math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+            for term, df in doc_freqs.items() if df <= max_df
+        }
+        if not idf:
+            return []
+
+        k1, b = config.HYBRID_BM25_K1, config.HYBRID_BM25_B
+        scores = {}
+        for row in self.db.get_keyword_postings(collection, list(idf), meeting_ids):
+            tf = row['tf']
+            norm = k1 * (1 - b + b * row['length'] / (avg_length or 1))
+            scores[row['doc_id']] = scores.get(row['doc_id'], 0.0) + idf[row['term']] * tf * (k1 + 1) / (tf + norm)
+
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:k]
+
+
+# 싱글톤 인스턴스
+keyword_index = KeywordIndex()
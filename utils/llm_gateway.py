@@ -0,0 +1,482 @@
+"""
+LLM 게이트웨이
+Gemini / OpenAI 호출을 한곳으로 모아 공유 클라이언트(HTTP 커넥션 풀 재사용),
+모델별 동시 실행 수 제한, 분당 요청/토큰 예산, 429/5xx 지터 백오프 재시도를 적용합니다.
+
+사용 예:
+    response = llm_gateway.generate_content(model="gemini-2.5-flash", contents=prompt)
+    result = llm_gateway.call("gemini-2.5-flash", chain.invoke, messages, estimated_tokens=2000)
+"""
+import time
+import random
+import logging
+import threading
+from collections import deque
+
+from langchain_core.embeddings import Embeddings
+
+from config import config
+from utils.model_router import model_router
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 HTTP 상태 코드 (429: 한도 초과, 5xx: 서버 일시 오류)
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+# 상태 코드를 노출하지 않는 래퍼 예외(langchain 등)용 메시지 판별
+RETRYABLE_MESSAGE_MARKERS = ("429", "RESOURCE_EXHAUSTED", "UNAVAILABLE", "rate limit", "overloaded", "503", "500 INTERNAL")
+
+
+def estimate_tokens(value) -> int:
+    """
+    요청 텍스트의 대략적인 토큰 수 (분당 토큰 예산 사전 예약용)
+    한국어 위주 텍스트 기준 약 2자당 1토큰으로 추정하며, 응답 후 실제 사용량으로 보정합니다.
+
+    Args:
+        value: 문자열, 문자열/메시지 리스트 또는 text 속성을 가진 객체
+
+    Returns:
+        int: 추정 토큰 수
+    """
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        return len(value) // 2 + 1
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_tokens(item) for item in value)
+
+    text = getattr(value, 'text', None) or getattr(value, 'content', None)
+    if isinstance(text, str):
+        return estimate_tokens(text)
+
+    parts = getattr(value, 'parts', None)
+    if parts:
+        return estimate_tokens(parts)
+    return 0
+
+
+def _usage_tokens(result):
+    """응답 객체에서 실제 사용 토큰 수 추출 (Gemini usage_metadata / langchain AIMessage)"""
+    usage = getattr(result, 'usage_metadata', None)
+    if usage is None:
+        return None
+    if isinstance(usage, dict):
+        return usage.get('total_tokens')
+    return getattr(usage, 'total_token_count', None)
+
+
+def _usage_split(result) -> tuple:
+    """응답 객체에서 (입력 토큰, 출력 토큰) 추출, 출력에는 thinking 토큰 포함 (없으면 0)"""
+    usage = getattr(result, 'usage_metadata', None)
+    if usage is None:
+        return 0, 0
+    if isinstance(usage, dict):
+        return usage.get('input_tokens') or 0, usage.get('output_tokens') or 0
+    output_tokens = (getattr(usage, 'candidates_token_count', None) or 0) + (getattr(usage, 'thoughts_token_count', None) or 0)
+    return getattr(usage, 'prompt_token_count', None) or 0, output_tokens
+
+
+def _status_code(error):
+    """예외에서 HTTP 상태 코드 추출 (google.genai / openai / httpx 예외)"""
+    for attr in ('code', 'status_code'):
+        value = getattr(error, attr, None)
+        if isinstance(value, int):
+            return value
+    response = getattr(error, 'response', None)
+    value = getattr(response, 'status_code', None)
+    return value if isinstance(value, int) else None
+
+
+def is_retryable(error) -> bool:
+    """
+    재시도할 만한 일시적 오류인지 판별
+
+    Args:
+        error: 발생한 예외
+
+    Returns:
+        bool: 429/5xx, 타임아웃, 연결 오류이면 True
+    """
+    status = _status_code(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES
+
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    name = type(error).__name__
+    if 'Timeout' in name or 'Connection' in name:
+        return True
+
+    message = str(error)
+    return any(marker in message for marker in RETRYABLE_MESSAGE_MARKERS)
+
+
+def _retry_after_seconds(error):
+    """429 응답의 Retry-After 헤더 (초)"""
+    headers = getattr(getattr(error, 'response', None), 'headers', None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get('retry-after'))
+    except (TypeError, ValueError):
+        return None
+
+
+class ModelLimiter:
+    """
+    모델 하나의 동시 실행 수 + 분당 요청/토큰 예산 관리
+    예산은 최근 60초 슬라이딩 윈도우로 계산하며, 초과 시 가장 오래된 요청이 윈도우를 벗어날 때까지 대기합니다.
+    """
+
+    WINDOW_SECONDS = 60.0
+
+    def __init__(self, model: str, concurrency: int, rpm: int, tpm: int):
+        self.model = model
+        self.concurrency = max(1, concurrency)
+        self.rpm = rpm
+        self.tpm = tpm
+        self.semaphore = threading.BoundedSemaphore(self.concurrency)
+        self._condition = threading.Condition()
+        self._window = deque()  # [timestamp, tokens]
+
+        # 지표
+        self.in_flight = 0
+        self.calls = 0
+        self.failures = 0
+        self.retries = 0
+        self.throttled = 0
+        self.total_latency_seconds = 0.0
+
+    def reserve(self, tokens: int) -> list:
+        """
+        분당 예산에서 요청 1건과 토큰을 예약 (예산이 없으면 대기)
+
+        Args:
+            tokens: 예약할 추정 토큰 수
+
+        Returns:
+            list: 예약 항목 (settle()로 실제 사용량 보정)
+        """
+        throttled = False
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                while self._window and now - self._window[0][0] >= self.WINDOW_SECONDS:
+                    self._window.popleft()
+
+                used_tokens = sum(entry[1] for entry in self._window)
+                # 윈도우가 비어 있으면 예산보다 큰 단일 요청도 허용 (영원히 대기하지 않도록)
+                if len(self._window) < self.rpm and (not self._window or used_tokens + tokens <= self.tpm):
+                    entry = [now, tokens]
+                    self._window.append(entry)
+                    return entry
+
+                if not throttled:
+                    throttled = True
+                    self.throttled += 1
+                    logger.info(f"⏳ {self.model} 분당 예산 소진, 대기 중 "
+                                f"(요청 {len(self._window)}/{self.rpm}, 토큰 {used_tokens}/{self.tpm})")
+                wait_seconds = self.WINDOW_SECONDS - (now - self._window[0][0])
+                self._condition.wait(timeout=max(wait_seconds, 0.05))
+
+    def settle(self, entry: list, actual_tokens):
+        """예약 토큰을 응답의 실제 사용량으로 보정"""
+        if actual_tokens is None:
+            return
+        with self._condition:
+            entry[1] = actual_tokens
+            self._condition.notify_all()
+
+    def begin(self, tokens: int) -> list:
+        """예산 예약 후 실행 중 카운트 증가 (동시 실행 슬롯은 호출자가 보유)"""
+        entry = self.reserve(tokens)
+        with self._condition:
+            self.in_flight += 1
+        return entry
+
+    def end(self, started_at: float):
+        """실행 중 카운트 감소 및 지연 시간 기록"""
+        with self._condition:
+            self.in_flight -= 1
+            self.calls += 1
+            self.total_latency_seconds += time.monotonic() - started_at
+
+    def record_failure(self):
+        with self._condition:
+            self.failures += 1
+
+    def record_retry(self):
+        with self._condition:
+            self.retries += 1
+
+    def get_metrics(self) -> dict:
+        with self._condition:
+            now = time.monotonic()
+            recent = [entry for entry in self._window if now - entry[0] < self.WINDOW_SECONDS]
+            return {
+                'concurrency': self.concurrency,
+                'in_flight': self.in_flight,
+                'rpm_limit': self.rpm,
+                'tpm_limit': self.tpm,
+                'requests_last_minute': len(recent),
+                'tokens_last_minute': sum(entry[1] for entry in recent),
+                'calls': self.calls,
+                'failures': self.failures,
+                'retries': self.retries,
+                'throttled': self.throttled,
+                'avg_latency_seconds': round(self.total_latency_seconds / self.calls, 3) if self.calls else 0.0
+            }
+
+
+class LLMGateway:
+    """
+    프로세스 전체에서 공유하는 LLM 호출 창구
+    - 공급자별 클라이언트를 한 번만 만들어 재사용 (요청마다 새 클라이언트/커넥션을 만들지 않음)
+    - 재시도는 게이트웨이가 담당하므로 SDK 자체 재시도는 끔
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._limiters = {}
+        self._clients = {}
+
+    # ==================== 공유 클라이언트 ====================
+
+    def _get_client(self, key: str, factory):
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = factory()
+            return self._clients[key]
+
+    def gemini_client(self):
+        """공유 google.genai.Client"""
+        def factory():
+            from google import genai
+            if config.GOOGLE_API_KEY:
+                return genai.Client(api_key=config.GOOGLE_API_KEY)
+            return genai.Client()
+        return self._get_client('gemini', factory)
+
+    def openai_embeddings(self):
+        """게이트웨이를 거치는 공유 OpenAI 임베딩 (langchain Embeddings 인터페이스)"""
+        def factory():
+            from langchain_openai import OpenAIEmbeddings
+            return GatewayEmbeddings(
+                self,
+                OpenAIEmbeddings(model=config.OPENAI_EMBEDDING_MODEL, max_retries=0),
+                config.OPENAI_EMBEDDING_MODEL
+            )
+        return self._get_client('openai_embeddings', factory)
+
+    def openai_chat(self):
+        """공유 ChatOpenAI (SelfQueryRetriever용, temperature=0)"""
+        def factory():
+            from langchain_openai import ChatOpenAI
+            return ChatOpenAI(
+                api_key=config.OPENAI_API_KEY, model=config.OPENAI_CHAT_MODEL,
+                temperature=0, max_retries=0
+            )
+        return self._get_client('openai_chat', factory)
+
+    def google_chat(self, model: str):
+        """공유 ChatGoogleGenerativeAI (langchain, temperature=0)"""
+        def factory():
+            from langchain_google_genai import ChatGoogleGenerativeAI
+            return ChatGoogleGenerativeAI(model=model, temperature=0, max_retries=0)
+        return self._get_client(f'google_chat:{model}', factory)
+
+    # ==================== 호출 ====================
+
+    def _limiter(self, model: str) -> ModelLimiter:
+        with self._lock:
+            if model not in self._limiters:
+                limits = dict(config.LLM_DEFAULT_LIMITS)
+                limits.update(config.LLM_MODEL_LIMITS.get(model, {}))
+                self._limiters[model] = ModelLimiter(model, limits['concurrency'], limits['rpm'], limits['tpm'])
+            return self._limiters[model]
+
+    @staticmethod
+    def _backoff_seconds(attempt: int, error) -> float:
+        """지터 포함 지수 백오프 (Retry-After가 있으면 우선)"""
+        retry_after = _retry_after_seconds(error)
+        if retry_after is not None:
+            return min(retry_after, config.LLM_RETRY_MAX_SECONDS)
+        ceiling = min(config.LLM_RETRY_MAX_SECONDS, config.LLM_RETRY_BASE_SECONDS * (2 ** attempt))
+        return random.uniform(ceiling / 2, ceiling)
+
+    def _handle_failure(self, limiter: ModelLimiter, attempt: int, error) -> float:
+        """
+        실패 기록 후 재시도 여부 판단
+
+        Returns:
+            float: 재시도 전 대기 시간 (재시도하지 않으면 예외를 다시 발생)
+        """
+        limiter.record_failure()
+        if attempt >= config.LLM_MAX_RETRIES or not is_retryable(error):
+            raise error
+
+        delay = self._backoff_seconds(attempt, error)
+        limiter.record_retry()
+        logger.warning(f"🔁 {limiter.model} 일시 오류, {delay:.1f}초 후 재시도 "
+                       f"({attempt + 1}/{config.LLM_MAX_RETRIES}): {error}")
+        return delay
+
+    @staticmethod
+    def _record_route(task: str, model_name: str, started_at: float, result):
+        """작업(task)이 지정된 호출의 지연 시간/토큰/비용을 경로별 지표에 기록"""
+        if task:
+            input_tokens, output_tokens = _usage_split(result)
+            model_router.record(task, model_name, time.monotonic() - started_at, input_tokens, output_tokens)
+
+    def call(self, model_name: str, fn, *args, estimated_tokens: int = None, task: str = None, **kwargs):
+        """
+        모델 제한/예산/재시도를 적용하여 fn(*args, **kwargs) 호출
+
+        Args:
+            model_name: 제한을 적용할 모델 이름
+            fn: 실제 API 호출 함수
+            estimated_tokens: 예약할 추정 토큰 수 (없으면 인자로 추정)
+            task: 작업 종류 (지정하면 경로별 지연 시간/비용 기록)
+
+        Returns:
+            fn의 반환값
+        """
+        limiter = self._limiter(model_name)
+        if estimated_tokens is None:
+            estimated_tokens = estimate_tokens(list(args) + list(kwargs.values()))
+
+        attempt = 0
+        while True:
+            with limiter.semaphore:
+                entry = limiter.begin(estimated_tokens)
+                started_at = time.monotonic()
+                try:
+                    result = fn(*args, **kwargs)
+                except Exception as e:
+                    error = e
+                else:
+                    limiter.settle(entry, _usage_tokens(result))
+                    self._record_route(task, model_name, started_at, result)
+                    return result
+                finally:
+                    limiter.end(started_at)
+
+            # 백오프 대기는 동시 실행 슬롯을 반납한 상태에서
+            time.sleep(self._handle_failure(limiter, attempt, error))
+            attempt += 1
+
+    def stream(self, model_name: str, fn, *args, estimated_tokens: int = None, task: str = None, **kwargs):
+        """
+        스트리밍 호출 (제너레이터)
+        스트림을 모두 소비할 때까지 동시 실행 슬롯을 유지하며,
+        첫 조각을 받기 전에 실패한 경우에만 재시도합니다. (이미 전달한 조각을 중복 전송하지 않음)
+
+        Args:
+            model_name: 제한을 적용할 모델 이름
+            fn: 스트림(iterable)을 반환하는 API 호출 함수
+            estimated_tokens: 예약할 추정 토큰 수 (없으면 인자로 추정)
+            task: 작업 종류 (지정하면 경로별 지연 시간/비용 기록)
+
+        Yields:
+            스트림 조각
+        """
+        limiter = self._limiter(model_name)
+        if estimated_tokens is None:
+            estimated_tokens = estimate_tokens(list(args) + list(kwargs.values()))
+
+        attempt = 0
+        while True:
+            received = False
+            with limiter.semaphore:
+                entry = limiter.begin(estimated_tokens)
+                started_at = time.monotonic()
+                last_chunk = None
+                try:
+                    for chunk in fn(*args, **kwargs):
+                        received = True
+                        last_chunk = chunk
+                        yield chunk
+                except Exception as e:
+                    if received:
+                        limiter.record_failure()
+                        raise
+                    error = e
+                else:
+                    # 마지막 조각에 전체 사용량이 담김
+                    limiter.settle(entry, _usage_tokens(last_chunk))
+                    self._record_route(task, model_name, started_at, last_chunk)
+                    return
+                finally:
+                    limiter.end(started_at)
+
+            time.sleep(self._handle_failure(limiter, attempt, error))
+            attempt += 1
+
+    def generate_content(self, model: str, contents, estimated_tokens: int = None, task: str = None, **kwargs):
+        """
+        Gemini generate_content (공유 클라이언트 + 게이트웨이 제한 적용)
+
+        Args:
+            model: Gemini 모델 이름
+            contents: 요청 내용
+            estimated_tokens: 예약할 추정 토큰 수 (없으면 contents로 추정)
+            task: 작업 종류 (지정하면 경로별 지연 시간/비용 기록)
+
+        Returns:
+            GenerateContentResponse
+        """
+        client = self.gemini_client()
+        return self.call(
+            model, client.models.generate_content,
+            model=model, contents=contents,
+            estimated_tokens=estimated_tokens if estimated_tokens is not None else estimate_tokens(contents),
+            task=task, **kwargs
+        )
+
+    def generate_content_stream(self, model: str, contents, estimated_tokens: int = None, task: str = None, **kwargs):
+        """
+        Gemini generate_content_stream (공유 클라이언트 + 게이트웨이 제한 적용)
+
+        Yields:
+            GenerateContentResponse 조각
+        """
+        client = self.gemini_client()
+        return self.stream(
+            model, client.models.generate_content_stream,
+            model=model, contents=contents,
+            estimated_tokens=estimated_tokens if estimated_tokens is not None else estimate_tokens(contents),
+            task=task, **kwargs
+        )
+
+    def get_metrics(self) -> dict:
+        """
+        모델별 호출 지표
+
+        Returns:
+            dict: {모델: {concurrency, in_flight, 분당 요청/토큰, calls, failures, retries, throttled, avg_latency_seconds}}
+        """
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return {limiter.model: limiter.get_metrics() for limiter in limiters}
+
+
+class GatewayEmbeddings(Embeddings):
+    """
+    langchain Embeddings 인터페이스를 유지하면서 호출을 게이트웨이로 보내는 래퍼
+    (Chroma 등 embedding_function을 받는 곳에 그대로 전달 가능)
+    """
+
+    def __init__(self, gateway: LLMGateway, embeddings: Embeddings, model_name: str):
+        self.gateway = gateway
+        self.embeddings = embeddings
+        self.model_name = model_name
+
+    def embed_documents(self, texts: list) -> list:
+        return self.gateway.call(self.model_name, self.embeddings.embed_documents, texts)
+
+    def embed_query(self, text: str) -> list:
+        return self.gateway.call(self.model_name, self.embeddings.embed_query, text)
+
+
+# 싱글톤 인스턴스
+llm_gateway = LLMGateway()
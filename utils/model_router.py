@@ -0,0 +1,116 @@
+"""
+모델 라우팅
+작업 종류, 추정 입력 토큰 수, 오디오 길이로 Gemini 모델을 고르고 (config.MODEL_ROUTES),
+경로(작업/모델)별 지연 시간과 비용을 집계합니다.
+"""
+import logging
+import threading
+from collections import deque
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+
+class ModelRouter:
+    """작업별 모델 선택 + 경로별 지연 시간/비용 지표"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def route(self, task: str, input_tokens: int = None, audio_seconds: float = None) -> str:
+        """
+        작업에 사용할 모델 선택
+        규칙을 위에서부터 검사하여 처음 맞는 모델을 사용하며,
+        조건 값(토큰 수/오디오 길이)을 모르면 해당 조건이 있는 규칙은 건너뜁니다. (큰 모델 쪽으로 안전하게)
+
+        Args:
+            task: 작업 종류 (stt, summary, minutes, mindmap, chat, agent)
+            input_tokens: 추정 입력 토큰 수
+            audio_seconds: 오디오 길이 (초)
+
+        Returns:
+            str: 모델 이름
+        """
+        for rule in config.MODEL_ROUTES.get(task, []):
+            if 'max_tokens' in rule and (input_tokens is None or input_tokens > rule['max_tokens']):
+                continue
+            if 'max_audio_seconds' in rule and (audio_seconds is None or audio_seconds > rule['max_audio_seconds']):
+                continue
+            return rule['model']
+        return config.MODEL_DEFAULT
+
+    @staticmethod
+    def estimate_cost(model: str, input_tokens: int, output_tokens: int, audio_input: bool = False) -> float:
+        """
+        호출 비용 추정 (USD, config.MODEL_PRICING 기준)
+
+        Args:
+            model: 모델 이름
+            input_tokens: 입력 토큰 수
+            output_tokens: 출력 토큰 수 (thinking 토큰 포함)
+            audio_input: 입력이 오디오인 요청 (STT) - 오디오 입력 가격 적용
+                         (함께 보내는 프롬프트 텍스트는 입력의 일부라 오디오 가격으로 함께 계산)
+
+        Returns:
+            float: 비용 (가격 정보가 없으면 0.0)
+        """
+        pricing = config.MODEL_PRICING.get(model)
+        if not pricing:
+            return 0.0
+        input_price = pricing.get('audio_input', pricing['input']) if audio_input else pricing['input']
+        return (input_tokens * input_price + output_tokens * pricing['output']) / 1_000_000
+
+    def record(self, task: str, model: str, latency_seconds: float, input_tokens: int, output_tokens: int):
+        """
+        경로(작업/모델) 호출 1건 기록
+
+        Args:
+            task: 작업 종류
+            model: 사용한 모델
+            latency_seconds: 응답 시간 (초)
+            input_tokens: 입력 토큰 수
+            output_tokens: 출력 토큰 수
+        """
+        key = f"{task}:{model}"
+        cost = self.estimate_cost(model, input_tokens, output_tokens, audio_input=(task == 'stt'))
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = {
+                    'calls': 0, 'total_latency': 0.0, 'recent_latencies': deque(maxlen=200),
+                    'input_tokens': 0, 'output_tokens': 0, 'cost_usd': 0.0
+                }
+            stats['calls'] += 1
+            stats['total_latency'] += latency_seconds
+            stats['recent_latencies'].append(latency_seconds)
+            stats['input_tokens'] += input_tokens
+            stats['output_tokens'] += output_tokens
+            stats['cost_usd'] += cost
+
+    def get_metrics(self) -> dict:
+        """
+        경로별 지표
+
+        Returns:
+            dict: {"작업:모델": {calls, avg/p95 지연 시간(초), 입력/출력 토큰, 누적 비용(USD), 호출당 비용}}
+        """
+        with self._lock:
+            metrics = {}
+            for key, stats in self._stats.items():
+                recent = sorted(stats['recent_latencies'])
+                metrics[key] = {
+                    'calls': stats['calls'],
+                    'avg_latency_seconds': round(stats['total_latency'] / stats['calls'], 3),
+                    'p95_latency_seconds': round(recent[min(len(recent) - 1, int(len(recent) * 0.95))], 3),
+                    'input_tokens': stats['input_tokens'],
+                    'output_tokens': stats['output_tokens'],
+                    'cost_usd': round(stats['cost_usd'], 4),
+                    'cost_per_call_usd': round(stats['cost_usd'] / stats['calls'], 5)
+                }
+            return metrics
+
+
+# 싱글톤 인스턴스
+model_router = ModelRouter()
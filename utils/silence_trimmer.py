@@ -0,0 +1,223 @@
+"""
+무음 구간 제거 (에너지 기반 VAD)
+STT 전에 긴 무음(입장 대기, 휴식, 음소거 등)을 잘라내고,
+잘라낸 오디오의 시간을 원본 미디어 시간으로 되돌리기 위한 오프셋 맵을 만듭니다.
+"""
+import os
+import math
+import shutil
+import logging
+import tempfile
+import subprocess
+
+import numpy as np
+
+from config import config
+from utils.ffmpeg_utils import run_ffmpeg, stt_audio_args, ffmpeg_slots
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+BYTES_PER_SAMPLE = 2  # s16le
+
+
+def _decode_to_pcm(audio_path: str, pcm_path: str, on_wait=None) -> bool:
+    """오디오를 16kHz 모노 s16le raw PCM 파일로 디코딩"""
+    command = [
+        'ffmpeg', '-y', '-i', audio_path,
+        '-vn', '-ac', '1', '-ar', str(SAMPLE_RATE),
+        '-f', 's16le', '-acodec', 'pcm_s16le',
+        pcm_path
+    ]
+    result = run_ffmpeg(command, on_wait=on_wait)
+    if result.returncode != 0:
+        logger.error(f"❌ PCM 디코딩 실패: {result.stderr[:300]}")
+        return False
+    return True
+
+
+def _frame_energies_db(samples: np.ndarray, frame_size: int) -> np.ndarray:
+    """프레임별 RMS 에너지 (dBFS)"""
+    frame_count = len(samples) // frame_size
+    energies = np.empty(frame_count, dtype=np.float32)
+
+    # memmap을 블록 단위로 읽어 메모리 사용량을 일정하게 유지
+    block_frames = 10000
+    for start in range(0, frame_count, block_frames):
+        end = min(start + block_frames, frame_count)
+        block = samples[start * frame_size:end * frame_size].astype(np.float32) / 32768.0
+        rms = np.sqrt(np.mean(block.reshape(-1, frame_size) ** 2, axis=1))
+        energies[start:end] = 20 * np.log10(rms + 1e-9)
+    return energies
+
+
+def detect_speech_regions(energies_db: np.ndarray, frame_seconds: float, total_seconds: float) -> list:
+    """
+    프레임 에너지로 남길(음성) 구간 계산
+
+    Args:
+        energies_db: 프레임별 에너지 (dBFS)
+        frame_seconds: 프레임 길이 (초)
+        total_seconds: 전체 길이 (초)
+
+    Returns:
+        list: [(start, end), ...] 원본 기준 남길 구간 (초)
+    """
+    if len(energies_db) == 0:
+        return [(0.0, total_seconds)]
+
+    # 잡음 바닥(하위 10%) + 여유값을 임계값으로 사용, 단 절대 무음 기준보다 낮아지지 않게
+    noise_floor = float(np.percentile(energies_db, 10))
+    threshold = max(noise_floor + config.VAD_THRESHOLD_MARGIN_DB, config.VAD_SILENCE_FLOOR_DB)
+    silent = energies_db < threshold
+
+    # 무음 프레임 연속 구간의 시작/끝 찾기
+    padded = np.concatenate(([False], silent, [False])).astype(np.int8)
+    edges = np.diff(padded)
+    run_starts = np.where(edges == 1)[0]
+    run_ends = np.where(edges == -1)[0]
+
+    min_silence_frames = math.ceil(config.VAD_MIN_SILENCE_SECONDS / frame_seconds)
+    padding = config.VAD_PADDING_SECONDS
+
+    regions = []
+    cursor = 0.0
+    for run_start, run_end in zip(run_starts, run_ends):
+        if run_end - run_start < min_silence_frames:
+            continue
+        # 발화 앞뒤가 잘리지 않도록 여유(padding)를 남기고 무음 제거
+        cut_start = run_start * frame_seconds + padding
+        cut_end = min(run_end * frame_seconds, total_seconds) - padding
+        if run_start == 0:
+            cut_start = 0.0
+        if run_end == len(energies_db):
+            cut_end = total_seconds
+        if cut_end <= cut_start:
+            continue
+        if cut_start > cursor:
+            regions.append((cursor, cut_start))
+        cursor = cut_end
+
+    if cursor < total_seconds:
+        regions.append((cursor, total_seconds))
+
+    return [(float(start), float(end)) for start, end in regions]
+
+
+def _write_regions(samples: np.ndarray, regions: list, output_path: str, log_path: str, on_wait=None) -> bool:
+    """남길 구간의 샘플만 인코더(ffmpeg stdin)로 전달하여 STT 포맷으로 저장 (샘플 단위로 정확히 자름)"""
+    command = [
+        'ffmpeg', '-y', '-nostats',
+        '-f', 's16le', '-ar', str(SAMPLE_RATE), '-ac', '1', '-i', 'pipe:0'
+    ] + stt_audio_args(output_path) + [output_path]
+
+    # stderr를 파이프로 받으면 버퍼가 차서 stdin 쓰기와 교착될 수 있으므로 파일로 기록
+    with open(log_path, 'wb') as log_file, ffmpeg_slots.slot(on_wait):
+        process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=log_file)
+        try:
+            block_samples = SAMPLE_RATE * 10
+            for start, end in regions:
+                first = int(round(start * SAMPLE_RATE))
+                last = int(round(end * SAMPLE_RATE))
+                for offset in range(first, last, block_samples):
+                    process.stdin.write(samples[offset:min(offset + block_samples, last)].tobytes())
+            process.stdin.close()
+            process.wait(timeout=config.UPLOAD_TIMEOUT_SECONDS)
+        except Exception:
+            process.kill()
+            raise
+
+    if process.returncode != 0:
+        with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
+            logger.error(f"❌ 무음 제거 오디오 인코딩 실패: {f.read()[-300:]}")
+        return False
+    return True
+
+
+def trim_silence(audio_path: str, output_path: str, on_wait=None):
+    """
+    긴 무음 구간을 제거한 오디오 생성
+
+    Args:
+        audio_path: 원본 오디오 경로
+        output_path: 무음 제거 오디오 저장 경로 (확장자로 포맷 결정)
+        on_wait: on_wait(position, depth) ffmpeg 슬롯 대기 순서 알림 콜백
+
+    Returns:
+        list or None: 오프셋 맵 [(trimmed_start, original_start, duration), ...]
+                      제거할 무음이 적거나 실패하면 None (원본 그대로 사용)
+    """
+    work_dir = tempfile.mkdtemp(prefix="vad_")
+    samples = None
+    try:
+        pcm_path = os.path.join(work_dir, "audio.pcm")
+        if not _decode_to_pcm(audio_path, pcm_path, on_wait):
+            return None
+
+        sample_count = os.path.getsize(pcm_path) // BYTES_PER_SAMPLE
+        if sample_count == 0:
+            return None
+
+        samples = np.memmap(pcm_path, dtype=np.int16, mode='r', shape=(sample_count,))
+        total_seconds = sample_count / SAMPLE_RATE
+        frame_size = int(SAMPLE_RATE * config.VAD_FRAME_MS / 1000)
+
+        energies_db = _frame_energies_db(samples, frame_size)
+        regions = detect_speech_regions(energies_db, frame_size / SAMPLE_RATE, total_seconds)
+
+        if not regions:
+            logger.info("ℹ️ 음성 구간을 찾지 못해 원본 사용")
+            return None
+
+        kept_seconds = sum(end - start for start, end in regions)
+        removed_ratio = 1 - kept_seconds / total_seconds
+        if removed_ratio < config.VAD_MIN_SAVED_RATIO:
+            logger.info(f"ℹ️ 제거할 무음이 적어 원본 사용 (무음 {removed_ratio * 100:.1f}%)")
+            return None
+
+        if not _write_regions(samples, regions, output_path, os.path.join(work_dir, "encode.log"), on_wait):
+            return None
+
+        offset_map = []
+        trimmed_start = 0.0
+        for start, end in regions:
+            offset_map.append((trimmed_start, start, end - start))
+            trimmed_start += end - start
+
+        logger.info(f"✂️ 무음 제거: {total_seconds:.0f}초 → {kept_seconds:.0f}초 "
+                    f"({removed_ratio * 100:.1f}% 제거, {len(regions)}개 구간)")
+        return offset_map
+
+    except Exception as e:
+        logger.warning(f"⚠️ 무음 제거 실패, 원본 사용: {e}")
+        return None
+
+    finally:
+        # memmap 참조를 먼저 해제해야 (Windows에서) 임시 PCM 파일 삭제 가능
+        samples = None
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def to_original_time(offset_map: list, trimmed_time: float) -> float:
+    """
+    무음 제거 오디오의 시간을 원본 미디어 시간으로 변환
+
+    Args:
+        offset_map: trim_silence가 반환한 오프셋 맵
+        trimmed_time: 무음 제거 오디오 기준 시간 (초)
+
+    Returns:
+        float: 원본 기준 시간 (초)
+    """
+    if not offset_map:
+        return trimmed_time
+
+    # trimmed_time을 포함하는 마지막 구간 찾기 (구간 수가 적어 선형 탐색)
+    mapped = offset_map[0]
+    for region in offset_map:
+        if region[0] > trimmed_time:
+            break
+        mapped = region
+
+    trimmed_start, original_start, duration = mapped
+    return original_start + min(max(trimmed_time - trimmed_start, 0.0), duration)
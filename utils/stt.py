@@ -1,72 +1,78 @@
 import os
 import json
+import shutil
+import bisect
+import difflib
+import hashlib
+import re
 import logging
-from google import genai
+import tempfile
+import itertools
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from google.genai import types
 
 from config import config
+from utils.db_manager import DatabaseManager
+from utils.ffmpeg_utils import probe_duration, cut_audio_segment, stt_audio_extension
+from utils.gemini_files import GeminiFileStore
+from utils.llm_gateway import llm_gateway, estimate_tokens
+from utils.model_router import model_router
+from utils.hedging import stt_hedger
+from utils.json_stream import JSONArrayStreamParser, salvage_json_array
 
 logger = logging.getLogger(__name__)
 
 
-class STTManager:
-    _instance = None
-    _initialized = False
+# STT 입력 오디오 확장자별 MIME 타입
+STT_MIME_TYPES = {
+    ".wav": "audio/wav", ".mp3": "audio/mp3",
+    ".m4a": "audio/mp4", ".flac": "audio/flac",
+    ".ogg": "audio/ogg", ".opus": "audio/ogg",
+}
 
-    def __new__(cls, *args, **kwargs):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+# STT 프롬프트 버전 (프롬프트를 수정하면 올려야 기존 STT 캐시가 재사용되지 않음)
+STT_PROMPT_VERSION = "1"
 
-    def __init__(self):
-        if self._initialized:
-            return
+# 요약/회의록/마인드맵 프롬프트 버전 (템플릿이나 응답 후처리를 바꾸면 올려야 LLM 응답 캐시가 재사용되지 않음)
+SUMMARY_PROMPT_VERSION = "1"
+MINUTES_PROMPT_VERSION = "1"
+MINDMAP_PROMPT_VERSION = "1"
 
-        self._initialized = True
+# 긴 회의 구간 요약(map) 프롬프트 - 발화 번호 [n]을 그대로 인용에 사용
+SUMMARY_MAP_PROMPT = """당신은 긴 회의 스크립트의 일부 구간을 구조화된 주제별 요약본으로 변환하는 AI 어시스턴트입니다.
 
-    @staticmethod
-    def _parse_mmss_to_seconds(time_str):
-        """
-        '분:초:밀리초' 형태의 문자열을 초 단위로 변환합니다.
-        """
-        try:
-            parts = time_str.split(":")
-            if len(parts) == 3:
-                minutes = int(parts[0])
-                seconds = int(parts[1])
-                milliseconds = int(parts[2])
-                return minutes * 60 + seconds + milliseconds / 1000.0
-            else:
-                return 0.0
-        except:
-            return 0.0
-        
-    
-    def transcribe_audio(self, audio_path):
-        """Google Gemini STT API로 음성 인식"""
-        try:
-            import threading
-            import datetime
-            thread_id = threading.current_thread().name
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            logger.info(f"[{timestamp}][{thread_id}] 🎧 Gemini STT API로 음성 인식 중: {audio_path}")
-            api_key = config.GOOGLE_API_KEY
-            if api_key:
-                client = genai.Client(api_key=api_key)
-            else:
-                client = genai.Client()
+            **입력 형식:**
+            회의 제목 "{title}"의 전체 {total}개 구간 중 {part}번째 구간입니다. (발화 {first}~{last}번)
+            각 줄은 "[발화 번호] 화자 번호: 발화 내용" 형식입니다.
 
-            with open(audio_path, "rb") as f:
-                file_bytes = f.read()
+            **출력 요구사항:**
+            1.  이 구간에서 논의된 주요 주제별로 **반드시 "### 제목" 형식**의 소주제 제목을 만듭니다.
+            2.  각 제목 바로 아래 줄부터 핵심 주장, 사실, 의견을 글머리 기호(`*`)로 요약합니다.
+            3.  구어체를 간결한 서술형 문어체로 바꾸고, 화자 표시와 군더더기는 제거합니다.
+            4.  모든 글머리 기호 끝에 근거가 된 발화 번호를 `[cite: n]` 또는 `[cite: n, m]` 형식으로 붙입니다.
+                번호는 입력의 [발화 번호]를 그대로 사용하며, 새로 매기지 않습니다.
+            5.  서론이나 설명 없이 요약본만 출력합니다.
+
+            [스크립트 구간]
+            {transcript_text}"""
 
-            file_ext = os.path.splitext(audio_path)[1].lower()
-            mime_type_map = {
-                ".wav": "audio/wav", ".mp3": "audio/mp3",
-                ".m4a": "audio/mp4", ".flac": "audio/flac",
-            }
-            mime_type = mime_type_map.get(file_ext, "audio/wav")
+# 긴 회의 구간 요약 병합(reduce) 프롬프트 - 인용 번호 보존
+SUMMARY_REDUCE_PROMPT = """당신은 긴 회의를 구간별로 나누어 만든 요약들을 하나의 최종 주제별 요약본으로 병합하는 AI 어시스턴트입니다.
 
-            prompt = """
+            **출력 요구사항:**
+            1.  회의 제목 : {title}
+            2.  여러 구간에 걸쳐 이어진 같은 주제는 하나의 소주제로 합치고, 회의 흐름 순서대로 배치합니다.
+            3.  소주제 제목은 **반드시 "### 제목" 형식**으로 작성하고, 제목 바로 다음 줄부터 글머리 기호(`*`)로 내용을 작성합니다.
+            4.  서로 다른 소주제 사이에는 줄바꿈을 2개 넣습니다.
+            5.  인용 보존 (필수): 각 글머리 기호 끝의 `[cite: n]` 번호는 구간 요약에 있던 번호를 그대로 유지합니다.
+                여러 항목을 합친 경우 관련 번호를 모두 나열하고(예: `[cite: 12, 87]`), 없던 번호를 만들지 않습니다.
+            6.  서론이나 설명 없이 최종 요약본만 출력합니다.
+
+            [구간 요약]
+            {partial_text}"""
+
+STT_PROMPT = """
             당신은 최고 수준의 정확도를 가진 전문적인 회의록 STT 시스템입니다. 제공된 오디오 파일을 듣고 다음의 지침에 따라 텍스트 변환 및 화자 분리 작업을 엄격하게 수행해 주십시오.
 
             I. 핵심 지침 (오류 방지)
@@ -106,69 +112,718 @@ class STTManager:
             JSON 배열만 출력하고, 추가 설명이나 마크다운 코드 블록은 포함하지 마세요.
             """
 
-            logger.info("🤖 Gemini 2.5 Pro로 음성 인식 중...")
-            response = client.models.generate_content(
-                model="gemini-2.5-pro",
-                contents=[prompt, types.Part.from_bytes(data=file_bytes, mime_type=mime_type)],
-            )
 
-            # response.text가 None인지 체크
-            if response.text is None:
-                logger.warning("⚠️ Gemini 응답이 비어있습니다. 응답 상태 확인:")
-                logger.warning(f"   -candidates: {response.candidates if hasattr(response, 'candidates') else 'N/A'}")
-                logger.warning(f"   -prompt_feedback: {response.prompt_feedback if hasattr(response, 'prompt_feedback') else 'N/A'}")
+class STTManager:
+    _instance = None
+    _initialized = False
 
-                # 안전 필터링 체크
-                if hasattr(response, 'prompt_feedback') and response.prompt_feedback:
-                    logger.warning(f"⚠️ 프롬프트가 차단되었을 수 있습니다: {response.prompt_feedback}")
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
 
-                raise ValueError("Gemini API가 빈 응답을 반환했습니다. 안전 필터링 또는 API 오류일 수 있습니다.")
+    def __init__(self):
+        if self._initialized:
+            return
 
-            cleaned_response = response.text.strip().replace("```json", "").replace("```", "").strip()
+        # 큰 오디오 업로드용 저장소 (None이면 요청마다 GeminiFileStore 사용, 테스트 시 LocalFileStore 주입)
+        self.file_store = None
+        # LLM 응답 캐시 저장소
+        self.db = DatabaseManager(str(config.DATABASE_PATH))
+        self._initialized = True
 
-            # JSON 파싱 시도
-            try:
-                result_list = json.loads(cleaned_response)
-            except json.JSONDecodeError as e:
-                logger.error(f"❌ JSON 파싱 실패: {e}")
-                logger.info(f"📝 오류 위치: line {e.lineno}, column {e.colno}")
-
-                # 응답 일부 출력 (디버깅용)
-                lines = cleaned_response.split('\n')
-                if e.lineno <= len(lines):
-                    error_line = lines[e.lineno - 1]
-                    logger.info(f"📄 오류 발생 줄: {error_line}")
-                    if e.colno > 0:
-                        logger.info(f"    {' ' * (e.colno - 1)}^ 여기")
-
-                # 전체 응답 저장 (디버깅용)
-                error_log_path = os.path.join(os.path.dirname(__file__), '..', 'gemini_error_response.txt')
-                with open(error_log_path, 'w', encoding='utf-8') as f:
-                    f.write(cleaned_response)
-                logger.info(f"📁 전체 응답이 저장되었습니다: {error_log_path}")
+    @staticmethod
+    def _parse_mmss_to_seconds(time_str):
+        """
+        '분:초:밀리초' 형태의 문자열을 초 단위로 변환합니다.
+        """
+        try:
+            parts = time_str.split(":")
+            if len(parts) == 3:
+                minutes = int(parts[0])
+                seconds = int(parts[1])
+                milliseconds = int(parts[2])
+                return minutes * 60 + seconds + milliseconds / 1000.0
+            else:
+                return 0.0
+        except:
+            return 0.0
+        
+    
+    def transcribe_audio(self, audio_path, on_segment=None, audio_seconds=None):
+        """
+        Google Gemini STT API로 음성 인식
+        STT_WINDOW_THRESHOLD_SECONDS보다 긴 오디오는 구간 분할 후 병렬로 인식합니다.
 
-                raise ValueError(f"Gemini 응답이 올바른 JSON 형식이 아닙니다: {e}")
+        Args:
+            audio_path: 오디오 파일 경로
+            on_segment: on_segment(segment) 세그먼트 완성 시 호출되는 콜백 (단일 요청 스트리밍 시에만 호출)
+            audio_seconds: 모델 선택 기준 녹음 길이 (None이면 파일 길이, 실시간 녹음 구간은 녹음 경과 시간)
 
-            normalized_segments = []
-            for idx, segment in enumerate(result_list):
-                normalized_segments.append({
-                    "id": idx,
-                    "speaker": segment.get("speaker", 1),
-                    "start_time": self._parse_mmss_to_seconds(segment.get("start_time_mmss", "0:00:000")),
-                    "confidence": segment.get("confidence", 0.0),
-                    "text": segment.get("text", ""),
-                })
-            logger.info("✅ Gemini 음성 인식 완료")
-            
-            return normalized_segments
+        Returns:
+            tuple: (정규화된 세그먼트 목록, 실제로 인식한 모델), 실패 시 (None, None)
+                   (헤징 대체 모델이 이긴 경우 그 모델 - STT 캐시 키로 사용)
+        """
+        try:
+            import threading
+            import datetime
+            thread_id = threading.current_thread().name
+            timestamp = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
+            logger.info(f"[{timestamp}][{thread_id}] 🎧 Gemini STT API로 음성 인식 중: {audio_path}")
+            client = llm_gateway.gemini_client()
+
+            # 전체 녹음 길이로 모델 선택 (구간 분할 시에도 같은 모델 사용)
+            duration = probe_duration(audio_path)
+            if audio_seconds is None:
+                audio_seconds = duration if duration > 0 else None
+            model = model_router.route('stt', audio_seconds=audio_seconds)
+
+            if config.STT_WINDOW_ENABLED and duration > config.STT_WINDOW_THRESHOLD_SECONDS:
+                return self._transcribe_windowed(client, audio_path, duration, model)
+
+            normalized_segments, used_model = self._transcribe_file(client, audio_path, on_segment=on_segment, model=model)
+            logger.info(f"✅ Gemini 음성 인식 완료 ({used_model})")
+
+            return normalized_segments, used_model
 
         except Exception as e:
             import traceback
             traceback.print_exc()
             logger.error(f"❌ Gemini 오류 발생: {e}")
+            return None, None
+
+    @staticmethod
+    def _produced_by(model, used_models):
+        """
+        여러 요청(구간, 누락 구간 재인식)의 결과를 합친 세그먼트를 만든 모델
+        헤징 대체 모델이 응답한 요청이 하나라도 있으면 그 모델로 봅니다. (결과 품질을 낮은 쪽 기준으로 기록)
+
+        Args:
+            model: 요청한 모델
+            used_models: 요청별로 실제 응답한 모델 목록
+
+        Returns:
+            str: 모델 이름
+        """
+        return next((used for used in used_models if used != model), model)
+
+    def _transcribe_file(self, client, audio_path, on_segment=None, salvage_retries=None, model=None,
+                         hedge=True):
+        """
+        오디오 파일 하나를 단일 Gemini 요청으로 인식하여 정규화된 세그먼트를 반환합니다.
+        STT_INLINE_MAX_BYTES 이하는 요청에 인라인으로 싣고, 그보다 크면 Files API로
+        업로드한 뒤 URI로 참조합니다. (파일 전체를 메모리에 올리지 않음)
+        on_segment가 주어지고 STT_STREAMING_ENABLED이면 스트리밍 응답을 받으며
+        세그먼트가 완성될 때마다 on_segment(segment)를 호출합니다.
+        응답 JSON이 잘리거나 깨지면 온전한 세그먼트만 살리고, 누락된 뒷부분만 다시 인식합니다.
+        (최대 salvage_retries회, 기본 STT_SALVAGE_MAX_RETRIES)
+        model을 지정하지 않으면 이 파일의 길이로 모델을 고릅니다. (MODEL_ROUTES['stt'])
+        STT_HEDGE_ENABLED이면 느린 요청을 대체 모델로 헤징합니다. (utils/hedging.py)
+        hedge=False이면 지정한 모델로만 인식합니다. (재인식처럼 모델이 결과의 전제인 경우)
+        살릴 세그먼트가 하나도 없으면 예외를 발생시킵니다.
+
+        Returns:
+            tuple: (세그먼트 목록, 실제로 인식한 모델)
+        """
+        if salvage_retries is None:
+            salvage_retries = config.STT_SALVAGE_MAX_RETRIES
+        # 길이는 모델 선택, 게이트웨이 토큰 예약, 헤징 대기 한도에 사용
+        duration = probe_duration(audio_path)
+        if duration <= 0:
+            duration = None
+        if model is None:
+            model = model_router.route('stt', audio_seconds=duration)
+
+        file_ext = os.path.splitext(audio_path)[1].lower()
+        mime_type = STT_MIME_TYPES.get(file_ext, "audio/wav")
+
+        file_store = None
+        uploaded = None
+        if os.path.getsize(audio_path) <= config.STT_INLINE_MAX_BYTES:
+            with open(audio_path, "rb") as f:
+                audio_part = types.Part.from_bytes(data=f.read(), mime_type=mime_type)
+        else:
+            file_store = self.file_store or GeminiFileStore(client)
+            uploaded = file_store.upload(audio_path, mime_type)
+            audio_part = types.Part.from_uri(file_uri=uploaded.uri, mime_type=uploaded.mime_type)
+
+        try:
+            if on_segment and config.STT_STREAMING_ENABLED:
+                segments, complete, used_model = self._transcribe_stream(client, audio_part, on_segment, model, duration,
+                                                                             hedge)
+                return self._complete_segments(client, audio_path, segments, complete, salvage_retries, model,
+                                               used_model, hedge)
+
+            logger.info(f"🤖 {model}로 음성 인식 중...")
+            response, used_model = self._generate_stt(client, audio_part, model, duration, hedge)
+        finally:
+            # 업로드한 파일은 인식 성공/실패와 관계없이 정리
+            if uploaded:
+                file_store.delete(uploaded)
+
+        # response.text가 None인지 체크
+        if response.text is None:
+            logger.warning("⚠️ Gemini 응답이 비어있습니다. 응답 상태 확인:")
+            logger.warning(f"   -candidates: {response.candidates if hasattr(response, 'candidates') else 'N/A'}")
+            logger.warning(f"   -prompt_feedback: {response.prompt_feedback if hasattr(response, 'prompt_feedback') else 'N/A'}")
+
+            # 안전 필터링 체크
+            if hasattr(response, 'prompt_feedback') and response.prompt_feedback:
+                logger.warning(f"⚠️ 프롬프트가 차단되었을 수 있습니다: {response.prompt_feedback}")
+
+            raise ValueError("Gemini API가 빈 응답을 반환했습니다. 안전 필터링 또는 API 오류일 수 있습니다.")
+
+        segments, complete = self._parse_segments(response.text)
+        return self._complete_segments(client, audio_path, segments, complete, salvage_retries, model, used_model,
+                                       hedge)
+
+    @staticmethod
+    def _stt_estimated_tokens(audio_seconds):
+        """
+        STT 요청 1건의 추정 입력 토큰 (프롬프트 + 오디오 길이 x STT_AUDIO_TOKENS_PER_SECOND)
+        오디오 Part는 텍스트로 추정할 수 없으므로 길이로 계산합니다.
+
+        Returns:
+            int or None: 길이를 모르면 None (게이트웨이가 인자로 추정)
+        """
+        if not audio_seconds:
+            return None
+        return estimate_tokens(STT_PROMPT) + int(audio_seconds * config.STT_AUDIO_TOKENS_PER_SECOND)
+
+    def _generate_stt(self, client, audio_part, model, audio_seconds, hedge=True):
+        """
+        STT 요청 1건 (비스트리밍)
+        헤징이 켜져 있고 대체 모델이 있으면 응답이 과거 지연 시간 백분위를 넘을 때
+        대체 모델로 같은 요청을 보내 먼저 끝난 응답을 사용합니다.
+
+        Args:
+            client: Gemini 클라이언트
+            audio_part: 오디오 Part (인라인 또는 Files API URI)
+            model: 기본 모델
+            audio_seconds: 오디오 길이 (초, 토큰 예약량/헤징 대기 한도 계산용)
+            hedge: False이면 헤징하지 않음
+
+        Returns:
+            tuple: (Gemini 응답, 응답한 모델)
+        """
+        estimated_tokens = self._stt_estimated_tokens(audio_seconds)
+
+        def request(request_model):
+            return lambda: (llm_gateway.call(
+                request_model, client.models.generate_content,
+                model=request_model,
+                contents=[STT_PROMPT, audio_part],
+                estimated_tokens=estimated_tokens,
+                task='stt',
+            ), request_model)
+
+        alternate = config.STT_HEDGE_ALTERNATE_MODELS.get(model)
+        if not hedge or not config.STT_HEDGE_ENABLED or not alternate:
+            return request(model)()
+        return stt_hedger.run(f"stt:{model}", audio_seconds, request(model),
+                              f"stt:{alternate}", request(alternate))
+
+    def _open_stt_stream(self, client, audio_part, model, audio_seconds, hedge=True):
+        """
+        STT 스트리밍 요청 열기
+        헤징은 첫 응답 조각까지의 시간을 기준으로 하며, 첫 조각을 먼저 받은 스트림을 사용하고
+        진 쪽 스트림은 닫습니다. (세그먼트 전달이 시작된 뒤에는 모델을 바꾸지 않음)
+
+        Returns:
+            tuple: (응답 조각 iterator, 응답한 모델)
+        """
+        estimated_tokens = self._stt_estimated_tokens(audio_seconds)
+
+        def request(request_model):
+            def open_stream():
+                stream = llm_gateway.stream(
+                    request_model, client.models.generate_content_stream,
+                    model=request_model,
+                    contents=[STT_PROMPT, audio_part],
+                    estimated_tokens=estimated_tokens,
+                    task='stt',
+                )
+                return next(stream, None), stream, request_model
+            return open_stream
+
+        alternate = config.STT_HEDGE_ALTERNATE_MODELS.get(model)
+        if not hedge or not config.STT_HEDGE_ENABLED or not alternate:
+            first_chunk, stream, used_model = request(model)()
+        else:
+            first_chunk, stream, used_model = stt_hedger.run(
+                f"stt_stream:{model}", audio_seconds, request(model),
+                f"stt_stream:{alternate}", request(alternate),
+                discard=lambda result: result[1].close()
+            )
+        if first_chunk is None:
+            return stream, used_model
+        return itertools.chain([first_chunk], stream), used_model
+
+    def _transcribe_stream(self, client, audio_part, on_segment, model, audio_seconds=None, hedge=True):
+        """
+        스트리밍 응답으로 인식하며, JSON 배열의 세그먼트 객체가 완성될 때마다
+        정규화하여 on_segment(segment)로 즉시 전달합니다.
+        스트림이 배열을 정상적으로 닫지 못한 경우 전체 응답을 다시 파싱합니다.
+
+        Returns:
+            tuple: (세그먼트 목록, 완전 여부, 응답한 모델)
+        """
+        logger.info(f"🤖 {model}로 음성 인식 중... (스트리밍)")
+        parser = JSONArrayStreamParser()
+        normalized_segments = []
+        response_chunks = []
+
+        chunks, used_model = self._open_stt_stream(client, audio_part, model, audio_seconds, hedge)
+        for chunk in chunks:
+            text = chunk.text or ""
+            response_chunks.append(text)
+
+            for segment in parser.feed(text):
+                normalized = self._normalize_segment(segment, len(normalized_segments))
+                normalized_segments.append(normalized)
+                try:
+                    on_segment(normalized)
+                except Exception as e:
+                    # 전달 실패(SSE/DB)가 인식 자체를 중단시키지 않도록 함
+                    logger.warning(f"⚠️ 세그먼트 콜백 오류: {e}")
+
+        if parser.finished and parser.skipped_count == 0:
+            logger.info(f"✅ 스트리밍 인식 완료: {len(normalized_segments)}개 세그먼트")
+            return normalized_segments, True, used_model
+
+        full_text = "".join(response_chunks)
+        if not full_text.strip():
+            raise ValueError("Gemini API가 빈 응답을 반환했습니다. 안전 필터링 또는 API 오류일 수 있습니다.")
+
+        logger.warning(f"⚠️ 스트리밍 응답이 완전하지 않아 전체 응답을 다시 파싱합니다 "
+                       f"(배열 종료: {parser.finished}, 건너뛴 객체: {parser.skipped_count})")
+        segments, complete = self._parse_segments(full_text)
+        return segments, complete, used_model
+
+    def _parse_segments(self, response_text):
+        """
+        Gemini 응답 텍스트(JSON 배열)를 정규화된 세그먼트 목록으로 변환합니다.
+        JSON 형식이 아니면 응답을 파일로 저장하고, 온전한 세그먼트 객체만 살립니다.
+        살릴 객체가 하나도 없으면 예외를 발생시킵니다.
+
+        Returns:
+            tuple: (세그먼트 목록, 완전 여부)
+        """
+        cleaned_response = response_text.strip().replace("```json", "").replace("```", "").strip()
+
+        # JSON 파싱 시도
+        try:
+            result_list = json.loads(cleaned_response)
+        except json.JSONDecodeError as e:
+            logger.error(f"❌ JSON 파싱 실패: {e}")
+            logger.info(f"📝 오류 위치: line {e.lineno}, column {e.colno}")
+
+            # 응답 일부 출력 (디버깅용)
+            lines = cleaned_response.split('\n')
+            if e.lineno <= len(lines):
+                error_line = lines[e.lineno - 1]
+                logger.info(f"📄 오류 발생 줄: {error_line}")
+                if e.colno > 0:
+                    logger.info(f"    {' ' * (e.colno - 1)}^ 여기")
+
+            # 전체 응답 저장 (디버깅용)
+            error_log_path = os.path.join(os.path.dirname(__file__), '..', 'gemini_error_response.txt')
+            with open(error_log_path, 'w', encoding='utf-8') as f:
+                f.write(cleaned_response)
+            logger.info(f"📁 전체 응답이 저장되었습니다: {error_log_path}")
+
+            # 잘린/깨진 응답에서 온전한 세그먼트 객체만 복구
+            result_list, complete = salvage_json_array(cleaned_response)
+            if not result_list:
+                raise ValueError(f"Gemini 응답이 올바른 JSON 형식이 아닙니다: {e}")
+            logger.warning(f"🩹 깨진 응답에서 세그먼트 {len(result_list)}개 복구 (완전: {complete})")
+            segments = [self._normalize_segment(segment, idx) for idx, segment in enumerate(result_list)]
+            return segments, complete
+
+        return [self._normalize_segment(segment, idx) for idx, segment in enumerate(result_list)], True
+
+    def _complete_segments(self, client, audio_path, segments, complete, salvage_retries, model, used_model,
+                           hedge=True):
+        """
+        불완전한 응답이면 살린 세그먼트 뒤의 누락 구간만 다시 인식하여 이어 붙입니다.
+        재인식 횟수를 다 썼거나 재인식이 실패하면 살린 세그먼트만 반환합니다.
+
+        Returns:
+            tuple: (세그먼트 목록, 실제로 인식한 모델)
+        """
+        if complete:
+            return segments, used_model
+
+        if salvage_retries <= 0:
+            logger.warning(f"⚠️ 누락 구간 재인식 횟수 초과, 복구된 {len(segments)}개 세그먼트만 사용")
+            return segments, used_model
+
+        duration = probe_duration(audio_path)
+        last_start = max(seg['start_time'] for seg in segments)
+        if duration <= 0 or duration - last_start < config.STT_SALVAGE_MIN_TAIL_SECONDS:
+            return segments, used_model
+
+        # 마지막으로 살린 발화 앞부분부터 다시 인식 (중복 구간으로 화자 번호 매칭 + 중복 발화 제거)
+        tail_start = max(0.0, last_start - config.STT_WINDOW_OVERLAP_SECONDS)
+        logger.info(f"🔁 누락 구간 재인식: {last_start:.0f}s~{duration:.0f}s (남은 재시도 {salvage_retries}회)")
+
+        work_dir = tempfile.mkdtemp(prefix="stt_tail_")
+        try:
+            tail_path = os.path.join(work_dir, f"tail{stt_audio_extension()}")
+            if not cut_audio_segment(audio_path, tail_path, tail_start, duration - tail_start):
+                logger.warning("⚠️ 누락 구간 오디오 추출 실패, 복구된 세그먼트만 사용")
+                return segments, used_model
+            tail_segments, tail_model = self._transcribe_file(client, tail_path, salvage_retries=salvage_retries - 1, model=model,
+                                                             hedge=hedge)
+        except Exception as e:
+            logger.warning(f"⚠️ 누락 구간 재인식 실패, 복구된 세그먼트만 사용: {e}")
+            return segments, used_model
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+        # 경계를 마지막으로 살린 발화 직후로 두고 구간 분할 STT와 같은 방식으로 병합
+        boundary = last_start + 0.001
+        windows = [(0.0, 2 * boundary - tail_start), (tail_start, duration)]
+        merged = self.stitch_windows(windows, [segments, tail_segments])
+        logger.info(f"✅ 누락 구간 복구 완료: {len(segments)}개 + 재인식 → 총 {len(merged)}개 세그먼트")
+        return merged, self._produced_by(model, [used_model, tail_model])
+
+    def _normalize_segment(self, segment, idx):
+        """Gemini 세그먼트 객체를 내부 세그먼트 형식으로 변환"""
+        return {
+            "id": idx,
+            "speaker": segment.get("speaker", 1),
+            "start_time": self._parse_mmss_to_seconds(segment.get("start_time_mmss", "0:00:000")),
+            "confidence": segment.get("confidence", 0.0),
+            "text": segment.get("text", ""),
+        }
+
+    # ==================== 구간 분할(windowed) STT ====================
+
+    @staticmethod
+    def _plan_windows(duration: float) -> list:
+        """
+        오디오 길이를 중복 구간이 있는 창(window)들로 나눕니다.
+
+        Returns:
+            list: [(start, end), ...] (초 단위)
+        """
+        window = config.STT_WINDOW_SECONDS
+        overlap = config.STT_WINDOW_OVERLAP_SECONDS
+        step = window - overlap
+
+        windows = []
+        start = 0.0
+        while start < duration:
+            end = min(start + window, duration)
+            windows.append((start, end))
+            if end >= duration:
+                break
+            start += step
+
+        # 마지막 창이 너무 짧으면 이전 창에 흡수
+        if len(windows) > 1 and windows[-1][1] - windows[-1][0] <= overlap:
+            windows.pop()
+            windows[-1] = (windows[-1][0], duration)
+
+        return windows
+
+    def _transcribe_windowed(self, client, audio_path: str, duration: float, model: str):
+        """
+        긴 오디오를 중복 구간이 있는 창으로 잘라 병렬 인식 후 하나의 타임라인으로 합칩니다.
+        전체 소요 시간은 회의 길이가 아니라 (창 개수 / 동시 요청 수)에 비례합니다.
+
+        Returns:
+            tuple: (세그먼트 목록, 실제로 인식한 모델)
+        """
+        windows = self._plan_windows(duration)
+        logger.info(f"🪟 구간 분할 STT: 길이 {duration:.0f}초 → {len(windows)}개 구간 "
+                    f"(동시 {config.STT_WINDOW_CONCURRENCY}개)")
+
+        work_dir = tempfile.mkdtemp(prefix="stt_windows_")
+        try:
+            def transcribe_window(index):
+                start, end = windows[index]
+                window_path = os.path.join(work_dir, f"window_{index:03d}{stt_audio_extension()}")
+                if not cut_audio_segment(audio_path, window_path, start, end - start):
+                    raise ValueError(f"구간 {index} 오디오 추출 실패")
+                segments, used_model = self._transcribe_file(client, window_path, model=model)
+                logger.info(f"   ✅ 구간 {index + 1}/{len(windows)} 인식 완료 ({start:.0f}s~{end:.0f}s, {len(segments)}개)")
+                return segments, used_model
+
+            with ThreadPoolExecutor(max_workers=config.STT_WINDOW_CONCURRENCY) as executor:
+                results = list(executor.map(transcribe_window, range(len(windows))))
+
+            segments = self.stitch_windows(windows, [window_segments for window_segments, _ in results])
+            used_model = self._produced_by(model, [window_model for _, window_model in results])
+            logger.info(f"✅ Gemini 구간 분할 음성 인식 완료: {len(segments)}개 세그먼트 ({used_model})")
+            return segments, used_model
+
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    @staticmethod
+    def _text_similarity(a: str, b: str) -> float:
+        """두 발화 텍스트의 유사도 (0.0~1.0)"""
+        a = "".join(a.split())
+        b = "".join(b.split())
+        if not a or not b:
+            return 0.0
+        return difflib.SequenceMatcher(None, a, b).ratio()
+
+    def stitch_windows(self, windows: list, window_results: list) -> list:
+        """
+        구간별 인식 결과를 하나의 타임라인으로 병합합니다.
+
+        - start_time을 원본 타임라인 기준으로 보정 (구간 시작 시간 더하기)
+        - 중복 구간은 중간 지점을 경계로 앞/뒤 구간 결과를 나눠 사용하고,
+          경계 부근에서 같은 발화가 양쪽에 남으면 하나만 유지
+        - 중복 구간에서 같은 발화를 찾아 구간별 화자 번호를 전역 화자 번호로 매핑
+        """
+        overlap_match_threshold = 0.6
+        merged = []
+        speaker_maps = []
+        next_global_speaker = 1
+
+        for index, ((start, end), segments) in enumerate(zip(windows, window_results)):
+            # 1. 원본 타임라인 기준 시간으로 보정
+            shifted = [dict(seg, start_time=seg['start_time'] + start) for seg in segments]
+
+            # 2. 화자 번호 매핑 (첫 구간은 그대로, 이후 구간은 중복 구간 발화로 매칭)
+            speaker_map = {}
+            if index > 0:
+                prev_start, prev_end = windows[index - 1]
+                prev_segments = window_results[index - 1]
+                prev_map = speaker_maps[index - 1]
+                prev_overlap = [
+                    (seg['start_time'] + prev_start, prev_map.get(seg['speaker'], seg['speaker']), seg['text'])
+                    for seg in prev_segments if seg['start_time'] + prev_start >= start
+                ]
+
+                votes = Counter()
+                for seg in shifted:
+                    if seg['start_time'] > prev_end:
+                        break
+                    best = max(prev_overlap, key=lambda p: self._text_similarity(p[2], seg['text']), default=None)
+                    if best and self._text_similarity(best[2], seg['text']) >= overlap_match_threshold:
+                        votes[(seg['speaker'], best[1])] += 1
+
+                # 득표가 많은 쌍부터 1:1로 확정
+                used_globals = set()
+                for (local, global_speaker), _ in votes.most_common():
+                    if local in speaker_map or global_speaker in used_globals:
+                        continue
+                    speaker_map[local] = global_speaker
+                    used_globals.add(global_speaker)
+
+            for seg in shifted:
+                if seg['speaker'] not in speaker_map:
+                    if index == 0:
+                        speaker_map[seg['speaker']] = seg['speaker']
+                    else:
+                        # 중복 구간에서 매칭되지 않은 화자는 새 화자로 취급
+                        speaker_map[seg['speaker']] = next_global_speaker
+                        next_global_speaker += 1
+                next_global_speaker = max(next_global_speaker, speaker_map[seg['speaker']] + 1)
+            speaker_maps.append(speaker_map)
+
+            # 3. 중복 구간 경계: 이전 창은 경계 이전까지, 현재 창은 경계 이후부터 사용
+            lower = -1.0
+            upper = float('inf')
+            if index > 0:
+                lower = (start + windows[index - 1][1]) / 2
+            if index < len(windows) - 1:
+                upper = (windows[index + 1][0] + end) / 2
+
+            for seg in shifted:
+                if not (lower <= seg['start_time'] < upper):
+                    continue
+                seg['speaker'] = speaker_map[seg['speaker']]
+
+                # 경계 부근에서 같은 발화가 중복되면 하나만 유지
+                if merged and index > 0 and seg['start_time'] < lower + config.STT_WINDOW_OVERLAP_SECONDS:
+                    if self._text_similarity(merged[-1]['text'], seg['text']) >= 0.8:
+                        continue
+                merged.append(seg)
+
+        merged.sort(key=lambda seg: seg['start_time'])
+        for idx, seg in enumerate(merged):
+            seg['id'] = idx
+        return merged
+
+    # ==================== 신뢰도 낮은 구간 재인식 ====================
+
+    @staticmethod
+    def plan_refine_spans(segments: list, duration: float, eligible=None) -> list:
+        """
+        신뢰도가 낮은 세그먼트를 재인식 구간으로 묶습니다.
+        STT_REFINE_MERGE_GAP_SECONDS 이내로 이어지는 약한 세그먼트는 사이의 세그먼트까지 포함해 한 구간으로 묶고,
+        신뢰도가 낮은 구간부터 STT_REFINE_MAX_SPANS개까지만 선택합니다.
+        (신뢰도를 기록하지 않은 세그먼트(0.0)는 대상에서 제외)
+
+        Args:
+            segments: 시간순 세그먼트 목록 (start_time, confidence 포함)
+            duration: 전체 오디오 길이 (초, 마지막 세그먼트의 끝 시간으로 사용)
+            eligible: eligible(segment) 재인식 대상이 될 수 있는 세그먼트인지 판단하는 함수 (None이면 전체)
+
+        Returns:
+            list: [{'first', 'last', 'start', 'end', 'confidence'}, ...] 시간순
+                  (first/last: 교체할 세그먼트 인덱스 범위, start/end: 해당 시간 범위)
+        """
+        def end_of(index):
+            if index + 1 < len(segments):
+                return segments[index + 1]['start_time']
+            return max(duration, segments[index]['start_time'])
+
+        threshold = config.STT_REFINE_CONFIDENCE_THRESHOLD
+        weak = [
+            i for i, seg in enumerate(segments)
+            if 0.0 < (seg.get('confidence') or 0.0) < threshold and (eligible is None or eligible(seg))
+        ]
+
+        groups = []
+        for index in weak:
+            start = segments[index]['start_time']
+            if groups:
+                group = groups[-1]
+                if (start - end_of(group['weak'][-1]) <= config.STT_REFINE_MERGE_GAP_SECONDS
+                        and end_of(index) - segments[group['first']]['start_time'] <= config.STT_REFINE_MAX_SPAN_SECONDS):
+                    group['weak'].append(index)
+                    continue
+            groups.append({'first': index, 'weak': [index]})
+
+        spans = []
+        for group in groups:
+            first, last = group['first'], group['weak'][-1]
+            spans.append({
+                'first': first,
+                'last': last,
+                'start': segments[first]['start_time'],
+                'end': end_of(last),
+                'confidence': sum(segments[i]['confidence'] for i in group['weak']) / len(group['weak'])
+            })
+
+        spans.sort(key=lambda span: span['confidence'])
+        return sorted(spans[:config.STT_REFINE_MAX_SPANS], key=lambda span: span['start'])
+
+    def refine_span(self, audio_path: str, span: dict, segments: list, work_dir: str):
+        """
+        재인식 구간 하나를 앞뒤 문맥과 함께 잘라 상위 모델(STT_REFINE_MODEL)로 다시 인식합니다.
+        (이미 STT_REFINE_MODEL로 인식한 회의/시간대는 호출하는 쪽에서 제외)
+        화자 번호는 같은 시간대의 기존 세그먼트 화자로 맞추고,
+        새 결과의 평균 신뢰도가 기존보다 높을 때만 교체할 세그먼트를 반환합니다.
+
+        Args:
+            audio_path: 원본 미디어 경로 (세그먼트 start_time 기준 타임라인)
+            span: plan_refine_spans가 반환한 구간
+            segments: 전체 세그먼트 목록 (plan_refine_spans에 넘긴 것과 동일)
+            work_dir: 잘라낸 오디오를 저장할 임시 폴더
+
+        Returns:
+            list or None: span['first']~span['last'] 세그먼트를 대체할 세그먼트 (원본 타임라인 기준), 개선되지 않으면 None
+        """
+        padding = config.STT_REFINE_PADDING_SECONDS
+        clip_start = max(0.0, span['start'] - padding)
+        clip_end = span['end'] + padding
+        clip_path = os.path.join(work_dir, f"refine_{span['first']:05d}{stt_audio_extension()}")
+        if not cut_audio_segment(audio_path, clip_path, clip_start, clip_end - clip_start):
+            raise ValueError(f"재인식 구간 오디오 추출 실패 ({clip_start:.1f}s~{clip_end:.1f}s)")
+
+        client = llm_gateway.gemini_client()
+        # 헤징하면 느린 요청을 대체(flash) 모델이 이길 수 있으므로 재인식 모델로만 인식
+        recognized, _ = self._transcribe_file(client, clip_path, model=config.STT_REFINE_MODEL, hedge=False)
+        shifted = [dict(seg, start_time=seg['start_time'] + clip_start) for seg in recognized]
+
+        # 앞뒤 문맥 구간의 발화는 버리고 재인식 대상 시간 범위만 사용 (경계 직전 발화 시작은 약간 허용)
+        replacement = [seg for seg in shifted if span['start'] - 0.5 <= seg['start_time'] < span['end']]
+        if not replacement:
+            return None
+
+        old = segments[span['first']:span['last'] + 1]
+        old_confidence = sum(seg['confidence'] for seg in old) / len(old)
+        new_confidence = sum(seg['confidence'] for seg in replacement) / len(replacement)
+        if new_confidence <= old_confidence:
+            logger.info(f"   ↩️ 재인식 결과가 개선되지 않아 유지 ({span['start']:.0f}s~{span['end']:.0f}s, "
+                        f"신뢰도 {old_confidence:.2f} → {new_confidence:.2f})")
             return None
 
-    def subtopic_generate(self, title: str, transcript_text: str):
+        # 재인식 결과의 화자 번호 → 같은 시간대의 기존 화자 (문맥 구간 포함, 득표가 많은 쌍부터 1:1 매핑)
+        starts = [seg['start_time'] for seg in segments]
+
+        def covering_speaker(time):
+            return segments[max(bisect.bisect_right(starts, time) - 1, 0)]['speaker']
+
+        votes = Counter((seg['speaker'], covering_speaker(seg['start_time'])) for seg in shifted)
+        speaker_map = {}
+        used = set()
+        for (local, existing), _ in votes.most_common():
+            if local in speaker_map or existing in used:
+                continue
+            speaker_map[local] = existing
+            used.add(existing)
+
+        logger.info(f"   ✅ 재인식 완료 ({span['start']:.0f}s~{span['end']:.0f}s, "
+                    f"{len(old)}개 → {len(replacement)}개, 신뢰도 {old_confidence:.2f} → {new_confidence:.2f})")
+        return [
+            dict(seg, speaker=speaker_map.get(seg['speaker'], covering_speaker(seg['start_time'])))
+            for seg in replacement
+        ]
+
+    def _generate_text(self, prompt_name: str, prompt_version: str, task: str, prompt_text: str, use_cache: bool = True):
+        """
+        텍스트 프롬프트로 Gemini 응답을 생성합니다. (LLM 응답 캐시 적용)
+        모델은 작업 종류와 프롬프트 길이로 고르며 (MODEL_ROUTES),
+        (모델, 프롬프트 버전, 완성된 프롬프트 해시)가 같으면 저장된 응답을 바로 반환합니다.
+
+        Args:
+            prompt_name: 프롬프트 종류 (summary, summary_map, summary_reduce, minutes, mindmap)
+            prompt_version: 프롬프트 템플릿 버전
+            task: 모델 라우팅 작업 종류 (summary, minutes, mindmap)
+            prompt_text: 완성된 프롬프트
+            use_cache: False면 캐시 조회를 건너뛰고 새로 생성 (결과는 캐시에 갱신)
+
+        Returns:
+            str: 응답 텍스트
+        """
+        input_tokens = estimate_tokens(prompt_text)
+        model = model_router.route(task, input_tokens=input_tokens)
+        cache_enabled = config.LLM_CACHE_ENABLED
+        input_hash = hashlib.sha256(prompt_text.encode('utf-8')).hexdigest()
+
+        if cache_enabled and use_cache:
+            try:
+                cached = self.db.get_llm_cache(model, prompt_name, prompt_version, input_hash)
+            except Exception as e:
+                logger.warning(f"⚠️ LLM 응답 캐시 조회 실패: {e}")
+                cached = None
+            if cached is not None:
+                logger.info(f"♻️ 캐시된 LLM 응답 사용: {prompt_name} ({model})")
+                return cached
+
+        response = llm_gateway.generate_content(
+            model=model,
+            contents=[
+                types.Content(
+                    role="user",
+                    parts=[
+                        types.Part.from_text(text=prompt_text),
+                    ],
+                ),
+            ],
+            estimated_tokens=input_tokens,
+            task=task,
+        )
+        content = response.text.strip()
+
+        if cache_enabled and content:
+            try:
+                self.db.save_llm_cache(model, prompt_name, prompt_version, input_hash, content,
+                                       config.LLM_CACHE_MAX_BYTES)
+            except Exception as e:
+                logger.warning(f"⚠️ LLM 응답 캐시 저장 실패: {e}")
+        return content
+
+    def subtopic_generate(self, title: str, transcript_text: str, use_cache: bool = True):
         prompt_text = f"""당신은 제공된 대화 스크립트 내용을 분석하여, 구조화된 주제별 요약본으로 변환하는 AI 어시스턴트입니다.
 
             **입력 파일 형식:**
@@ -209,27 +864,13 @@ class STTManager:
         if not api_key:
             raise ValueError("GOOGLE_API_KEY가 .env 파일에 설정되지 않았습니다.")
 
-        client = genai.Client(api_key=api_key)
-        model = "gemini-2.5-pro"
-
         import threading
         import datetime
         thread_id = threading.current_thread().name
         timestamp = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
         logger.info(f"[{timestamp}][{thread_id}] 🤖 Gemini를 통해 요약 생성 중...")
         try:
-            response = client.models.generate_content(
-                model=model,
-                contents=[
-                    types.Content(
-                        role="user",
-                        parts=[
-                            types.Part.from_text(text=prompt_text),
-                        ],
-                    ),
-                ],
-            )
-            summary_content = response.text.strip()
+            summary_content = self._generate_text("summary", SUMMARY_PROMPT_VERSION, "summary", prompt_text, use_cache)
             logger.info("✅ Gemini 요약 생성 완료.")
             return summary_content
         except Exception as e:
@@ -238,7 +879,154 @@ class STTManager:
             logger.error(f"❌ Gemini 요약 생성 중 오류 발생: {e}")
             return None
 
-    def generate_minutes(self, title: str, transcript_text: str, summary_content: str, meeting_date: str):
+    # ==================== 긴 회의 계층(map-reduce) 요약 ====================
+
+    def summarize_meeting(self, title: str, segments: list, use_cache: bool = True):
+        """
+        회의 세그먼트로 문단 요약을 생성합니다.
+        스크립트가 SUMMARY_MAP_REDUCE_THRESHOLD_TOKENS 이하이면 subtopic_generate로 한 번에 요약하고,
+        더 길면 주제 구간별로 병렬 요약(map)한 뒤 하나의 "### 주제" 요약으로 병합(reduce)합니다.
+
+        Args:
+            title: 회의 제목
+            segments: DB에서 조회한 세그먼트 목록 (segment, start_time, speaker_label 포함)
+            use_cache: False면 LLM 응답 캐시를 건너뛰고 새로 생성
+
+        Returns:
+            str: 요약 내용 (마크다운), 실패 시 None
+        """
+        transcript_text = " ".join([row['segment'] for row in segments])
+        if estimate_tokens(transcript_text) <= config.SUMMARY_MAP_REDUCE_THRESHOLD_TOKENS:
+            return self.subtopic_generate(title, transcript_text, use_cache)
+
+        try:
+            return self._summarize_map_reduce(title, segments, use_cache)
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            logger.error(f"❌ Gemini 계층 요약 생성 중 오류 발생: {e}")
+            return None
+
+    @staticmethod
+    def _plan_summary_windows(segments: list) -> list:
+        """
+        세그먼트를 주제 구간(window)으로 나눕니다. (_create_smart_chunks와 같은 경계 기준)
+        구간이 SUMMARY_WINDOW_TOKENS를 넘으면 분리하고, 절반 이상 찼으면 긴 침묵에서 먼저 분리합니다.
+
+        Returns:
+            list: [(시작 인덱스, 끝 인덱스), ...] (끝 인덱스는 포함하지 않음)
+        """
+        windows = []
+        window_start = 0
+        window_tokens = 0
+        last_time = None
+
+        for index, row in enumerate(segments):
+            tokens = estimate_tokens(row['segment'])
+            time_gap = row['start_time'] - last_time if last_time is not None else 0
+
+            should_split = False
+            if window_tokens + tokens > config.SUMMARY_WINDOW_TOKENS:
+                should_split = True
+            elif time_gap > config.TIME_GAP_THRESHOLD_SECONDS and window_tokens > config.SUMMARY_WINDOW_TOKENS // 2:
+                should_split = True
+
+            if should_split and index > window_start:
+                windows.append((window_start, index))
+                window_start = index
+                window_tokens = 0
+
+            window_tokens += tokens
+            last_time = row['start_time']
+
+        if window_start < len(segments):
+            windows.append((window_start, len(segments)))
+        return windows
+
+    @staticmethod
+    def _cite_numbers(text: str) -> set:
+        """요약에 포함된 [cite: n, m] 번호 집합"""
+        numbers = set()
+        for group in re.findall(r"\[cite:\s*([\d,\s]+)\]", text or ""):
+            numbers.update(int(n) for n in re.findall(r"\d+", group))
+        return numbers
+
+    def _summarize_map_reduce(self, title: str, segments: list, use_cache: bool):
+        """
+        구간별 병렬 요약 후 병합합니다.
+        각 발화에 회의 전체 기준 번호([n])를 붙여 구간 요약의 [cite: n]이 병합 후에도 같은 발화를 가리키게 합니다.
+        """
+        windows = self._plan_summary_windows(segments)
+        logger.info(f"🧩 계층 요약: 세그먼트 {len(segments)}개 → {len(windows)}개 구간 "
+                    f"(동시 {config.SUMMARY_MAP_CONCURRENCY}개)")
+
+        def summarize_window(index):
+            start, end = windows[index]
+            numbered_text = "\n".join(
+                f"[{position + 1}] 화자 {segments[position]['speaker_label']}: {segments[position]['segment']}"
+                for position in range(start, end)
+            )
+            prompt_text = SUMMARY_MAP_PROMPT.format(
+                title=title, part=index + 1, total=len(windows),
+                first=start + 1, last=end, transcript_text=numbered_text
+            )
+            partial = self._generate_text("summary_map", SUMMARY_PROMPT_VERSION, "summary", prompt_text, use_cache)
+            logger.info(f"   ✅ 구간 {index + 1}/{len(windows)} 요약 완료 (발화 {start + 1}~{end})")
+            return partial
+
+        with ThreadPoolExecutor(max_workers=config.SUMMARY_MAP_CONCURRENCY) as executor:
+            partials = list(executor.map(summarize_window, range(len(windows))))
+
+        summary_content = self._reduce_summaries(title, partials, use_cache)
+
+        # 병합 과정에서 근거 번호가 사라지거나 새로 생기지 않았는지 확인
+        source_cites = set().union(*(self._cite_numbers(partial) for partial in partials))
+        final_cites = self._cite_numbers(summary_content)
+        if final_cites - source_cites:
+            logger.warning(f"⚠️ 병합 요약에 구간 요약에 없던 인용 번호 {len(final_cites - source_cites)}개")
+        logger.info(f"✅ Gemini 계층 요약 생성 완료 (인용 {len(final_cites)}/{len(source_cites)}개 유지)")
+        return summary_content
+
+    def _reduce_summaries(self, title: str, partials: list, use_cache: bool) -> str:
+        """
+        구간 요약들을 하나의 요약으로 병합합니다.
+        병합 입력이 SUMMARY_MAP_REDUCE_THRESHOLD_TOKENS를 넘으면 묶음 단위로 먼저 병렬 병합합니다.
+        """
+        while len(partials) > 1 and estimate_tokens(partials) > config.SUMMARY_MAP_REDUCE_THRESHOLD_TOKENS:
+            batches = []
+            batch, batch_tokens = [], 0
+            for partial in partials:
+                tokens = estimate_tokens(partial)
+                if batch and batch_tokens + tokens > config.SUMMARY_MAP_REDUCE_THRESHOLD_TOKENS:
+                    batches.append(batch)
+                    batch, batch_tokens = [], 0
+                batch.append(partial)
+                batch_tokens += tokens
+            batches.append(batch)
+
+            if len(batches) == len(partials):
+                # 더 묶을 수 없으면 한 번에 병합
+                break
+            logger.info(f"   🔁 중간 병합: 구간 요약 {len(partials)}개 → {len(batches)}개")
+            with ThreadPoolExecutor(max_workers=config.SUMMARY_MAP_CONCURRENCY) as executor:
+                partials = list(executor.map(lambda b: self._merge_partials(title, b, use_cache), batches))
+
+        if len(partials) == 1:
+            return partials[0]
+        return self._merge_partials(title, partials, use_cache)
+
+    def _merge_partials(self, title: str, partials: list, use_cache: bool) -> str:
+        """구간 요약 목록을 병합 프롬프트로 하나로 합침"""
+        if len(partials) == 1:
+            return partials[0]
+        partial_text = "\n\n".join(
+            f"[구간 요약 {index + 1}]\n{partial}" for index, partial in enumerate(partials)
+        )
+        prompt_text = SUMMARY_REDUCE_PROMPT.format(title=title, partial_text=partial_text)
+        return self._generate_text("summary_reduce", SUMMARY_PROMPT_VERSION, "summary", prompt_text, use_cache)
+
+    def generate_minutes(self, title: str, transcript_text: str, summary_content: str, meeting_date: str,
+                         use_cache: bool = True):
         """
         문단 요약을 기반으로 정식 회의록을 생성합니다.
 
@@ -247,6 +1035,7 @@ class STTManager:
             transcript_text (str): 원본 회의 스크립트
             summary_content (str): 이미 생성된 문단 요약 내용
             meeting_date (str): 회의 일시 (YYYY-MM-DD HH:MM:SS 형식)
+            use_cache (bool): False면 캐시를 건너뛰고 새로 생성 (결과는 캐시에 갱신)
 
         Returns:
             str: 생성된 회의록 내용 (마크다운 형식)
@@ -335,23 +1124,9 @@ class STTManager:
         if not api_key:
             raise ValueError("GOOGLE_API_KEY가 .env 파일에 설정되지 않았습니다.")
 
-        client = genai.Client(api_key=api_key)
-        model = "gemini-2.5-pro"
-
         logger.info("🤖 Gemini를 통해 회의록 생성 중...")
         try:
-            response = client.models.generate_content(
-                model=model,
-                contents=[
-                    types.Content(
-                        role="user",
-                        parts=[
-                            types.Part.from_text(text=prompt_text),
-                        ],
-                    ),
-                ],
-            )
-            minutes_content = response.text.strip()
+            minutes_content = self._generate_text("minutes", MINUTES_PROMPT_VERSION, "minutes", prompt_text, use_cache)
             logger.info("✅ Gemini 회의록 생성 완료.")
             return minutes_content
         except Exception as e:
@@ -446,13 +1221,14 @@ class STTManager:
 
         return segments
 
-    def extract_mindmap_keywords(self, summary_content: str, title: str) -> str:
+    def extract_mindmap_keywords(self, summary_content: str, title: str, use_cache: bool = True) -> str:
         """
         문단 요약에서 마인드맵용 키워드를 추출합니다.
 
         Args:
             summary_content (str): 문단 요약 전체 텍스트 (### 제목, * 항목 형식)
             title (str): 회의 제목
+            use_cache (bool): False면 캐시를 건너뛰고 새로 생성 (결과는 캐시에 갱신)
 
         Returns:
             str: 마크다운 형식의 마인드맵 키워드 (Markmap 호환)
@@ -518,22 +1294,8 @@ class STTManager:
         if not api_key:
             raise ValueError("GOOGLE_API_KEY가 .env 파일에 설정되지 않았습니다.")
 
-        client = genai.Client(api_key=api_key)
-        model = "gemini-2.5-flash"  # Flash 모델 사용 (빠르고 저렴)
-
         try:
-            response = client.models.generate_content(
-                model=model,
-                contents=[
-                    types.Content(
-                        role="user",
-                        parts=[
-                            types.Part.from_text(text=prompt_text),
-                        ],
-                    ),
-                ],
-            )
-            mindmap_content = response.text.strip()
+            mindmap_content = self._generate_text("mindmap", MINDMAP_PROMPT_VERSION, "mindmap", prompt_text, use_cache)
             logger.info("✅ 마인드맵 키워드 추출 완료.")
             return mindmap_content
         except Exception as e:
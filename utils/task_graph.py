@@ -0,0 +1,126 @@
+"""
+작업 의존 그래프(DAG) 실행기
+서로 독립적인 네트워크 호출(임베딩, LLM 요약 등)을 스레드 풀에서 동시에 실행하고,
+의존 관계가 있는 작업은 선행 작업이 성공한 뒤에 시작합니다.
+"""
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+logger = logging.getLogger(__name__)
+
+
+class TaskGraph:
+    """
+    작은 DAG 실행기
+
+    사용 예:
+        graph = TaskGraph()
+        graph.add('summary', lambda results: make_summary())
+        graph.add('mindmap', lambda results: make_mindmap(results['summary']), depends_on=['summary'])
+        outcome = graph.run(max_workers=4)
+    """
+
+    def __init__(self):
+        self._tasks = {}
+
+    def add(self, name: str, fn, depends_on: list = None, required: bool = False):
+        """
+        작업 추가
+
+        Args:
+            name: 작업 이름
+            fn: fn(results) -> 결과값, results는 완료된 작업의 {이름: 결과} dict
+            depends_on: 선행 작업 이름 목록 (모두 성공해야 시작)
+            required: True면 실패 시 그래프 전체를 실패 처리 (run()이 예외 발생)
+        """
+        for dependency in depends_on or []:
+            if dependency not in self._tasks:
+                raise ValueError(f"선행 작업이 먼저 등록되어야 합니다: {dependency} (작업: {name})")
+
+        self._tasks[name] = {
+            'fn': fn,
+            'depends_on': list(depends_on or []),
+            'required': required
+        }
+
+    def run(self, max_workers: int, on_event=None) -> dict:
+        """
+        그래프 실행 (모든 작업이 끝나거나 필수 작업이 실패할 때까지 대기)
+
+        Args:
+            max_workers: 동시 실행 작업 수
+            on_event: on_event(name, status, elapsed, error) 콜백
+                      status: 'start' | 'done' | 'failed' | 'skipped' (호출 스레드에서 순차 호출)
+
+        Returns:
+            dict: {'results': {이름: 결과}, 'errors': {이름: 예외}, 'skipped': [이름], 'timings': {이름: 초}}
+
+        Raises:
+            Exception: 필수(required) 작업이 실패한 경우 해당 예외
+        """
+        results, errors, timings = {}, {}, {}
+        skipped = []
+        pending = dict(self._tasks)
+        running = {}
+
+        def notify(name, status, elapsed=None, error=None):
+            if on_event:
+                try:
+                    on_event(name, status, elapsed, error)
+                except Exception as e:
+                    logger.warning(f"⚠️ 작업 이벤트 콜백 오류 ({name}/{status}): {e}")
+
+        def timed(name, fn):
+            started_at = time.monotonic()
+            try:
+                return fn(results)
+            finally:
+                timings[name] = time.monotonic() - started_at
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="task-graph") as executor:
+            failed_required = None
+
+            while pending or running:
+                # 선행 작업이 실패/건너뜀이면 후속 작업도 건너뜀
+                for name in list(pending):
+                    dependencies = pending[name]['depends_on']
+                    if any(d in errors or d in skipped for d in dependencies):
+                        del pending[name]
+                        skipped.append(name)
+                        notify(name, 'skipped')
+
+                # 시작 가능한 작업 제출 (필수 작업 실패 후에는 새 작업을 시작하지 않음)
+                if failed_required is None:
+                    for name in list(pending):
+                        if all(d in results for d in pending[name]['depends_on']):
+                            task = pending.pop(name)
+                            notify(name, 'start')
+                            running[executor.submit(timed, name, task['fn'])] = name
+
+                if not running:
+                    skipped.extend(pending)
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        results[name] = future.result()
+                        notify(name, 'done', timings.get(name))
+                    else:
+                        errors[name] = error
+                        notify(name, 'failed', timings.get(name), error)
+                        if self._tasks[name]['required'] and failed_required is None:
+                            failed_required = error
+
+        if failed_required is not None:
+            raise failed_required
+
+        return {
+            'results': results,
+            'errors': errors,
+            'skipped': skipped,
+            'timings': timings
+        }
@@ -3,8 +3,10 @@ import chromadb
 import os
 import re
 import logging
-from langchain_openai import OpenAIEmbeddings, ChatOpenAI
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from langchain_chroma import Chroma
+from langchain_core.documents import Document
 
 from langchain_classic.retrievers.self_query.base import SelfQueryRetriever
 from langchain_classic.chains.query_constructor.base import AttributeInfo
@@ -14,6 +16,9 @@ from langchain_text_splitters import RecursiveCharacterTextSplitter
 import numpy as np
 
 from config import config
+from utils.llm_gateway import llm_gateway
+from utils.embedding_cache import CachedEmbeddings
+from utils.keyword_index import keyword_index
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +31,9 @@ class VectorDBManager:
         'subtopic': 'meeting_subtopic',
     }
 
+    # 미리 계산한 질의 임베딩(search()의 embedding 인자)을 사용하는 리트리버 타입
+    EMBEDDING_RETRIEVER_TYPES = ("similarity", "mmr", "hybrid")
+
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -38,14 +46,15 @@ class VectorDBManager:
             raise ValueError("OPENAI_API_KEY가 .env 파일에 설정되지 않았습니다.")
 
         self.client = chromadb.PersistentClient(path=persist_directory)
-        self.embedding_function = OpenAIEmbeddings()
+        # 임베딩 캐시 + 캐시 미스 배치 병렬 임베딩 (게이트웨이 제한/재시도 적용)
+        self.embedding_function = CachedEmbeddings(llm_gateway.openai_embeddings(), config.OPENAI_EMBEDDING_MODEL)
         self.upload_folder = upload_folder
 
         # DatabaseManager 인스턴스 (외부에서 주입받음, SQLite 삭제를 위해)
         self.db_manager = db_manager
 
         # Initialize LLM for SelfQueryRetriever
-        self.llm = ChatOpenAI(api_key=config.OPENAI_API_KEY, temperature=0)
+        self.llm = llm_gateway.openai_chat()
 
         self.vectorstores = {
             key: Chroma(
@@ -99,6 +108,11 @@ class VectorDBManager:
             "subtopic": "회의록의 요약된 하위 주제",
         }
 
+        # 하이브리드 검색용 키워드 역색인 (기존 문서 색인은 첫 하이브리드 검색 시 생성)
+        self.keyword_index = keyword_index
+        self._keyword_index_lock = threading.Lock()
+        self._keyword_index_ready = set()
+
         logger.info(f"✅ VectorDBManager for collections {list(self.COLLECTION_NAMES.values())} initialized.")
 
         self._initialized = True
@@ -157,19 +171,7 @@ class VectorDBManager:
 
             for i, chunk_info in enumerate(chunks):
                 chunk_texts.append(chunk_info['text'])
-                # meeting_date를 문자열로 강제 변환 (datetime 객체일 경우 대비)
-                meeting_date_str = str(meeting_date) if meeting_date else ""
-                chunk_metadatas.append({
-                    "meeting_id": meeting_id,
-                    "dialogue_id": f"{meeting_id}_chunk_{i}",
-                    "chunk_index": i,
-                    "title": title,
-                    "meeting_date": meeting_date_str,
-                    "audio_file": audio_file,
-                    "start_time": chunk_info['start_time'],
-                    "end_time": chunk_info['end_time'],
-                    "speaker_count": chunk_info['speaker_count']
-                })
+                chunk_metadatas.append(self._chunk_metadata(meeting_id, i, title, meeting_date, audio_file, chunk_info))
                 chunk_ids.append(f"{meeting_id}_chunk_{i}")
 
             # Vector DB에 추가
@@ -178,6 +180,7 @@ class VectorDBManager:
                 metadatas=chunk_metadatas,
                 ids=chunk_ids
             )
+            self._index_keywords('chunks', chunk_ids, chunk_texts, chunk_metadatas)
 
             logger.info(f"✅ {len(chunks)}개의 스마트 청크를 meeting_chunks DB에 저장 완료 (meeting_id: {meeting_id})")
 
@@ -235,9 +238,83 @@ class VectorDBManager:
                 metadatas=chunk_metadatas,
                 ids=chunk_ids
             )
+            self._index_keywords('chunks', chunk_ids, chunk_texts, chunk_metadatas)
 
             logger.info(f"✅ {len(split_chunks)}개의 청크를 meeting_chunks DB에 저장 완료 (폴백 모드)")
 
+    @staticmethod
+    def _chunk_metadata(meeting_id, index, title, meeting_date, audio_file, chunk_info):
+        """스마트 청크의 meeting_chunks 메타데이터"""
+        return {
+            "meeting_id": meeting_id,
+            "dialogue_id": f"{meeting_id}_chunk_{index}",
+            "chunk_index": index,
+            "title": title,
+            # meeting_date를 문자열로 강제 변환 (datetime 객체일 경우 대비)
+            "meeting_date": str(meeting_date) if meeting_date else "",
+            "audio_file": audio_file,
+            "start_time": chunk_info['start_time'],
+            "end_time": chunk_info['end_time'],
+            "speaker_count": chunk_info['speaker_count']
+        }
+
+    def update_meeting_chunks(self, meeting_id, title, meeting_date, audio_file, segments):
+        """
+        일부 세그먼트가 바뀐 회의(재인식 등)의 meeting_chunks를 갱신합니다.
+        청크를 다시 구성한 뒤 내용이나 메타데이터가 바뀐 청크만 다시 임베딩(같은 ID로 upsert)하고,
+        더 이상 없는 청크 ID는 삭제합니다. 바뀌지 않은 청크는 임베딩 호출 없이 그대로 둡니다.
+
+        Args:
+            meeting_id (str): 회의 ID
+            title (str): 회의 제목
+            meeting_date (str): 회의 일시
+            audio_file (str): 오디오 파일명
+            segments (list): 갱신된 전체 세그먼트 리스트 (add_meeting_as_chunk와 같은 형식)
+
+        Returns:
+            dict: {'updated': 다시 임베딩한 청크 수, 'deleted': 삭제한 청크 수, 'unchanged': 유지한 청크 수}
+        """
+        chunks = self._create_smart_chunks(segments, max_chunk_size=1000, time_gap_threshold=60)
+
+        collection = self.client.get_or_create_collection(name=self.COLLECTION_NAMES['chunks'])
+        existing = collection.get(where={"meeting_id": meeting_id}, include=["documents", "metadatas"])
+        current = {
+            chunk_id: (document, metadata)
+            for chunk_id, document, metadata in zip(existing['ids'], existing['documents'], existing['metadatas'])
+        }
+
+        chunk_texts = []
+        chunk_metadatas = []
+        chunk_ids = []
+        for i, chunk_info in enumerate(chunks):
+            chunk_id = f"{meeting_id}_chunk_{i}"
+            text = self._clean_text(chunk_info['text'])
+            metadata = self._chunk_metadata(meeting_id, i, title, meeting_date, audio_file, chunk_info)
+            if current.get(chunk_id) == (text, metadata):
+                continue
+            chunk_texts.append(text)
+            chunk_metadatas.append(metadata)
+            chunk_ids.append(chunk_id)
+
+        if chunk_ids:
+            self.vectorstores['chunks'].add_texts(texts=chunk_texts, metadatas=chunk_metadatas, ids=chunk_ids)
+            self._index_keywords('chunks', chunk_ids, chunk_texts, chunk_metadatas)
+
+        new_ids = {f"{meeting_id}_chunk_{i}" for i in range(len(chunks))}
+        stale_ids = [chunk_id for chunk_id in current if chunk_id not in new_ids]
+        if stale_ids:
+            collection.delete(ids=stale_ids)
+            self._unindex_keywords('chunks', ids=stale_ids)
+
+        result = {
+            'updated': len(chunk_ids),
+            'deleted': len(stale_ids),
+            'unchanged': len(chunks) - len(chunk_ids)
+        }
+        logger.info(f"✅ meeting_chunks 갱신 (meeting_id: {meeting_id}): "
+                    f"재임베딩 {result['updated']}개, 삭제 {result['deleted']}개, 유지 {result['unchanged']}개")
+        return result
+
     def _create_smart_chunks(self, segments, max_chunk_size=1000, time_gap_threshold=60):
         """
         화자 변경, 시간 간격을 고려한 스마트 청킹
@@ -320,7 +397,15 @@ class VectorDBManager:
 
 
     def add_meeting_as_subtopic(self, meeting_id, title, meeting_date, audio_file, summary_content):
-        """스크립트 전체를 소주제별 청크로 DB에 저장합니다."""
+        """
+        문단 요약을 소주제("### " 블록)별로 meeting_subtopic에 저장합니다.
+        이미 저장된 요약이 있으면 블록을 비교하여 바뀐 블록만 다시 임베딩(같은 ID로 upsert)하고,
+        내용은 같고 메타데이터만 바뀐 블록은 임베딩 없이 메타데이터만 갱신하며,
+        새 요약에 없는 ID는 한 번에 삭제합니다. (요약을 다시 생성해도 이전 소주제가 남지 않음)
+
+        Returns:
+            list: 저장한 소주제 블록 목록 (유효한 블록이 없으면 None)
+        """
 
         
         # 1. 생성된 요약을 주제별로 파싱
@@ -336,12 +421,28 @@ class VectorDBManager:
 
         logger.info("===============summary_chunks=================")
         logger.info(summary_chunks)
-        
-        # 2. 각 요약 chunk를 Summary_Analysis_DB에 저장
-        subtopic_vdb = self.vectorstores['subtopic']
+
+        if not summary_chunks:
+            # 요약 생성이 잘못된 경우 기존 소주제를 지우지 않음
+            logger.warning("⚠️ 요약 결과에서 유효한 청크를 찾지 못했습니다.")
+            return None
+
+        # 2. 저장된 소주제와 비교
+        collection = self.client.get_or_create_collection(name=self.COLLECTION_NAMES['subtopic'])
+        existing = collection.get(where={"meeting_id": meeting_id}, include=["documents", "metadatas"])
+        current = {
+            chunk_id: (document, metadata)
+            for chunk_id, document, metadata in zip(existing['ids'], existing['documents'], existing['metadatas'])
+        }
+
+        # meeting_date를 문자열로 강제 변환 (datetime 객체일 경우 대비)
+        meeting_date_str = str(meeting_date) if meeting_date else ""
+
         chunk_texts = []
         chunk_metadatas = []
         chunk_ids = []
+        metadata_ids = []
+        metadata_updates = []
 
         for i, chunk in enumerate(summary_chunks):
             # '### '가 없는 경우를 대비하여, 첫 줄을 main_topic으로 추출
@@ -351,31 +452,167 @@ class VectorDBManager:
             # 실제 저장될 내용은 '### '를 포함한 전체 청크
             full_chunk_content = '### ' + chunk if not chunk.startswith('###') else chunk
 
-            # meeting_date를 문자열로 강제 변환 (datetime 객체일 경우 대비)
-            meeting_date_str = str(meeting_date) if meeting_date else ""
-
-            chunk_texts.append(full_chunk_content)
-            chunk_metadatas.append({
+            chunk_id = f"{meeting_id}_summary_{i}"
+            metadata = {
                 "meeting_id": meeting_id,
                 "meeting_title": title,
                 "meeting_date": meeting_date_str,
                 "audio_file": audio_file,
                 "main_topic": main_topic,
                 "summary_index": i
-            })
-            chunk_ids.append(f"{meeting_id}_summary_{i}")
+            }
 
-        if chunk_texts:
-            subtopic_vdb.add_texts(texts=chunk_texts, metadatas=chunk_metadatas, ids=chunk_ids)
-            logger.info(f"📄 요약 결과 {len(chunk_texts)}개를 Summary_Analysis_DB에 저장했습니다.")
-            return summary_chunks
-        else:
-            logger.warning("⚠️ 요약 결과에서 유효한 청크를 찾지 못했습니다.")
+            stored = current.get(chunk_id)
+            if stored and stored[0] == full_chunk_content:
+                if stored[1] != metadata:
+                    metadata_ids.append(chunk_id)
+                    metadata_updates.append(metadata)
+                continue
+
+            chunk_texts.append(full_chunk_content)
+            chunk_metadatas.append(metadata)
+            chunk_ids.append(chunk_id)
+
+        # 3. 바뀐 블록만 임베딩 (다른 위치로 옮겨진 블록은 임베딩 캐시에서 재사용)
+        if chunk_ids:
+            self.vectorstores['subtopic'].add_texts(texts=chunk_texts, metadatas=chunk_metadatas, ids=chunk_ids)
+            self._index_keywords('subtopic', chunk_ids, chunk_texts, chunk_metadatas)
+        if metadata_ids:
+            collection.update(ids=metadata_ids, metadatas=metadata_updates)
+
+        # 4. 새 요약에 없는 소주제 ID 일괄 삭제
+        new_ids = {f"{meeting_id}_summary_{i}" for i in range(len(summary_chunks))}
+        stale_ids = [chunk_id for chunk_id in current if chunk_id not in new_ids]
+        if stale_ids:
+            collection.delete(ids=stale_ids)
+            self._unindex_keywords('subtopic', ids=stale_ids)
+
+        logger.info(f"📄 요약 결과 {len(summary_chunks)}개를 Summary_Analysis_DB에 저장했습니다. "
+                    f"(재임베딩 {len(chunk_ids)}개, 메타데이터 갱신 {len(metadata_ids)}개, "
+                    f"삭제 {len(stale_ids)}개, 유지 {len(summary_chunks) - len(chunk_ids) - len(metadata_ids)}개)")
+        return summary_chunks
 
 
 
     
     
+    # ==================== 하이브리드 검색 (키워드 역색인) ====================
+
+    def _index_keywords(self, db_type, ids, texts, metadatas):
+        """벡터 DB에 저장한 문서를 키워드 역색인에도 반영 (실패해도 저장은 계속)"""
+        try:
+            self.keyword_index.add(self.COLLECTION_NAMES[db_type], ids, texts, metadatas)
+        except Exception as e:
+            logger.warning(f"⚠️ 키워드 색인 갱신 실패 ({db_type}): {e}")
+
+    def _unindex_keywords(self, db_type, ids=None, meeting_id=None):
+        """벡터 DB에서 삭제한 문서를 키워드 역색인에서도 삭제 (ids와 meeting_id가 모두 없으면 컬렉션 전체)"""
+        try:
+            self.keyword_index.remove(self.COLLECTION_NAMES[db_type], ids=ids, meeting_id=meeting_id)
+        except Exception as e:
+            logger.warning(f"⚠️ 키워드 색인 삭제 실패 ({db_type}): {e}")
+
+    def _ensure_keyword_index(self, db_type):
+        """
+        키워드 역색인이 비어있으면 벡터 DB의 기존 문서로 한 번 생성합니다.
+        (하이브리드 검색 도입 전에 저장된 회의용, 이후에는 저장/삭제 시 갱신)
+        """
+        if db_type in self._keyword_index_ready:
+            return
+        with self._keyword_index_lock:
+            if db_type in self._keyword_index_ready:
+                return
+            collection_name = self.COLLECTION_NAMES[db_type]
+            if self.keyword_index.is_empty(collection_name):
+                collection = self.client.get_or_create_collection(name=collection_name)
+                total = collection.count()
+                for offset in range(0, total, 1000):
+                    page = collection.get(include=["documents", "metadatas"], limit=1000, offset=offset)
+                    self.keyword_index.add(collection_name, page['ids'], page['documents'], page['metadatas'])
+                logger.info(f"🔤 키워드 색인 생성 완료: {collection_name} ({total}개 문서)")
+            self._keyword_index_ready.add(db_type)
+
+    @staticmethod
+    def _filter_meeting_ids(filter_criteria):
+        """
+        검색 필터에서 meeting_id 조건 추출 (키워드 검색을 같은 회의 범위로 제한)
+
+        Returns:
+            list or None: 회의 ID 목록, meeting_id 조건이 없으면 None
+        """
+        if not filter_criteria:
+            return None
+        conditions = filter_criteria.get('$and', [filter_criteria])
+        for condition in conditions:
+            value = condition.get('meeting_id')
+            if isinstance(value, str):
+                return [value]
+            if isinstance(value, dict):
+                if '$eq' in value:
+                    return [value['$eq']]
+                if '$in' in value:
+                    return list(value['$in'])
+        return None
+
+    @staticmethod
+    def _document_key(doc):
+        """벡터/키워드 결과를 같은 문서로 묶기 위한 키"""
+        return doc.metadata.get('meeting_id'), doc.page_content
+
+    def _hybrid_search(self, db_type, query, k, filter_criteria=None, embedding=None):
+        """
+        벡터 검색과 키워드(BM25) 검색을 동시에 실행하고 Reciprocal Rank Fusion으로 결합합니다.
+        각 방식에서 k * HYBRID_FETCH_MULTIPLIER개씩 후보를 가져와 1 / (HYBRID_RRF_K + 순위)를 더합니다.
+
+        Args:
+            db_type (str): 검색할 DB 타입 ('chunks', 'subtopic')
+            query (str): 검색 질의
+            k (int): 반환할 결과 수
+            filter_criteria (dict, optional): 메타데이터 필터 (Chroma where 형식)
+            embedding (list, optional): 미리 계산한 질의 임베딩 (없으면 query를 임베딩)
+
+        Returns:
+            list: LangChain Document 객체 리스트 (RRF 점수 순)
+        """
+        collection_name = self.COLLECTION_NAMES[db_type]
+        fetch_k = max(k * config.HYBRID_FETCH_MULTIPLIER, config.HYBRID_MIN_FETCH_K)
+        self._ensure_keyword_index(db_type)
+
+        # 키워드 검색은 벡터 검색의 질의 임베딩을 기다리는 동안 실행
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            keyword_future = executor.submit(
+                self.keyword_index.search, collection_name, query, fetch_k, self._filter_meeting_ids(filter_criteria)
+            )
+            if embedding is not None:
+                dense_docs = self.vectorstores[db_type].similarity_search_by_vector(embedding, k=fetch_k, filter=filter_criteria)
+            else:
+                dense_docs = self.vectorstores[db_type].similarity_search(query, k=fetch_k, filter=filter_criteria)
+            keyword_hits = keyword_future.result()
+
+        # 키워드 결과 문서 조회 (필터 조건을 Chroma에서 한 번 더 적용)
+        keyword_docs = []
+        if keyword_hits:
+            ranked_ids = [doc_id for doc_id, _ in keyword_hits]
+            get_kwargs = {'ids': ranked_ids, 'include': ["documents", "metadatas"]}
+            if filter_criteria:
+                get_kwargs['where'] = filter_criteria
+            fetched = self.client.get_or_create_collection(name=collection_name).get(**get_kwargs)
+            by_id = {
+                doc_id: Document(page_content=document, metadata=metadata or {}, id=doc_id)
+                for doc_id, document, metadata in zip(fetched['ids'], fetched['documents'], fetched['metadatas'])
+            }
+            keyword_docs = [by_id[doc_id] for doc_id in ranked_ids if doc_id in by_id]
+
+        fused = {}
+        for ranked_docs in (dense_docs, keyword_docs):
+            for rank, doc in enumerate(ranked_docs):
+                entry = fused.setdefault(self._document_key(doc), [0.0, doc])
+                entry[0] += 1.0 / (config.HYBRID_RRF_K + rank + 1)
+
+        results = [doc for _, doc in sorted(fused.values(), key=lambda item: item[0], reverse=True)[:k]]
+        logger.info(f"🔀 하이브리드 검색: 벡터 {len(dense_docs)}개 + 키워드 {len(keyword_docs)}개 → {len(results)}개")
+        return results
+
     def search(self,
              db_type: str,
              query: str,
@@ -384,7 +621,8 @@ class VectorDBManager:
              filter_criteria: dict = None,
              score_threshold: float = None,  # <-- [수정됨] 점수 임계값 추가
              mmr_fetch_k: int = 20,         # <-- [수정됨] MMR fetch_k 추가
-             mmr_lambda_mult: float = 0.5   # <-- [수정됨] MMR lambda_mult 추가
+             mmr_lambda_mult: float = 0.5,  # <-- [수정됨] MMR lambda_mult 추가
+             embedding: list = None
              ) -> list:
         """
         지정된 DB에서 쿼리와 필터 조건을 사용하여 문서를 검색합니다.
@@ -394,11 +632,14 @@ class VectorDBManager:
             db_type (str): 검색할 DB 타입 ('chunks', 'subtopic').
             query (str): 검색할 텍스트 쿼리.
             k (int, optional): 반환할 결과의 수. Defaults to 5.
-            retriever_type (str, optional): 사용할 리트리버 타입 ('similarity', 'mmr', 'self_query', 'similarity_score_threshold'). Defaults to "similarity".
+            retriever_type (str, optional): 사용할 리트리버 타입 ('similarity', 'mmr', 'self_query', 'similarity_score_threshold', 'hybrid'). Defaults to "similarity".
+                'hybrid'는 벡터 검색과 키워드(BM25) 검색 결과를 RRF로 결합합니다.
             filter_criteria (dict, optional): 메타데이터 필터링 조건 (예: {'meeting_id': '...', 'audio_file': '...'}). Defaults to None.
             score_threshold (float, optional): 유사도 점수 임계값 (0.0~1.0). Defaults to None.
             mmr_fetch_k (int, optional): MMR에서 초기 fetch할 문서 수. Defaults to 20.
             mmr_lambda_mult (float, optional): MMR의 다양성 파라미터 (0.0~1.0). Defaults to 0.5.
+            embedding (list, optional): embed_query()로 미리 계산한 질의 임베딩. 'similarity', 'mmr', 'hybrid'에서
+                질의를 다시 임베딩하지 않고 이 벡터로 검색합니다. (그 밖의 타입에서는 무시) Defaults to None.
 
         Returns:
             list: LangChain Document 객체 리스트.
@@ -408,7 +649,7 @@ class VectorDBManager:
             raise ValueError(f"Unknown db_type: {db_type}. Available types are {list(self.vectorstores.keys())}")
 
         # [수정됨] "similarity_score_threshold"를 유효한 타입으로 허용
-        allowed_types = ["similarity", "mmr", "self_query", "similarity_score_threshold"]
+        allowed_types = ["similarity", "mmr", "self_query", "similarity_score_threshold", "hybrid"]
         if retriever_type not in allowed_types:
             raise ValueError(f"Unsupported retriever_type: {retriever_type}. Choose from {allowed_types}.")
 
@@ -421,8 +662,17 @@ class VectorDBManager:
         vdb = self.vectorstores[db_type]
         results = []
 
-        # 2. Handle 'similarity', 'mmr', 'similarity_score_threshold' retrievers
-        if current_retriever_type in ["similarity", "mmr", "similarity_score_threshold"]:
+        # 2. 미리 계산한 질의 임베딩으로 검색 (같은 질의로 여러 컬렉션을 검색할 때 임베딩 1회)
+        if embedding is not None and current_retriever_type == "similarity":
+            results = vdb.similarity_search_by_vector(embedding, k=k, filter=filter_criteria)
+
+        elif embedding is not None and current_retriever_type == "mmr":
+            results = vdb.max_marginal_relevance_search_by_vector(
+                embedding, k=k, fetch_k=mmr_fetch_k, lambda_mult=mmr_lambda_mult, filter=filter_criteria
+            )
+
+        # 3. Handle 'similarity', 'mmr', 'similarity_score_threshold' retrievers
+        elif current_retriever_type in ["similarity", "mmr", "similarity_score_threshold"]:
             search_kwargs = {'k': k}
             if filter_criteria:
                 search_kwargs['filter'] = filter_criteria
@@ -443,7 +693,11 @@ class VectorDBManager:
             )
             results = retriever.invoke(query)
 
-        # 3. Handle 'self_query' retriever
+        # 4. Handle 'hybrid' retriever (벡터 + BM25, RRF 결합)
+        elif current_retriever_type == "hybrid":
+            results = self._hybrid_search(db_type, query, k, filter_criteria, embedding=embedding)
+
+        # 5. Handle 'self_query' retriever
         elif current_retriever_type == "self_query":
             # (참고: SelfQueryRetriever는 기본적으로 내부에서 similarity_search를 사용합니다.)
             # (여기서 점수 기반 필터링을 하려면, SelfQueryRetriever를 커스텀해야 할 수도 있습니다.)
@@ -462,7 +716,8 @@ class VectorDBManager:
                     # 다만, invoke 시점이 아닌 생성 시점에 search_kwargs를 넘겨야 할 수 있습니다. (LangChain 버전에 따라 다름)
                     # enable_limit=True를 사용하고 쿼리에 "top 3 results" 등을 포함시켜야 할 수도 있습니다.
                 )
-                results = retriever.invoke(query)
+                # 질의 해석(LLM) 호출을 게이트웨이 제한/재시도 아래에서 실행 (질의 해석 프롬프트 약 2천 토큰)
+                results = llm_gateway.call(config.OPENAI_CHAT_MODEL, retriever.invoke, query, estimated_tokens=2000)
 
                 # [수정됨] SelfQuery 이후에도 k개만 반환하도록 강제 (필요시)
                 # SelfQueryRetriever는 k를 LLM이 추론하게 하므로, k가 무시될 수 있습니다.
@@ -494,6 +749,75 @@ class VectorDBManager:
         return results
 
     
+    def embed_query(self, query: str) -> list:
+        """
+        검색 질의 임베딩 (search()/search_meetings()의 embedding 인자로 전달하여 여러 컬렉션에서 재사용)
+
+        Args:
+            query (str): 검색 질의
+
+        Returns:
+            list: 질의 임베딩 벡터
+        """
+        return self.embedding_function.embed_query(query)
+
+    @staticmethod
+    def meeting_filters(meeting_ids: list) -> list:
+        """
+        접근 가능한 회의 목록을 Chroma where 필터로 변환합니다.
+        목록이 길면 CHROMA_IN_FILTER_MAX_IDS개씩 나눈 $in 필터 여러 개를 반환합니다.
+
+        Args:
+            meeting_ids (list): 회의 ID 목록
+
+        Returns:
+            list: where 필터 목록
+        """
+        size = config.CHROMA_IN_FILTER_MAX_IDS
+        filters = []
+        for start in range(0, len(meeting_ids), size):
+            batch = list(meeting_ids[start:start + size])
+            filters.append({"meeting_id": batch[0]} if len(batch) == 1 else {"meeting_id": {"$in": batch}})
+        return filters
+
+    def search_meetings(self, db_type: str, query: str, k: int, meeting_ids: list = None,
+                        retriever_type: str = "similarity", embedding: list = None) -> list:
+        """
+        지정한 회의들 안에서만 검색합니다. (접근 제한을 Chroma where 필터로 적용하여 필요한 k개만 조회)
+
+        Args:
+            db_type (str): 검색할 DB 타입 ('chunks', 'subtopic')
+            query (str): 검색 질의
+            k (int): 반환할 결과 수
+            meeting_ids (list, optional): 검색할 회의 ID 목록 (None이면 전체)
+            retriever_type (str, optional): 리트리버 타입 (search()와 같음)
+            embedding (list, optional): 미리 계산한 질의 임베딩 (search()와 같음)
+
+        Returns:
+            list: LangChain Document 객체 리스트
+        """
+        if meeting_ids is None:
+            return self.search(db_type=db_type, query=query, k=k, retriever_type=retriever_type, embedding=embedding)
+        if not meeting_ids:
+            return []
+
+        filters = self.meeting_filters(meeting_ids)
+        if len(filters) == 1:
+            return self.search(db_type=db_type, query=query, k=k, retriever_type=retriever_type,
+                               filter_criteria=filters[0], embedding=embedding)
+
+        # 필터가 여러 개면 필터별 상위 k개를 유사도 점수로 합쳐 전체 상위 k개 선택
+        # (순위만 반환하는 리트리버는 필터 간 비교가 불가능하므로 유사도 검색 사용)
+        logger.info(f"ℹ️ 회의 {len(meeting_ids)}개를 필터 {len(filters)}개로 나누어 검색합니다.")
+        vdb = self.vectorstores[db_type]
+        if embedding is None:
+            embedding = self.embed_query(query)
+        scored = []
+        for where in filters:
+            scored.extend(vdb.similarity_search_by_vector_with_relevance_scores(embedding, k=k, filter=where))
+        scored.sort(key=lambda item: item[1])
+        return [doc for doc, _ in scored[:k]]
+
     def get_chunks_by_meeting_id(self, meeting_id: str) -> str:
         """
         meeting_id로 청킹된 문서를 chunk_index 순서대로 가져와서 하나의 문자열로 결합합니다.
@@ -624,12 +948,15 @@ class VectorDBManager:
         if filters:
             # 특정 필터가 있는 경우
             logger.info(f"🗑️ Deleting from '{db_type}' collection with filters: {filters}")
+            deleted_ids = collection.get(where=filters, include=[])['ids']
             collection.delete(where=filters)
+            self._unindex_keywords(db_type, ids=deleted_ids)
             logger.info(f"✅ Deletion from '{db_type}' collection complete.")
         else:
             # 필터가 없는 경우, 전체 컬렉션 삭제
             logger.warning(f"⚠️ No specific filters provided. Deleting ALL items from '{db_type}' collection.")
             collection.delete(where={}) # deletes all items
+            self._unindex_keywords(db_type)
             logger.info(f"✅ All items deleted from '{db_type}' collection.")
 
     def _get_audio_file_from_vector_db(self, meeting_id):
@@ -735,6 +1062,7 @@ class VectorDBManager:
 
                 # 삭제 실행
                 chunks_collection.delete(where={"meeting_id": meeting_id})
+                self._unindex_keywords('chunks', meeting_id=meeting_id)
                 logger.info(f"[삭제 수행] meeting_chunk: {before_chunks_count}개 삭제 시도")
                 deleted_chunks_count = before_chunks_count
 
@@ -780,6 +1108,7 @@ class VectorDBManager:
 
                 # 삭제 실행
                 subtopic_collection.delete(where={"meeting_id": meeting_id})
+                self._unindex_keywords('subtopic', meeting_id=meeting_id)
                 logger.info(f"[삭제 수행] meeting_subtopic: {before_subtopic_count}개 삭제 시도")
                 deleted_subtopic_count = before_subtopic_count
 
@@ -811,7 +1140,13 @@ class VectorDBManager:
 
         audio_deleted = False
 
-        if audio_file:
+        # 동일 내용의 업로드는 파일 하나를 공유하므로, 다른 회의가 참조 중이면 삭제하지 않음
+        shared_count = self.db_manager.count_meetings_by_audio_file(audio_file) if audio_file else 0
+
+        if audio_file and shared_count > 0:
+            logger.info(f"[건너뜀] 다른 회의 {shared_count}개가 같은 미디어 파일을 참조 중: {audio_file}")
+            logger.info(f"ℹ️ 공유 중인 미디어 파일은 삭제하지 않습니다.")
+        elif audio_file:
             audio_path = os.path.join(self.upload_folder, audio_file)
 
             if os.path.exists(audio_path):